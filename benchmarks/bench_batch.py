@@ -0,0 +1,121 @@
+"""
+배치 분석 엔드포인트 벤치마크 (오프라인).
+
+LocalStorage 로 원격 저장소의 지연을 흉내내고, 한 레슨 분량의 영상 N개를
+``/pose`` N번 요청할 때와 ``/pose/batch`` 한 번 요청할 때 모든 항목이 끝날 때까지의
+시간과 처리량(videos/min)을 비교한다. ``--repeat`` 비율만큼은 같은 내용의 영상(재업로드)이다.
+두 경우 모두 빈 키포인트 캐시에서 시작한다.
+
+    $ python benchmarks/bench_batch.py --videos 12 --repeat 0 0.25 --latency 0.2
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from routers.pose import router as pose
+from routers.pose_batch import router as pose_batch
+from utils.engine import AnalysisEngine
+from utils.keypoint_cache import KeypointCache
+from utils.model_pool import init_model_pool
+from utils.result_store import MemoryResultStore
+from utils.scheduler import JobScheduler
+from utils.scratch import ScratchSpace
+from utils.storage import LocalStorage, Prefetcher
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+
+def make_lesson(videos: int, repeat: float, workdir: str) -> list[str]:
+    """
+    영상 N개 생성 (끝에 바이트를 덧붙여 내용을 다르게 하고, repeat 비율만큼은 앞 영상의 사본).
+    사본이 원본 근처에 오도록 요청 순서를 섞는다.
+    """
+    unique = max(1, round(videos * (1 - repeat)))
+    keys = []
+    for i in range(videos):
+        key = f"lesson/{i}.mp4"
+        if i < unique:
+            shutil.copy(TEST_VIDEOS[i % len(TEST_VIDEOS)], os.path.join(workdir, key))
+            with open(os.path.join(workdir, key), "ab") as file:
+                file.write(i.to_bytes(4, "little"))
+        else:
+            shutil.copy(os.path.join(workdir, keys[i % unique]), os.path.join(workdir, key))
+        keys.append(key)
+    random.Random(0).shuffle(keys)
+    return keys
+
+async def wait_done(app: FastAPI, keys: list[str]) -> None:
+    while any(app.state.task_results.get(key, {}).get("status") not in ("step_completed", "error") for key in keys):
+        await asyncio.sleep(0.05)
+
+async def run(engine: AnalysisEngine, mode: str, keys: list[str], latency: float, workdir: str) -> float:
+    """
+    mode(separate | batch) 로 모든 항목을 요청하고 끝날 때까지의 시간(초) 반환
+    """
+    storage = LocalStorage(root=workdir, latency_sec=latency)
+    await storage.start()
+    app = FastAPI()
+    app.include_router(pose)
+    app.include_router(pose_batch)
+    app.state.task_results = MemoryResultStore()
+    app.state.engine = engine
+    app.state.scratch = ScratchSpace(root=os.path.join(workdir, f"scratch_{mode}"))
+    app.state.prefetcher = Prefetcher(storage, inference_slots=engine.max_workers, scratch=app.state.scratch)
+    app.state.keypoint_cache = KeypointCache(root=os.path.join(workdir, f"cache_{mode}"))
+    app.state.scheduler = JobScheduler(max_queue=len(keys), concurrency=engine.max_workers + 2)
+    await app.state.scheduler.start()
+
+    start = time.perf_counter()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        if mode == "separate":
+            for key in keys:
+                response = await client.post("/pose", json={"url": key, "handType": "R"})
+                response.raise_for_status()
+        else:
+            response = await client.post("/pose/batch", json={"items": [{"url": key, "handType": "R"} for key in keys]})
+            response.raise_for_status()
+        await wait_done(app, keys)
+    elapsed = time.perf_counter() - start
+
+    await app.state.scheduler.close()
+    await storage.close()
+    app.state.scratch.close()
+    return elapsed
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=12)
+    parser.add_argument("--repeat", type=float, nargs="+", default=[0, 0.25], help="같은 내용 영상 비율")
+    parser.add_argument("--slots", type=int, default=1, help="엔진 슬롯 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="저장소 요청당 지연(초)")
+    args = parser.parse_args()
+
+    engine = AnalysisEngine(max_workers=args.slots, initializer=init_model_pool)
+    await engine.start()
+    report = {}
+    for repeat in args.repeat:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.makedirs(os.path.join(workdir, "lesson"))
+            keys = make_lesson(args.videos, repeat, workdir)
+            timings = {mode: await run(engine, mode, keys, args.latency, workdir) for mode in ("separate", "batch")}
+        report[f"repeat{repeat}"] = {
+            **{f"{mode}_videos_per_min": round(len(keys) / sec * 60, 1) for mode, sec in timings.items()},
+            "speedup": round(timings["separate"] / timings["batch"], 2),
+        }
+    engine.shutdown()
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,161 @@
+"""
+영상 하나의 구간 병렬 추론 벤치마크 (``CHUNKED``).
+
+test_vid/go_pro.mp4 원본과 --loops 번 이어 붙인 긴 영상에 대해, 순차 추론(``analyze_video``, 프로세스 1개)과
+구간 병렬 추론(``analyze_chunked``)을 프로세스 수 1, 2, 4, 8 로 실행해 지연 시간, 순차 대비 속도 향상,
+효율(속도 향상 / 프로세스 수)과 단계 frame 을 비교한다. 긴 영상은 세션 모드로 모든 스윙 구간을 비교한다.
+프로세스마다 모델을 미리 로딩(``AnalysisEngine.start``)한 뒤 측정하며, 물리 코어 수를 넘는 프로세스는 이득이 없다.
+
+구간별 디코딩 비용도 따로 측정한다: 구간마다 (입력 seek + trim) 디코딩만 실행해 frame 당 디코딩 시간이
+구간 위치와 무관한지(뒤 구간이 영상 앞부분을 다시 디코딩하지 않는지) 확인하고, 구간 첫 frame 이 전체 디코딩의
+같은 index frame 과 같은지 검사한다. frame 당 시간의 최대/최소 비가 --max-cost-ratio 를 넘거나
+frame 이 어긋나면 종료 코드 1.
+
+    $ python benchmarks/bench_chunked.py --processes 1 2 4 8 --loops 8
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from utils.analysis import analyze_video
+from utils.chunked import analyze_chunked, plan_chunks
+from utils.decode import expected_frames, iter_frames, probe_video
+from utils.engine import AnalysisEngine
+from utils.model_pool import init_model_pool
+
+VIDEO = "test_vid/go_pro.mp4"
+
+def loop_video(video: str, loops: int, workdir: str) -> str:
+    """
+    영상을 loops 번 이어 붙인 사본 생성 (여러 번 스윙한 긴 영상)
+    """
+    output = os.path.join(workdir, f"loop{loops}_{os.path.basename(video)}")
+    subprocess.run([
+        "ffmpeg", "-loglevel", "error", "-y", "-stream_loop", str(loops - 1), "-i", video, "-an",
+        "-c:v", "libx264", "-crf", "18", output,
+    ], check=True)
+    return output
+
+def swings(result: dict) -> list[dict]:
+    return [segment["step"] for segment in result["segments"]] if "segments" in result else [result["step"]]
+
+def max_frame_diff(expected: list[dict], actual: list[dict]) -> int | None:
+    """
+    스윙별 단계 frame 최대 차이 (스윙 수나 단계가 다르면 None)
+    """
+    if len(expected) != len(actual) or any(a.keys() != b.keys() for a, b in zip(expected, actual)):
+        return None
+    return max((abs(a[phase] - b[phase]) for a, b in zip(expected, actual) for phase in a), default=0)
+
+def chunk_decode_cost(video: str, chunks: int, fps: float | None, overlap_sec: float, min_chunk_sec: float) -> dict:
+    """
+    구간별 디코딩만 실행한 시간과 frame 수, 구간 첫 frame 의 정확성 (전체 디코딩 기준)
+    """
+    info = probe_video(video)
+    rate = fps or info["fps"] or 30.0
+    plan = plan_chunks(
+        expected_frames(info, fps), chunks,
+        overlap=int(round(overlap_sec * rate)), min_frames=int(round(min_chunk_sec * rate)),
+    )
+    # 전체 디코딩에서 구간 첫 frame 만 보관
+    firsts = {warmup_start for warmup_start, _, _ in plan}
+    reference = {index: rgb.copy() for index, rgb in enumerate(iter_frames(video, fps=fps, info=info)) if index in firsts}
+
+    rows = []
+    for warmup_start, _, end in plan:
+        first, count = None, 0
+        start = time.perf_counter()
+        for rgb in iter_frames(video, fps=fps, info=info, start_frame=warmup_start, end_frame=end):
+            if first is None:
+                first = rgb.copy()
+            count += 1
+        seconds = time.perf_counter() - start
+        rows.append({
+            "start_frame": warmup_start,
+            "frames": count,
+            "decode_sec": round(seconds, 3),
+            "ms_per_frame": round(seconds / max(count, 1) * 1000, 3),
+            "same_first_frame": first is not None and warmup_start in reference and bool((first == reference[warmup_start]).all()),
+        })
+    costs = [row["ms_per_frame"] for row in rows if row["frames"]]
+    return {"chunks": rows, "cost_ratio": round(max(costs) / max(min(costs), 1e-9), 2)}
+
+async def measure(video: str, processes: int, repeat: int, fps: float | None, chunking: dict, session: bool, with_sequential: bool) -> dict:
+    engine = AnalysisEngine(max_workers=processes, initializer=init_model_pool, initargs=({1: 1, 2: 1},))
+    await engine.start()
+    try:
+        sequential, chunked, result = [], [], None
+        for _ in range(repeat):
+            if with_sequential:
+                start = time.perf_counter()
+                result = await engine.run(analyze_video, video, "R", fps=fps, session=session)
+                sequential.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            parted = await analyze_chunked(engine, video, "R", processes, fps=fps, session=session, **chunking)
+            chunked.append(time.perf_counter() - start)
+    finally:
+        engine.shutdown()
+    return {
+        "sequential_sec": statistics.median(sequential) if sequential else None,
+        "chunked_sec": statistics.median(chunked),
+        "chunks": parted["metrics"]["chunks"],
+        "warmup_frames": parted["metrics"]["warmup_frames"],
+        "sequential_step": swings(result) if result is not None else None,
+        "chunked_step": swings(parted),
+    }
+
+async def run(args) -> dict:
+    report = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        videos = {"original": (VIDEO, False), f"loop{args.loops}": (loop_video(VIDEO, args.loops, workdir), True)}
+        for name, (video, session) in videos.items():
+            curve, baseline, expected = {}, None, None
+            for processes in args.processes:
+                # 순차 추론 기준은 첫 측정에서 한 번만 (프로세스 수와 무관)
+                row = await measure(video, processes, args.repeat, args.fps, {"overlap_sec": args.overlap_sec, "min_chunk_sec": args.min_chunk_sec}, session, baseline is None)
+                if baseline is None:
+                    baseline, expected = row["sequential_sec"], row["sequential_step"]
+                speedup = baseline / row["chunked_sec"]
+                curve[processes] = {
+                    "chunked_sec": round(row["chunked_sec"], 3),
+                    "speedup": round(speedup, 2),
+                    "efficiency": round(speedup / processes, 2),
+                    "chunks": row["chunks"],
+                    "warmup_frames": row["warmup_frames"],
+                    "same_step": row["chunked_step"] == expected,
+                    "max_frame_diff": max_frame_diff(expected, row["chunked_step"]),
+                }
+            decode = chunk_decode_cost(video, max(args.processes), args.fps, args.overlap_sec, args.min_chunk_sec)
+            report[name] = {"sequential_sec": round(baseline, 3), "swings": len(expected), "curve": curve, "decode": decode}
+    return report
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8], help="프로세스(구간) 수")
+    parser.add_argument("--loops", type=int, default=8, help="긴 영상의 반복 횟수")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--fps", type=float, default=None, help="디코딩 리샘플링 fps")
+    parser.add_argument("--overlap-sec", type=float, default=0.5, help="구간 앞 트래킹 재확립용 여유(초)")
+    parser.add_argument("--min-chunk-sec", type=float, default=0.25, help="구간 최소 길이(초), 짧은 원본 영상도 나누도록 작게")
+    parser.add_argument("--max-cost-ratio", type=float, default=2.0, help="구간별 frame 당 디코딩 시간 최대/최소 비 상한")
+    args = parser.parse_args()
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2), f"\ncpu_count: {os.cpu_count()}")
+    for name, row in report.items():
+        decode = row["decode"]
+        if decode["cost_ratio"] > args.max_cost_ratio or not all(chunk["same_first_frame"] for chunk in decode["chunks"]):
+            print(f"{name}: 구간 디코딩 비용이 구간 길이에 비례하지 않거나 구간 첫 frame 이 다릅니다", file=sys.stderr)
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+디버그 이미지 저장 벤치마크 (``/pose_local``).
+
+test_vid 영상을 저장 방식별로 ``analyze_video(debug_dir=...)`` 로 분석해
+전체 분석 시간, 추론 루프가 저장에 쓴 시간(debug_write), 종료 시 남은 저장 대기(debug_flush),
+버린 프레임 수와 저장 용량을 비교한다.
+    - none: 디버그 저장 없음
+    - legacy_png: 기존 방식 (추론 루프 안에서 프레임마다 PNG 동기 저장)
+    - png / jpg / webp: writer 스레드 비동기 저장
+    - jpg_every5: 5 프레임마다 1개만 저장
+    - step: 단계 이미지만
+    - video: 주석을 그린 MP4 하나
+
+    $ python benchmarks/bench_debug_writer.py --repeat 3
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import cv2
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import utils.analysis
+from utils.analysis import analyze_video
+from utils.debug_writer import DebugWriter, render
+from utils.model_pool import PoseModelPool
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+MODES = {
+    "none": None,
+    "legacy_png": {},
+    "png": {"format": "png"},
+    "jpg": {"format": "jpg", "quality": 90},
+    "webp": {"format": "webp", "quality": 80},
+    "jpg_every5": {"format": "jpg", "every": 5},
+    "step": {"mode": "step"},
+    "video": {"video": True},
+}
+
+class LegacyWriter(DebugWriter):
+    """
+    기존 방식: 추론 루프 안에서 변환/그리기/PNG 저장 (writer 스레드 없음)
+    """
+
+    def __init__(self, debug_dir, **kwargs):
+        super().__init__(debug_dir, format="png", workers=0)
+
+    def frame(self, index, rgb, points, box):
+        cv2.imwrite(os.path.join(self.frame_dir, f"{index}.png"), render(rgb, points, box[:2]))
+        self.written += 1
+
+    def step(self, name, rgb, points, box):
+        cv2.imwrite(os.path.join(self.step_dir, f"{name}.png"), render(rgb, points, box[:2]))
+
+def directory_bytes(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+def run(video: str, options: dict | None, legacy: bool, pool: PoseModelPool) -> dict:
+    with tempfile.TemporaryDirectory() as debug_dir:
+        utils.analysis.DebugWriter = LegacyWriter if legacy else DebugWriter
+        start = time.perf_counter()
+        result = analyze_video(
+            video, "R", model_pool=pool,
+            debug_dir=debug_dir if options is not None else None, debug=options,
+        )
+        seconds = time.perf_counter() - start
+        utils.analysis.DebugWriter = DebugWriter
+        metrics = result["metrics"]
+        return {
+            "sec": seconds,
+            "debug_write": metrics["stages"].get("debug_write", 0.0),
+            "debug_flush": metrics["stages"].get("debug_flush", 0.0),
+            "written": metrics.get("debug_written", 0),
+            "dropped": metrics.get("debug_dropped", 0),
+            "bytes": directory_bytes(debug_dir),
+            "step": result["step"],
+        }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    pool = PoseModelPool({1: 1, 2: 1})
+    report = {}
+    for video in TEST_VIDEOS:
+        clip, reference = {}, None
+        for name, options in MODES.items():
+            runs = [run(video, options, name == "legacy_png", pool) for _ in range(args.repeat)]
+            clip[name] = {
+                "sec": round(statistics.median(r["sec"] for r in runs), 3),
+                "debug_write_sec": round(statistics.median(r["debug_write"] for r in runs), 4),
+                "debug_flush_sec": round(statistics.median(r["debug_flush"] for r in runs), 4),
+                "written": runs[-1]["written"],
+                "dropped": runs[-1]["dropped"],
+                "mb": round(runs[-1]["bytes"] / 2**20, 2),
+                # 디버그 저장 없음(none) 결과와 단계 프레임 비교
+                "same_step": all(r["step"] == (reference or r["step"]) for r in runs),
+            }
+            reference = reference or runs[0]["step"]
+        report[os.path.basename(video)] = clip
+    pool.close()
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+디코딩 선행 읽기(``FrameRing``) 벤치마크.
+
+test_vid 영상(원본과 --height 로 확대한 16:9 영상)을 ring buffer 슬롯 수별로 비교한다.
+    - decode_fps: 추론 없이 프레임만 읽을 때의 처리량
+    - sec: ``analyze_video`` 전체 시간
+    - decode_wait_ms: 추론 루프가 다음 프레임을 기다린 프레임당 시간 (``metrics.stages.decode``)
+prefetch 0 은 기존 방식 (추론 루프에서 파이프를 직접 읽고 프레임마다 새 배열 생성).
+
+    $ python benchmarks/bench_decode_prefetch.py --prefetch 0 2 4 8 --height 1080
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from functools import partial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import utils.analysis
+from benchmarks.bench_roi import widen_video
+from utils.analysis import analyze_video
+from utils.decode import iter_frames
+from utils.model_pool import PoseModelPool
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+
+def decode_fps(video: str, prefetch: int) -> float:
+    start = time.perf_counter()
+    count = sum(1 for _ in iter_frames(video, prefetch=prefetch))
+    return count / (time.perf_counter() - start)
+
+def analyze(video: str, prefetch: int, pool: PoseModelPool) -> dict:
+    utils.analysis.iter_frames = partial(iter_frames, prefetch=prefetch)
+    try:
+        start = time.perf_counter()
+        result = analyze_video(video, "R", model_pool=pool)
+        seconds = time.perf_counter() - start
+    finally:
+        utils.analysis.iter_frames = iter_frames
+    metrics = result["metrics"]
+    return {"sec": seconds, "decode_wait": metrics["stages"]["decode"] / max(metrics["frames"], 1), "step": result["step"]}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--prefetch", type=int, nargs="+", default=[0, 2, 4, 8], help="ring buffer 슬롯 수 (0: 기존 방식)")
+    parser.add_argument("--height", type=int, nargs="*", default=[1080], help="확대 영상 높이 (원본은 항상 포함)")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    pool = PoseModelPool({1: 1, 2: 1})
+    report = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        videos = [(video, video) for video in TEST_VIDEOS]
+        videos += [(f"{height}p_{os.path.basename(video)}", widen_video(video, height, workdir)) for height in args.height for video in TEST_VIDEOS]
+        for name, video in videos:
+            clip, reference = {}, None
+            for prefetch in args.prefetch:
+                fps = [decode_fps(video, prefetch) for _ in range(args.repeat)]
+                runs = [analyze(video, prefetch, pool) for _ in range(args.repeat)]
+                reference = reference or runs[0]["step"]
+                clip[prefetch] = {
+                    "decode_fps": round(statistics.median(fps), 1),
+                    "sec": round(statistics.median(r["sec"] for r in runs), 3),
+                    "decode_wait_ms": round(statistics.median(r["decode_wait"] for r in runs) * 1000, 3),
+                    # 첫 번째 prefetch 설정 결과와 단계 프레임 비교
+                    "same_step": all(r["step"] == reference for r in runs),
+                }
+            report[name] = clip
+    pool.close()
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+키포인트 캐시 벤치마크 (오프라인).
+
+LocalStorage 로 원격 저장소를 흉내내고 ``/pose`` 의 백그라운드 작업(mp_background)을
+같은 영상에 대해 두 번 실행하여, 첫 요청(miss: 다운로드 + 추론)과 재요청(hit: 단계 검출만)의
+지연과 결과 동등성을 비교한다. 단계가 다르면 종료 코드 1.
+
+    $ python benchmarks/bench_keypoint_cache.py --latency 0.5 --bandwidth 1
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from routers.pose import mp_background
+from utils.engine import AnalysisEngine
+from utils.keypoint_cache import KeypointCache
+from utils.model_pool import init_model_pool
+from utils.result_store import MemoryResultStore
+from utils.scratch import ScratchSpace
+from utils.storage import LocalStorage, Prefetcher
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.5, help="요청당 지연(초)")
+    parser.add_argument("--bandwidth", type=float, default=1.0, help="다운로드 대역폭(MB/s)")
+    args = parser.parse_args()
+
+    engine = AnalysisEngine(max_workers=1, initializer=init_model_pool)
+    await engine.start()
+    storage = LocalStorage(root=ROOT, latency_sec=args.latency, bandwidth_mbps=args.bandwidth)
+    await storage.start()
+    task_results = MemoryResultStore()
+
+    report, mismatch = {}, False
+    with tempfile.TemporaryDirectory() as workdir:
+        prefetcher = Prefetcher(storage, inference_slots=engine.max_workers, scratch=ScratchSpace(root=os.path.join(workdir, "scratch")))
+        keypoint_cache = KeypointCache(root=os.path.join(workdir, "cache"))
+        for video in TEST_VIDEOS:
+            for hand_type in ("R", "L"):
+                timings, results = {}, {}
+                for run in ("miss", "hit"):
+                    start = time.perf_counter()
+                    results[run] = await mp_background(
+                        f"{video}:{hand_type}", video, hand_type,
+                        task_results, engine, prefetcher, keypoint_cache,
+                    )
+                    timings[f"{run}_sec"] = round(time.perf_counter() - start, 3)
+                # metrics(단계별 소요 시간)는 실행마다 다르므로 제외
+                same = {k: v for k, v in results["miss"].items() if k != "metrics"} == {
+                    k: v for k, v in results["hit"].items() if k != "metrics"
+                }
+                mismatch |= not same
+                report[f"{video}:{hand_type}"] = {**timings, "same_result": same}
+        report["cache"] = keypoint_cache.stats()
+
+    await storage.close()
+    engine.shutdown()
+    print(json.dumps(report, indent=2))
+    sys.exit(1 if mismatch else 0)
+
+if __name__ == "__main__":
+    asyncio.run(main())
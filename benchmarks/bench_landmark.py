@@ -0,0 +1,79 @@
+"""
+랜드마크 저장 방식 벤치마크: 기존 dict-of-lists(joint 별 float append) 대비
+LandmarkBuffer((frames, joints, 4) float32) 의 프레임당 Python 오버헤드와 최대 메모리를 비교한다.
+Mediapipe 결과는 합성 객체로 대체하여 추론 시간은 제외한다.
+
+    $ python benchmarks/bench_landmark.py --frames 20000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from utils.landmark import LandmarkBuffer, extract_landmarks, KEY_POINT_STRING, STRING_MATCH_INDEX
+
+WIDTH, HEIGHT = 1920, 1080
+
+def fake_results() -> SimpleNamespace:
+    """
+    Mediapipe Pose 결과와 같은 구조의 합성 객체 (33 landmarks)
+    """
+    points = [SimpleNamespace(x=random.random(), y=random.random(), z=random.random()) for _ in range(33)]
+    return SimpleNamespace(
+        pose_landmarks=SimpleNamespace(landmark=points),
+        pose_world_landmarks=SimpleNamespace(landmark=points),
+    )
+
+def run_dict(results_list: list, frames: int) -> None:
+    PoseLandMark = {joint: {"x": [], "y": [], "z_norm": [], "x_norm": []} for joint in KEY_POINT_STRING}
+    for frame in range(frames):
+        results = results_list[frame % len(results_list)]
+        for joint, index in zip(KEY_POINT_STRING, STRING_MATCH_INDEX):
+            landmark = results.pose_landmarks.landmark[index]
+            world_landmark = results.pose_world_landmarks.landmark[index]
+            PoseLandMark[joint]["x"].append(landmark.x * WIDTH)
+            PoseLandMark[joint]["y"].append(landmark.y * HEIGHT)
+            PoseLandMark[joint]["z_norm"].append(world_landmark.z)
+            PoseLandMark[joint]["x_norm"].append(world_landmark.x)
+        current_landmark = {
+            joint: {"x": PoseLandMark[joint]["x"][-1], "y": PoseLandMark[joint]["y"][-1]}
+            for joint in KEY_POINT_STRING
+        }
+
+def run_buffer(results_list: list, frames: int) -> None:
+    PoseLandMark = LandmarkBuffer(frames)
+    for frame in range(frames):
+        results = results_list[frame % len(results_list)]
+        current_landmark = PoseLandMark.append(extract_landmarks(results, WIDTH, HEIGHT))
+
+def measure(fn, results_list: list, frames: int) -> dict[str, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(results_list, frames)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"us_per_frame": round(elapsed / frames * 1e6, 2), "peak_mb": round(peak / 1024 / 1024, 2)}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+
+    results_list = [fake_results() for _ in range(64)]
+    print(json.dumps({
+        "frames": args.frames,
+        "dict_of_lists": measure(run_dict, results_list, args.frames),
+        "landmark_buffer": measure(run_buffer, results_list, args.frames),
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Pose 모델 풀 벤치마크: 요청마다 모델을 생성(cold)하는 경우와 풀을 재사용(pooled)하는 경우의
+요청당 처리 시간을 test_vid 영상별로 비교한다.
+
+    $ python benchmarks/bench_model_pool.py --repeat 3
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from utils.analysis import analyze_video
+from utils.model_pool import PoseModelPool, DEFAULT_POOL_SIZES
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="영상별 반복 횟수")
+    args = parser.parse_args()
+
+    pool = PoseModelPool(DEFAULT_POOL_SIZES)
+    report = {}
+    for video in TEST_VIDEOS:
+        cold, pooled = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            cold_pool = PoseModelPool(DEFAULT_POOL_SIZES)
+            cold_result = analyze_video(video, "R", model_pool=cold_pool)
+            cold_pool.close()
+            cold.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            pooled_result = analyze_video(video, "R", model_pool=pool)
+            pooled.append(time.perf_counter() - start)
+
+        report[video] = {
+            "cold_sec": round(statistics.median(cold), 3),
+            "pooled_sec": round(statistics.median(pooled), 3),
+            "same_step": cold_result.get("step") == pooled_result.get("step"),
+        }
+    pool.close()
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+스윙 단계 검출 벤치마크 + 동등성 검사.
+
+1. test_vid 영상의 랜드마크를 추출한 뒤, 기존 ``match detect_flow`` 상태 머신(슬라이스 min/max, O(n²))과
+   ``PhaseDetector``(O(1)/frame) 가 같은 단계 프레임을 내는지 확인한다. 다르면 종료 코드 1.
+   배열 연산 일괄 검출 ``detect_phases`` 도 같은 결과인지 확인한다.
+2. 랜드마크를 시간축으로 보간해 고fps/긴 영상을 만들어 세 방식의 검출 시간을 비교한다.
+3. 저장된 스윙 N개를 ``detect_phases_batch`` 로 재검출하는 처리량을 측정한다.
+
+    $ python benchmarks/bench_phase.py --upsample 1 10 50 --swings 1000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from utils.analysis import analyze_video
+from utils.detect import is_address, is_take_away, is_half, is_top, is_down_half, is_impact, is_follow_through, is_finish
+from utils.phase import PhaseDetector, detect_phases, detect_phases_batch
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+
+def reference_steps(landmarks: np.ndarray) -> dict[str, int]:
+    """
+    기존 상태 머신 (프레임마다 누적 배열 전체를 슬라이스)
+    """
+    detect_flow = "address"
+    step = {}
+    for frame in range(len(landmarks)):
+        PoseLandMark = landmarks[:frame + 1]
+        current_landmark = landmarks[frame]
+        match detect_flow :
+            case "address":
+                if frame>=3 :
+                    if is_address(current_landmark, PoseLandMark):
+                        step["address"] = frame
+                        detect_flow = "take_away"
+            case "take_away" :
+                if is_take_away(current_landmark) :
+                    step["take_away"] = frame
+                    detect_flow = "half"
+            case "half" :
+                if is_half(current_landmark) :
+                    step["half"] = frame
+                    detect_flow = "top"
+            case "top" :
+                if is_top(current_landmark, PoseLandMark, step["half"]) :
+                    step["top"] = frame
+                else :
+                    detect_flow = "donw_half"
+            case "donw_half" :
+                if is_down_half(current_landmark) :
+                    step["down_half"] = frame
+                    detect_flow = "impact"
+            case "impact" :
+                if is_impact(current_landmark, PoseLandMark, step["down_half"]) :
+                    step["impact"] = frame
+                else :
+                    detect_flow = "follow_through"
+            case "follow_through" :
+                if is_follow_through(current_landmark) :
+                    step["follow_through"] = frame
+                    detect_flow = "finish_top"
+            case "finish_top" :
+                if is_top(current_landmark, PoseLandMark, step["follow_through"]) :
+                    step["finish_top"] = frame
+                else :
+                    detect_flow = "finish"
+            case "finish" :
+                if is_finish(current_landmark, PoseLandMark, step["finish_top"]) :
+                    step["finish"] = frame
+                    return step
+        if detect_flow != "address":
+            if is_address(current_landmark, PoseLandMark):
+                step = {"address": frame}
+                detect_flow = "take_away"
+    return step
+
+def streaming_steps(landmarks: np.ndarray) -> dict[str, int]:
+    """
+    PhaseDetector (프레임당 O(1))
+    """
+    detector = PhaseDetector()
+    for current_landmark in landmarks:
+        detector.update(current_landmark)
+        if detector.finished:
+            break
+    return detector.step
+
+def upsample(landmarks: np.ndarray, factor: int) -> np.ndarray:
+    """
+    시간축 선형 보간으로 프레임 수를 factor 배로 늘림 (고fps 영상 모사)
+    """
+    frames = len(landmarks)
+    source = np.arange(frames)
+    target = np.linspace(0, frames - 1, frames * factor)
+    flat = landmarks.reshape(frames, -1)
+    return np.stack([np.interp(target, source, flat[:, c]) for c in range(flat.shape[1])], axis=1) \
+        .astype(np.float32).reshape(len(target), *landmarks.shape[1:])
+
+def timed(fn, landmarks: np.ndarray) -> tuple[dict, float]:
+    start = time.perf_counter()
+    step = fn(landmarks)
+    return step, (time.perf_counter() - start) * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--upsample", type=int, nargs="+", default=[1, 10, 50], help="시간축 확대 배수")
+    parser.add_argument("--swings", type=int, default=1000, help="일괄 재검출 처리량 측정용 스윙 수")
+    args = parser.parse_args()
+
+    report, mismatch, stored = {}, False, []
+    for video in TEST_VIDEOS:
+        for hand_type in ("R", "L"):
+            result = analyze_video(video, hand_type, return_landmarks=True)
+            landmarks = result["landmarks"]
+            stored.append(landmarks)
+            key = f"{video}:{hand_type}"
+            report[key] = {"frames": len(landmarks), "step": result["step"]}
+            for factor in args.upsample:
+                data = upsample(landmarks, factor) if factor > 1 else landmarks
+                reference, reference_ms = timed(reference_steps, data)
+                streaming, streaming_ms = timed(streaming_steps, data)
+                vectorized, vectorized_ms = timed(detect_phases, data)
+                same = reference == streaming == vectorized and (factor > 1 or streaming == result["step"])
+                mismatch |= not same
+                report[key][f"x{factor}"] = {
+                    "frames": len(data),
+                    "reference_ms": round(reference_ms, 2),
+                    "streaming_ms": round(streaming_ms, 2),
+                    "vectorized_ms": round(vectorized_ms, 2),
+                    "same_step": same,
+                }
+
+    swings = {str(i): stored[i % len(stored)] for i in range(args.swings)}
+    start = time.perf_counter()
+    detect_phases_batch(swings)
+    report["batch"] = {"swings": args.swings, "sec": round(time.perf_counter() - start, 3)}
+
+    print(json.dumps(report, indent=2))
+    sys.exit(1 if mismatch else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+사람 영역(ROI) 추론 벤치마크.
+
+test_vid 영상을 지정 높이로 확대하고 좌우를 채워 16:9 고해상도(1080p/4K) 영상을 만든 뒤,
+전체 프레임 추론과 ROI 추론(``roi``)의 프레임당 시간, 단계별 프레임 차이, 랜드마크 픽셀 오차를 비교한다.
+
+    $ python benchmarks/bench_roi.py --height 1080 2160 --padding 0.5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from utils.analysis import analyze_video
+from utils.model_pool import PoseModelPool
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+
+def widen_video(video: str, height: int, workdir: str) -> str:
+    """
+    높이 height 로 확대 후 좌우를 채워 16:9 영상 생성
+    """
+    width = height * 16 // 9
+    output = os.path.join(workdir, f"{height}p_{os.path.basename(video)}")
+    subprocess.run([
+        "ffmpeg", "-loglevel", "error", "-y", "-i", video, "-an",
+        "-vf", f"scale=-2:{height},pad={width}:{height}:(ow-iw)/2:0:gray",
+        "-c:v", "libx264", "-crf", "18", output,
+    ], check=True)
+    return output
+
+def timed(**kwargs) -> tuple[dict, float]:
+    start = time.perf_counter()
+    result = analyze_video(**kwargs, return_landmarks=True)
+    return result, time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--height", type=int, nargs="+", default=[1080, 2160])
+    parser.add_argument("--padding", type=float, default=0.5)
+    parser.add_argument("--probe-frames", type=int, default=5, help="영역 탐색 프레임 수")
+    args = parser.parse_args()
+
+    roi = {"padding": args.padding, "probe_frames": args.probe_frames}
+    model_pool = PoseModelPool({1: 1, 2: 1})
+    report = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for height in args.height:
+            for video in TEST_VIDEOS:
+                path = widen_video(video, height, workdir)
+                for hand_type in ("R", "L"):
+                    options = {"user_video_name": path, "hand_type": hand_type, "model_pool": model_pool}
+                    full, full_sec = timed(**options)
+                    cropped, roi_sec = timed(**options, roi=roi)
+                    if full["status"] != "step_completed" or cropped["status"] != "step_completed":
+                        report[f"{video}:{hand_type}:{height}p"] = {"full": full, "roi": cropped}
+                        continue
+
+                    frames = min(len(full["landmarks"]), len(cropped["landmarks"]))
+                    pixel_error = np.linalg.norm(
+                        full["landmarks"][:frames, :, :2] - cropped["landmarks"][:frames, :, :2], axis=-1,
+                    )
+                    step_error = {
+                        phase: cropped["step"].get(phase, None) if phase not in cropped["step"]
+                        else cropped["step"][phase] - frame
+                        for phase, frame in full["step"].items()
+                    }
+                    report[f"{video}:{hand_type}:{height}p"] = {
+                        "full_ms_per_frame": round(full_sec / len(full["landmarks"]) * 1000, 1),
+                        "roi_ms_per_frame": round(roi_sec / len(cropped["landmarks"]) * 1000, 1),
+                        "speedup": round(full_sec / roi_sec * len(cropped["landmarks"]) / len(full["landmarks"]), 2),
+                        "median_pixel_error": round(float(np.median(pixel_error)), 1),
+                        "step_error": step_error,
+                        "extra_phases": sorted(set(cropped["step"]) - set(full["step"])),
+                    }
+    model_pool.close()
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+분석 중 `/` 응답 지연 벤치마크.
+
+uvicorn 워커 1개를 띄우고 test_vid 영상 N개를 /pose_local 로 제출한 뒤,
+분석이 끝날 때까지 `/` 지연시간을 샘플링하여 유휴 상태와 비교한다.
+
+    $ python benchmarks/bench_root_latency.py --videos 6
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+
+def request(base_url: str, path: str, body: dict | None = None, timeout: float = 30.0) -> tuple[float, dict]:
+    """
+    HTTP 요청 후 (지연시간 ms, 응답 JSON) 반환
+    """
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(base_url + path, data=data, headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=timeout) as res:
+        payload = json.loads(res.read())
+    return (time.perf_counter() - start) * 1000, payload
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """
+    지연시간 샘플 요약 (ms)
+    """
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50": round(statistics.median(ordered), 2),
+        "p99": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2),
+        "max": round(ordered[-1], 2),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=6, help="동시에 제출할 영상 수")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--interval", type=float, default=0.05, help="`/` 샘플링 간격(초)")
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(args.port), "--workers", "1", "--log-level", "warning"],
+        cwd=ROOT,
+    )
+    workdir = tempfile.mkdtemp(prefix=".bench_root_", dir=ROOT)
+    try:
+        # 서버 기동 대기
+        for _ in range(300):
+            try:
+                request(base_url, "/", timeout=1.0)
+                break
+            except OSError:
+                time.sleep(0.1)
+
+        idle = []
+        for _ in range(50):
+            idle.append(request(base_url, "/")[0])
+            time.sleep(args.interval)
+
+        # task_id 충돌을 피하기 위해 영상마다 고유 경로로 복사
+        task_ids = []
+        for i in range(args.videos):
+            src = os.path.join(ROOT, TEST_VIDEOS[i % len(TEST_VIDEOS)])
+            dst = os.path.relpath(os.path.join(workdir, f"{i}_{os.path.basename(src)}"), ROOT)
+            shutil.copy(src, os.path.join(ROOT, dst))
+            request(base_url, "/pose_local", {"url": dst, "handType": "R"})
+            task_ids.append(dst)
+
+        loaded = []
+        start = time.perf_counter()
+        while True:
+            loaded.append(request(base_url, "/")[0])
+            _, results = request(base_url, "/pose_check")
+            if all(results.get(task_id, {}).get("status") != "processing" for task_id in task_ids):
+                break
+            time.sleep(args.interval)
+        elapsed = time.perf_counter() - start
+
+        print(json.dumps({
+            "videos": args.videos,
+            "processing_sec": round(elapsed, 2),
+            "idle_ms": summarize(idle),
+            "loaded_ms": summarize(loaded),
+        }, indent=2))
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+        shutil.rmtree(os.path.join(ROOT, "images", os.path.basename(workdir)), ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+작업 스케줄러 부하 테스트 (오프라인, 합성 작업).
+
+처리 용량(concurrency / service)보다 높은 비율로 작업을 열린 루프(포아송 도착)로 제출하고,
+대기열 상한이 있는 스케줄러(초과 시 429)와 사실상 무제한 대기열의 완료 지연(p50/p99/max)을 비교한다.
+상한이 있으면 수락된 작업의 지연이 (max_queue / concurrency + 1) * service 근처에서 멈추고,
+무제한이면 부하 시간에 비례해 계속 늘어난다.
+
+    $ python benchmarks/bench_scheduler.py --load 1.5 --duration 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.scheduler import JobScheduler, QueueFull
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """
+    지연시간 샘플 요약 (초)
+    """
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50": round(statistics.median(ordered), 3),
+        "p99": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+        "max": round(ordered[-1], 3),
+    }
+
+async def run(max_queue: int, concurrency: int, service: float, load: float, duration: float, seed: int) -> dict:
+    scheduler = JobScheduler(max_queue=max_queue, concurrency=concurrency, initial_duration_sec=service)
+    await scheduler.start()
+    rng = random.Random(seed)
+    latencies, retry_after = [], []
+
+    async def job(submitted: float) -> None:
+        await asyncio.sleep(rng.expovariate(1 / service))
+        latencies.append(time.perf_counter() - submitted)
+
+    rate = load * concurrency / service
+    end = time.perf_counter() + duration
+    i = 0
+    while time.perf_counter() < end:
+        await asyncio.sleep(rng.expovariate(rate))
+        try:
+            await scheduler.submit(str(i), job, time.perf_counter())
+        except QueueFull as e:
+            retry_after.append(e.retry_after)
+        i += 1
+
+    # 남은 작업 완료 대기
+    while scheduler.queued or scheduler.running:
+        await asyncio.sleep(service)
+    await scheduler.close()
+    return {
+        "submitted": i,
+        "accepted": len(latencies),
+        "rejected": len(retry_after),
+        "latency_sec": summarize(latencies),
+        "retry_after_sec": sorted(set(retry_after)),
+    }
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--max-queue", type=int, default=32)
+    parser.add_argument("--service", type=float, default=0.1, help="작업당 평균 처리 시간(초)")
+    parser.add_argument("--load", type=float, default=1.5, help="처리 용량 대비 도착률")
+    parser.add_argument("--duration", type=float, default=20.0, help="부하 시간(초)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    options = {"concurrency": args.concurrency, "service": args.service, "load": args.load, "duration": args.duration, "seed": args.seed}
+    print(json.dumps({
+        "bound_sec": round((args.max_queue / args.concurrency + 1) * args.service, 3),
+        "bounded": await run(args.max_queue, **options),
+        "unbounded": await run(10 ** 9, **options),
+    }, indent=2))
+
+if __name__ == "__main__":
+    asyncio.run(main())
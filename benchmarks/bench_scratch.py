@@ -0,0 +1,136 @@
+"""
+다운로드 임시 공간(``ScratchSpace``) 벤치마크 (LocalStorage).
+
+test_vid 영상 N개(같은 키를 동시에 요청하는 항목 포함)를 프리페치 + 엔진 분석으로 동시에 처리하며 저장 방식별로
+전체 시간, 임시 폴더 최대 사용량(10ms 간격 샘플링), 작업 후 남은 파일 크기, 단계 frame 불일치/오류 수를 비교한다.
+    - legacy: 기존 방식 (키의 "/" 를 "_" 로 바꾼 고정 파일 이름, 삭제하지 않음)
+    - scratch: 작업별 폴더, 작업 종료 시 삭제 (상한 없음)
+    - quota: scratch + 공유 상한 (--quota-videos 개 분량, 초과 다운로드는 대기)
+    - memory: scratch + 작은 영상은 /dev/shm (tmpfs)
+
+    $ python benchmarks/bench_scratch.py --videos 12 --slots 2
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from utils.analysis import analyze_video
+from utils.engine import AnalysisEngine
+from utils.model_pool import init_model_pool
+from utils.scratch import ScratchSpace
+from utils.storage import LocalStorage, Prefetcher
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+MEMORY_DIR = "/dev/shm"
+
+class LegacyPrefetcher(Prefetcher):
+    """
+    기존 방식: 키에서 만든 고정 파일 이름으로 다운로드하고 삭제하지 않음
+    """
+
+    def __init__(self, storage, inference_slots, depth, root):
+        super().__init__(storage, inference_slots, depth, scratch=ScratchSpace(root=root))
+        self.root = root
+
+    @asynccontextmanager
+    async def fetch(self, key):
+        filename = os.path.join(self.root, key.replace("/", "_"))
+        async with self._slots:
+            await self.storage.download(key, filename)
+            yield filename
+
+def directory_bytes(*paths: str) -> int:
+    total = 0
+    for path in paths:
+        for root, _, names in os.walk(path):
+            for name in names:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except FileNotFoundError:
+                    pass
+    return total
+
+async def run(mode: str, args, engine: AnalysisEngine, storage: LocalStorage, expected: dict, workdir: str) -> dict:
+    root = os.path.join(workdir, mode)
+    memory_root = os.path.join(MEMORY_DIR, "pose-scratch")
+    largest = max(os.path.getsize(video) for video in TEST_VIDEOS)
+    if mode == "legacy":
+        os.makedirs(root)
+        prefetcher = LegacyPrefetcher(storage, engine.max_workers, args.depth, root)
+    else:
+        scratch = ScratchSpace(
+            root=root,
+            quota_bytes=largest * args.quota_videos if mode == "quota" else None,
+            memory_dir=MEMORY_DIR if mode == "memory" else None,
+        )
+        prefetcher = Prefetcher(storage, inference_slots=engine.max_workers, depth=args.depth, scratch=scratch)
+
+    peak, done = 0, asyncio.Event()
+
+    async def sample() -> None:
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, await asyncio.to_thread(directory_bytes, root, memory_root))
+            await asyncio.sleep(0.01)
+
+    async def job(i: int) -> dict | Exception:
+        # 앞의 두 항목은 같은 키를 동시에 요청
+        key = TEST_VIDEOS[max(i - 1, 0) % len(TEST_VIDEOS)]
+        try:
+            async with prefetcher.fetch(key) as filename:
+                result = await engine.run(analyze_video, filename, "R")
+            return result["step"] == expected[key]
+        except Exception as e:
+            return e
+
+    sampler = asyncio.create_task(sample())
+    start = time.perf_counter()
+    results = await asyncio.gather(*(job(i) for i in range(args.videos)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await sampler
+    report = {
+        "sec": round(elapsed, 3),
+        "peak_mb": round(peak / 2**20, 2),
+        "leftover_mb": round(directory_bytes(root, memory_root) / 2**20, 2),
+        "mismatch": sum(result is False for result in results),
+        "errors": sum(isinstance(result, Exception) for result in results),
+    }
+    if mode != "legacy":
+        report["waited"] = scratch.stats()["waited_total"]
+        scratch.close()
+    return report
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=12)
+    parser.add_argument("--slots", type=int, default=2, help="엔진 슬롯 수")
+    parser.add_argument("--depth", type=int, default=8, help="프리페치 depth (크게 하면 임시 공간 사용량이 늘어남)")
+    parser.add_argument("--quota-videos", type=int, default=3, help="quota 모드 상한 (가장 큰 영상 N개 분량)")
+    parser.add_argument("--bandwidth", type=float, default=20.0, help="다운로드 대역폭(MB/s)")
+    args = parser.parse_args()
+
+    engine = AnalysisEngine(max_workers=args.slots, initializer=init_model_pool)
+    await engine.start()
+    storage = LocalStorage(root=ROOT, bandwidth_mbps=args.bandwidth)
+    await storage.start()
+    expected = {video: (await engine.run(analyze_video, video, "R"))["step"] for video in TEST_VIDEOS}
+    report = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for mode in ("legacy", "scratch", "quota", "memory"):
+            report[mode] = await run(mode, args, engine, storage, expected, workdir)
+    await storage.close()
+    engine.shutdown()
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    asyncio.run(main())
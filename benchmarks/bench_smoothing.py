@@ -0,0 +1,125 @@
+"""
+랜드마크 보정(smoothing) 벤치마크 + 동등성 검사.
+
+1. test_vid 영상을 ``online_smoothing`` scalar / vectorized 로 각각 분석해 랜드마크와 단계 프레임이
+   완전히 같은지 확인한다. 다르면 종료 코드 1.
+2. 저장된 랜드마크를 시간축으로 보간해 긴 스윙을 만들고, 프레임별 보정 루프의 프레임당 시간을 비교한다
+   (기존: 관절/축마다 ``adaptive_ema`` 호출, 신규: ``adaptive_ema_vector`` 한 번).
+3. 오프라인 평활(one_euro / ema, 순방향+역방향) 의 소요 시간, 떨림(x/y 2차 차분 평균) 감소율,
+   단계 프레임 차이를 보고한다.
+
+    $ python benchmarks/bench_smoothing.py --upsample 1 10
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from utils.analysis import analyze_video
+from utils.data_process import adaptive_ema
+from utils.phase import detect_phases
+from utils.smoothing import adaptive_ema_vector, smooth_offline
+from benchmarks.bench_phase import upsample
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+OFFLINE = {"one_euro": {"min_cutoff": 1.5, "beta": 0.01, "d_cutoff": 1.0}, "ema": {"alpha": 0.5}}
+
+def scalar_loop(landmarks: np.ndarray) -> np.ndarray:
+    """
+    기존 방식: 프레임마다 관절/축별 ``adaptive_ema`` 호출
+    """
+    data = landmarks.copy()
+    for frame in range(1, len(data)):
+        prev_xy = data[frame - 1, :, :2].tolist()
+        current_xy = data[frame, :, :2].tolist()
+        data[frame, :, :2] = [
+            (
+                adaptive_ema(prev_x, current_x, abs(current_x - prev_x)),
+                adaptive_ema(prev_y, current_y, abs(current_y - prev_y)),
+            )
+            for (prev_x, prev_y), (current_x, current_y) in zip(prev_xy, current_xy)
+        ]
+    return data
+
+def vectorized_loop(landmarks: np.ndarray) -> np.ndarray:
+    """
+    신규 방식: 프레임마다 전체 관절/축을 배열 연산 한 번으로 보정
+    """
+    data = landmarks.copy()
+    for frame in range(1, len(data)):
+        data[frame, :, :2] = adaptive_ema_vector(data[frame - 1, :, :2], data[frame, :, :2])
+    return data
+
+def jitter(landmarks: np.ndarray) -> float:
+    """
+    x/y 좌표 2차 차분(가속도) 절대값 평균 (픽셀)
+    """
+    if len(landmarks) < 3:
+        return 0.0
+    return float(np.abs(np.diff(landmarks[:, :, :2], n=2, axis=0)).mean())
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--upsample", type=int, nargs="+", default=[1, 10], help="시간축 확대 배수")
+    args = parser.parse_args()
+
+    report, mismatch = {}, False
+    for video in TEST_VIDEOS:
+        for hand_type in ("R", "L"):
+            results = {
+                method: analyze_video(video, hand_type, return_landmarks=True, online_smoothing=method)
+                for method in ("scalar", "vectorized")
+            }
+            landmarks = results["vectorized"]["landmarks"]
+            same = results["scalar"]["step"] == results["vectorized"]["step"] \
+                and np.array_equal(results["scalar"]["landmarks"], landmarks)
+            mismatch |= not same
+            entry = {"frames": len(landmarks), "step": results["vectorized"]["step"], "same_online": same}
+
+            for factor in args.upsample:
+                data = upsample(landmarks, factor) if factor > 1 else landmarks
+                scalar, scalar_ms = timed(scalar_loop, data)
+                vectorized, vectorized_ms = timed(vectorized_loop, data)
+                loop_same = np.array_equal(scalar, vectorized)
+                mismatch |= not loop_same
+                entry[f"online_x{factor}"] = {
+                    "frames": len(data),
+                    "scalar_us_per_frame": round(scalar_ms * 1000 / len(data), 2),
+                    "vectorized_us_per_frame": round(vectorized_ms * 1000 / len(data), 2),
+                    "speedup": round(scalar_ms / vectorized_ms, 2),
+                    "same": loop_same,
+                }
+
+            fps = 30.0
+            entry["offline"] = {"jitter": round(jitter(landmarks), 3)}
+            for method, params in OFFLINE.items():
+                smoothed, ms = timed(smooth_offline, landmarks, fps, method=method, **params)
+                step = detect_phases(smoothed)
+                entry["offline"][method] = {
+                    "ms": round(ms, 2),
+                    "jitter": round(jitter(smoothed), 3),
+                    # 단계별 프레임 차이 (한쪽에서만 검출되면 None)
+                    "step_diff": {
+                        name: step[name] - entry["step"][name] if name in step and name in entry["step"] else None
+                        for name in sorted(set(step) | set(entry["step"]))
+                    },
+                }
+            report[f"{video}:{hand_type}"] = entry
+
+    print(json.dumps(report, indent=2))
+    sys.exit(1 if mismatch else 0)
+
+if __name__ == "__main__":
+    main()
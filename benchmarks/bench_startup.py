@@ -0,0 +1,131 @@
+"""
+서버 기동 벤치마크 (time-to-ready, 첫 요청 지연).
+
+uvicorn 워커 1개를 새로 띄울 때마다 다음을 측정해 워밍업(``WARMUP``) 사용 여부별로 비교한다.
+    - import_sec: ``import main`` 소요 시간 (별도 인터프리터, 인터프리터 기동 시간 제외)
+    - listen_sec: 프로세스 실행부터 `/` 가 처음 응답할 때까지
+    - ready_sec: 프로세스 실행부터 `/ready` 가 200 을 반환할 때까지 (분석 프로세스 기동 + 모델 로딩 + 워밍업)
+    - first_ms / second_ms: 준비 완료 직후 분석 프로세스 수만큼 test_vid 영상을 /pose_local 로 한꺼번에 제출한
+      첫 번째/두 번째 묶음의 요청별 지연 (제출부터 /pose_check 결과 완료까지, 첫 묶음이 각 프로세스의 첫 요청)
+
+    $ python benchmarks/bench_startup.py --repeat 3
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VIDEO = "test_vid/go_pro.mp4"
+# WARMUP 설정만 바꿔서 서버 실행 (나머지는 config.yaml)
+LAUNCHER = """
+import json, sys, uvicorn
+import main
+main.WARMUP_CONFIG = json.loads(sys.argv[1])
+uvicorn.run(main.app, host="127.0.0.1", port=int(sys.argv[2]), log_level="warning")
+"""
+MODES = {
+    "cold": {"enabled": False},
+    "warm": {"enabled": True, "video": VIDEO, "frames": 1},
+}
+
+def request(base_url: str, path: str, body: dict | None = None, timeout: float = 30.0) -> tuple[int, dict]:
+    """
+    HTTP 요청 후 (상태 코드, 응답 JSON) 반환
+    """
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(base_url + path, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as res:
+            return res.status, json.loads(res.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b"{}")
+
+def wait_for(base_url: str, path: str, interval: float = 0.01, timeout: float = 120.0) -> None:
+    """
+    path 가 200 을 반환할 때까지 대기 (연결 거부/503 은 재시도)
+    """
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if request(base_url, path, timeout=1.0)[0] == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(interval)
+    raise TimeoutError(f"{path} 가 {timeout}초 안에 준비되지 않았습니다")
+
+def analyze(base_url: str, task_ids: list[str], interval: float = 0.01) -> list[float]:
+    """
+    영상들을 /pose_local 로 한꺼번에 제출하고, 제출부터 각 결과 완료까지 지연(ms)
+    """
+    start = time.perf_counter()
+    for task_id in task_ids:
+        request(base_url, "/pose_local", {"url": task_id, "handType": "R"})
+    latency = {}
+    while len(latency) < len(task_ids):
+        for task_id in task_ids:
+            if task_id not in latency and request(base_url, f"/pose_check?task_id={task_id}")[1].get("status") not in ("processing", "queued"):
+                latency[task_id] = (time.perf_counter() - start) * 1000
+        time.sleep(interval)
+    return [latency[task_id] for task_id in task_ids]
+
+def import_sec() -> float:
+    code = "import time; start = time.perf_counter(); import main; print(time.perf_counter() - start)"
+    return float(subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True).stdout)
+
+def measure(warmup: dict, port: int, requests: int, workdir: str) -> dict:
+    base_url = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    server = subprocess.Popen([sys.executable, "-c", LAUNCHER, json.dumps(warmup), str(port)], cwd=ROOT)
+    try:
+        wait_for(base_url, "/")
+        listen = time.perf_counter() - start
+        wait_for(base_url, "/ready")
+        ready = time.perf_counter() - start
+
+        batches = []
+        for batch in range(2):
+            # task_id 충돌을 피하기 위해 요청마다 고유 경로로 복사
+            task_ids = [os.path.relpath(os.path.join(workdir, f"{port}_{batch}_{i}_{os.path.basename(VIDEO)}"), ROOT) for i in range(requests)]
+            for task_id in task_ids:
+                shutil.copy(os.path.join(ROOT, VIDEO), os.path.join(ROOT, task_id))
+            batches.append(analyze(base_url, task_ids))
+        return {"listen": listen, "ready": ready, "first": batches[0], "second": batches[1]}
+    finally:
+        server.terminate()
+        server.wait()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="서버 기동 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--requests", type=int, default=2, help="묶음당 요청 수 (ENGINE.max_workers 와 같게)")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    report = {"import_sec": round(statistics.median(import_sec() for _ in range(args.repeat)), 3)}
+    workdir = tempfile.mkdtemp(prefix=".bench_startup_", dir=ROOT)
+    try:
+        for name, warmup in MODES.items():
+            runs = [measure(warmup, args.port + i, args.requests, workdir) for i in range(args.repeat)]
+            report[name] = {
+                "listen_sec": round(statistics.median(r["listen"] for r in runs), 3),
+                "ready_sec": round(statistics.median(r["ready"] for r in runs), 3),
+                "first_ms": round(statistics.median(ms for r in runs for ms in r["first"]), 1),
+                "first_max_ms": round(statistics.median(max(r["first"]) for r in runs), 1),
+                "second_ms": round(statistics.median(ms for r in runs for ms in r["second"]), 1),
+            }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+        shutil.rmtree(os.path.join(ROOT, "images", os.path.basename(workdir)), ignore_errors=True)
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+다운로드 프리페치 벤치마크 (오프라인).
+
+LocalStorage 로 원격 저장소의 지연/대역폭을 흉내내고, test_vid 영상 N개를
+프리페치 없이(depth=0: 슬롯마다 다운로드 후 추론) 처리할 때와
+프리페치(depth>0: 앞선 작업 추론 중 다음 작업 다운로드) 처리할 때의 처리량을 비교한다.
+
+    $ python benchmarks/bench_storage.py --videos 6 --latency 0.5 --bandwidth 1
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from utils.analysis import analyze_video
+from utils.engine import AnalysisEngine
+from utils.model_pool import init_model_pool
+from utils.scratch import ScratchSpace
+from utils.storage import LocalStorage, Prefetcher
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+
+async def run_jobs(engine: AnalysisEngine, storage: LocalStorage, depth: int, videos: int, workdir: str) -> float:
+    """
+    N개 작업을 동시에 제출하고 모두 끝날 때까지의 시간(초) 반환
+    """
+    prefetcher = Prefetcher(storage, inference_slots=engine.max_workers, depth=depth, scratch=ScratchSpace(root=workdir))
+
+    async def job(i: int) -> dict:
+        key = TEST_VIDEOS[i % len(TEST_VIDEOS)]
+        async with prefetcher.fetch(key) as filename:
+            return await engine.run(analyze_video, filename, "R")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(job(i) for i in range(videos)))
+    return time.perf_counter() - start
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=6)
+    parser.add_argument("--slots", type=int, default=2, help="엔진 슬롯 수")
+    parser.add_argument("--latency", type=float, default=0.5, help="요청당 지연(초)")
+    parser.add_argument("--bandwidth", type=float, default=1.0, help="다운로드 대역폭(MB/s)")
+    args = parser.parse_args()
+
+    engine = AnalysisEngine(max_workers=args.slots, initializer=init_model_pool)
+    await engine.start()
+    storage = LocalStorage(root=ROOT, latency_sec=args.latency, bandwidth_mbps=args.bandwidth)
+    await storage.start()
+    report = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for depth in (0, 2):
+            elapsed = await run_jobs(engine, storage, depth, args.videos, workdir)
+            report[f"prefetch_depth_{depth}"] = {
+                "total_sec": round(elapsed, 2),
+                "videos_per_min": round(args.videos / elapsed * 60, 1),
+            }
+    await storage.close()
+    engine.shutdown()
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    asyncio.run(main())
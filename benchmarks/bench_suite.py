@@ -0,0 +1,179 @@
+"""
+성능 회귀 벤치마크 (오프라인, test_vid 영상).
+
+영상별로 다음을 측정해 JSON 으로 저장하고, 저장된 기준(baseline)과 비교한다.
+    - decode_fps: ffmpeg 파이프 디코딩만 수행했을 때의 fps
+    - inference_fps: model_complexity 별 Pose 추론 fps (디코딩 제외)
+    - e2e_sec: ``mp_background`` (LocalStorage 다운로드 + 엔진 분석) 소요 시간 (handType 별)
+    - step: 검출된 단계 프레임 (handType 별)
+    - peak_rss_mb: 서버 프로세스 / 분석 프로세스의 최대 RSS
+시간/fps/메모리가 기준보다 threshold 이상 나빠지거나 단계 프레임이 달라지면 종료 코드 1.
+기준은 기준 장비에서 ``--update-baseline`` 으로 만든다 (장비마다 값이 다름).
+
+    $ python benchmarks/bench_suite.py --repeat 3 --threshold 0.2
+    $ python benchmarks/bench_suite.py --update-baseline
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+import mediapipe as mp
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from routers.pose import mp_background
+from utils.decode import iter_frames
+from utils.engine import AnalysisEngine
+from utils.model_pool import PoseModelPool, init_model_pool
+from utils.result_store import MemoryResultStore
+from utils.scratch import ScratchSpace
+from utils.storage import LocalStorage, Prefetcher
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+COMPLEXITIES = (0, 1, 2)
+
+def decode_fps(video: str) -> tuple[float, list]:
+    """
+    디코딩 fps 와 디코딩된 프레임 목록
+    """
+    start = time.perf_counter()
+    frames = [rgb.copy() for rgb in iter_frames(video)]
+    return len(frames) / (time.perf_counter() - start), frames
+
+def inference_fps(pool: PoseModelPool, complexity: int, frames: list) -> float:
+    """
+    디코딩된 프레임에 대한 complexity 별 추론 fps
+    """
+    with pool.checkout(complexity) as model:
+        start = time.perf_counter()
+        for rgb in frames:
+            model.process(rgb)
+        return len(frames) / (time.perf_counter() - start)
+
+async def end_to_end(video: str, hand_type: str, engine: AnalysisEngine, prefetcher: Prefetcher) -> tuple[float, dict]:
+    """
+    ``/pose`` 백그라운드 작업 1건의 소요 시간과 결과 (키포인트 캐시 없음)
+    """
+    start = time.perf_counter()
+    result = await mp_background(
+        video, video, hand_type,
+        MemoryResultStore(), engine, prefetcher,
+    )
+    return time.perf_counter() - start, result
+
+async def measure(repeat: int) -> dict:
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "mediapipe": mp.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "clips": {},
+    }
+    pool = PoseModelPool({complexity: 1 for complexity in COMPLEXITIES})
+    engine = AnalysisEngine(max_workers=1, initializer=init_model_pool)
+    await engine.start()
+    storage = LocalStorage(root=ROOT)
+    await storage.start()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        prefetcher = Prefetcher(storage, inference_slots=engine.max_workers, scratch=ScratchSpace(root=workdir))
+        for video in TEST_VIDEOS:
+            decoded = [decode_fps(video) for _ in range(repeat)]
+            frames = decoded[0][1]
+            clip = {
+                "decode_fps": round(statistics.median(fps for fps, _ in decoded), 1),
+                "inference_fps": {
+                    str(complexity): round(statistics.median(inference_fps(pool, complexity, frames) for _ in range(repeat)), 1)
+                    for complexity in COMPLEXITIES
+                },
+                "e2e_sec": {},
+                "step": {},
+            }
+            for hand_type in ("R", "L"):
+                runs = [await end_to_end(video, hand_type, engine, prefetcher) for _ in range(repeat)]
+                clip["e2e_sec"][hand_type] = round(statistics.median(sec for sec, _ in runs), 3)
+                clip["step"][hand_type] = runs[-1][1].get("step")
+            report["clips"][os.path.basename(video)] = clip
+
+    await storage.close()
+    pool.close()
+    engine.shutdown()
+    # ru_maxrss: Linux 는 KB 단위, 분석 프로세스는 종료(shutdown) 후 RUSAGE_CHILDREN 에 집계됨
+    report["peak_rss_mb"] = {
+        "server": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "analysis": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+    }
+    return report
+
+def numeric_leaves(data: dict, prefix: str = "") -> dict[str, float]:
+    """
+    중첩 dict 의 숫자 값을 "a.b.c" 경로로 펼침 (environment / step 제외)
+    """
+    leaves = {}
+    for key, value in data.items():
+        if key in ("environment", "step"):
+            continue
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            leaves.update(numeric_leaves(value, f"{path}."))
+        elif isinstance(value, (int, float)):
+            leaves[path] = value
+    return leaves
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    기준 대비 회귀 목록 (fps 는 클수록, 시간/메모리는 작을수록 좋음)
+    """
+    regressions = []
+    current, reference = numeric_leaves(report), numeric_leaves(baseline)
+    for path, expected in reference.items():
+        actual = current.get(path)
+        if actual is None or not expected:
+            continue
+        change = (expected - actual) / expected if "fps" in path else (actual - expected) / expected
+        if change > threshold:
+            regressions.append(f"{path}: {expected} -> {actual} ({change:+.1%})")
+    for clip, values in baseline.get("clips", {}).items():
+        for hand_type, step in values.get("step", {}).items():
+            actual = report["clips"].get(clip, {}).get("step", {}).get(hand_type)
+            if actual != step:
+                regressions.append(f"clips.{clip}.step.{hand_type}: {step} -> {actual}")
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="허용 성능 저하 비율")
+    parser.add_argument("--baseline", default=os.path.join(ROOT, "benchmarks", "baseline.json"))
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmarks", "results.json"))
+    parser.add_argument("--update-baseline", action="store_true", help="측정 결과를 기준으로 저장")
+    args = parser.parse_args()
+
+    report = asyncio.run(measure(args.repeat))
+    path = args.baseline if args.update_baseline else args.output
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        print(f"baseline: {args.baseline} {'저장' if args.update_baseline else '없음 (비교 생략)'}")
+        return
+    with open(args.baseline) as file:
+        regressions = compare(report, json.load(file), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+2-pass(coarse-to-fine) 분석 벤치마크.
+
+test_vid 영상 앞뒤에 정지 구간(첫/마지막 프레임 복제)을 붙여 긴 대기 구간이 있는 영상을 만들고,
+기존 1-pass 분석과 2-pass 분석(``coarse_pass``)의 소요 시간과 단계별 프레임 차이를 비교한다.
+1-pass 결과를 기준으로 단계별 일치율(정확히 같음 / ±tolerance 이내)과 평균 오차를 보고한다.
+
+    $ python benchmarks/bench_two_pass.py --pad-sec 0 3 --stride 2 --coarse-width 320
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from utils.analysis import analyze_video
+from utils.model_pool import PoseModelPool
+
+TEST_VIDEOS = ["test_vid/m_pro.mp4", "test_vid/w_pro.mp4", "test_vid/go_pro.mp4"]
+
+def pad_video(video: str, pad_sec: float, workdir: str) -> str:
+    """
+    영상 앞뒤에 pad_sec 초 정지 구간을 붙인 사본 생성
+    """
+    if not pad_sec:
+        return video
+    output = os.path.join(workdir, f"pad{pad_sec}_{os.path.basename(video)}")
+    subprocess.run([
+        "ffmpeg", "-loglevel", "error", "-y", "-i", video, "-an",
+        "-vf", f"tpad=start_duration={pad_sec}:start_mode=clone:stop_duration={pad_sec}:stop_mode=clone",
+        "-c:v", "libx264", "-crf", "18", output,
+    ], check=True)
+    return output
+
+def timed(**kwargs) -> tuple[dict, float]:
+    start = time.perf_counter()
+    result = analyze_video(**kwargs)
+    return result, time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pad-sec", type=float, nargs="+", default=[0, 3], help="앞뒤 정지 구간(초)")
+    parser.add_argument("--complexity", type=int, default=0, help="1차 패스 model_complexity")
+    parser.add_argument("--stride", type=int, default=2)
+    parser.add_argument("--coarse-width", type=int, default=320)
+    parser.add_argument("--margin-sec", type=float, default=0.5)
+    parser.add_argument("--tolerance", type=int, default=2, help="허용 프레임 오차")
+    args = parser.parse_args()
+
+    coarse_pass = {
+        "complexity": args.complexity,
+        "stride": args.stride,
+        "max_width": args.coarse_width,
+        "margin_sec": args.margin_sec,
+    }
+    model_pool = PoseModelPool({args.complexity: 1, 1: 1, 2: 1})
+    report, errors = {}, []
+    phases_total = phases_exact = phases_close = phases_missing = 0
+    single_total = two_pass_total = 0.0
+    with tempfile.TemporaryDirectory() as workdir:
+        for pad_sec in args.pad_sec:
+            for video in TEST_VIDEOS:
+                path = pad_video(video, pad_sec, workdir)
+                for hand_type in ("R", "L"):
+                    options = {"user_video_name": path, "hand_type": hand_type, "model_pool": model_pool}
+                    single, single_sec = timed(**options)
+                    two_pass, two_pass_sec = timed(**options, coarse_pass=coarse_pass)
+                    single_total += single_sec
+                    two_pass_total += two_pass_sec
+
+                    expected, actual = single.get("step", {}), two_pass.get("step", {})
+                    diff = {}
+                    for phase, frame in expected.items():
+                        phases_total += 1
+                        if phase not in actual:
+                            phases_missing += 1
+                            diff[phase] = None
+                            continue
+                        error = actual[phase] - frame
+                        errors.append(abs(error))
+                        phases_exact += error == 0
+                        phases_close += abs(error) <= args.tolerance
+                        diff[phase] = error
+                    report[f"{video}:{hand_type}:pad{pad_sec}"] = {
+                        "single_sec": round(single_sec, 2),
+                        "two_pass_sec": round(two_pass_sec, 2),
+                        "speedup": round(single_sec / two_pass_sec, 2),
+                        "frame_error": diff,
+                        "extra_phases": sorted(set(actual) - set(expected)),
+                    }
+    model_pool.close()
+
+    report["summary"] = {
+        "speedup": round(single_total / two_pass_total, 2),
+        "phases": phases_total,
+        "exact_rate": round(phases_exact / phases_total, 3) if phases_total else None,
+        f"within_{args.tolerance}_rate": round(phases_close / phases_total, 3) if phases_total else None,
+        "missing": phases_missing,
+        "mean_abs_error": round(sum(errors) / len(errors), 2) if errors else None,
+    }
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
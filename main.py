@@ -1,32 +1,149 @@
 from fastapi import FastAPI
+from contextlib import asynccontextmanager
+import asyncio
 import subprocess
-from utils.loader import yaml_loader
+import time
+from utils.loader import initialize_logger, load_config
+from utils.engine import AnalysisEngine
+from utils.model_pool import init_model_pool, model_pool_status
+from utils.result_store import create_result_store
+from utils.storage import create_storage, Prefetcher
+from utils.scratch import create_scratch
+from utils.keypoint_cache import create_keypoint_cache
+from utils.keypoint_export import sweep_exports
+from utils.scheduler import JobScheduler
 
 from routers.root import router as root
 from routers.pose import router as pose
+from routers.pose_batch import router as pose_batch
+from routers.pose_events import router as pose_events
+from routers.keypoints import router as keypoints
+from routers.phase import router as phase
+from routers.ready import router as ready
 
 #test
 from routers.pose_local import router as pose_local
 from routers.pose_check import router as pose_check
+from routers.cache_check import router as cache_check
+from routers.metrics import router as metrics
+from routers.profile import router as profile
 
 # 설정 파일 로드
-settings = yaml_loader("config.yaml")
+settings = load_config()
 
 # 필수 설정 로드
 IP_NUM: str = settings.get("IP_NUM", "127.0.0.1")
 PORT_NUM: str = settings.get("PORT_NUM", "8000")
 WORKER: str = settings.get("WORKERS", "5")
+ENGINE_CONFIG: dict = settings.get("ENGINE") or {}
+MODEL_POOL_CONFIG: dict = settings.get("MODEL_POOL") or {}
+RESULT_STORE_CONFIG: dict = settings.get("RESULT_STORE") or {}
+STORAGE_CONFIG: dict = settings.get("STORAGE") or {}
+SCRATCH_CONFIG: dict = settings.get("SCRATCH") or {}
+KEYPOINT_CACHE_CONFIG: dict = settings.get("KEYPOINT_CACHE") or {}
+SCHEDULER_CONFIG: dict = settings.get("SCHEDULER") or {}
+WARMUP_CONFIG: dict = settings.get("WARMUP") or {}
+KEYPOINT_EXPORT_CONFIG: dict = settings.get("KEYPOINT_EXPORT") or {}
+
+logger = initialize_logger("app.log")
+
+async def start_engine(app: FastAPI) -> None:
+    """
+    분석 프로세스 기동 + 모델 로딩/워밍업 완료까지 대기 후 준비 상태 기록 (``/ready``)
+    """
+    app.state.workers = await app.state.engine.start(probe=model_pool_status)
+    app.state.ready_sec = time.perf_counter() - app.state.started_at
+    logger.info(f"분석 엔진 준비 완료 : {app.state.ready_sec:.2f}초, {list(app.state.workers.values())}")
+
+async def sweep_keypoints(app: FastAPI, directory: str, interval: float) -> None:
+    """
+    결과 보존 시간이 지났거나 결과 저장소에서 제거된 작업의 키포인트 파일을 주기적으로 삭제
+    (``KEYPOINT_EXPORT.sweep_interval_sec``, 저장소 확인은 워커 간 공유되는 sqlite backend 에서만)
+    """
+    task_results = app.state.task_results
+    shared = task_results if RESULT_STORE_CONFIG.get("backend", "memory") == "sqlite" else None
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            removed = await asyncio.to_thread(sweep_exports, directory, task_results.ttl_sec, shared)
+        except Exception as e:
+            logger.warning(f"키포인트 파일 정리 실패 : {e}")
+            continue
+        if removed:
+            logger.info(f"키포인트 파일 정리 : {removed}개 삭제")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    워커 시작/종료 시 분석 엔진(프로세스 풀) 생성 및 정리.
+    각 자식 프로세스는 시작 시 Pose 모델 풀을 미리 초기화하고 더미 추론으로 워밍업한다.
+    분석 프로세스 기동은 백그라운드로 진행하여 서버는 바로 요청을 받고, 완료 전까지 ``/ready`` 는 503 이다
+    (그 사이 들어온 분석 요청은 프로세스가 준비되면 실행된다).
+    """
+    app.state.started_at = time.perf_counter()
+    # 작업 결과 저장소 (sqlite backend 는 모든 워커가 공유)
+    app.state.task_results = create_result_store(RESULT_STORE_CONFIG)
+    app.state.engine = AnalysisEngine(
+        max_workers=int(ENGINE_CONFIG.get("max_workers", 2)),
+        initializer=init_model_pool,
+        initargs=(MODEL_POOL_CONFIG.get("sizes"), WARMUP_CONFIG),
+    )
+    app.state.startup = asyncio.create_task(start_engine(app))
+    # 장기 저장소 클라이언트 + 다운로드 프리페치 단계
+    app.state.storage = create_storage(settings)
+    await app.state.storage.start()
+    # 다운로드 임시 공간 (작업별 폴더, 작업 종료 시 삭제, 용량 상한 초과 시 다운로드 대기)
+    app.state.scratch = create_scratch(SCRATCH_CONFIG)
+    app.state.prefetcher = Prefetcher(
+        app.state.storage,
+        inference_slots=app.state.engine.max_workers,
+        depth=int(STORAGE_CONFIG.get("prefetch_depth", 2)),
+        scratch=app.state.scratch,
+    )
+    # 내용 기반 키포인트 캐시 (같은 영상 재요청 시 다운로드/추론 생략)
+    app.state.keypoint_cache = create_keypoint_cache(KEYPOINT_CACHE_CONFIG)
+    # 워커별 작업 스케줄러 (대기열 상한 초과 시 429)
+    app.state.scheduler = JobScheduler(
+        max_queue=int(SCHEDULER_CONFIG.get("max_queue", 32)),
+        concurrency=int(
+            SCHEDULER_CONFIG.get("concurrency")
+            or app.state.engine.max_workers + int(STORAGE_CONFIG.get("prefetch_depth", 2))
+        ),
+        task_results=app.state.task_results,
+    )
+    await app.state.scheduler.start()
+    # 키포인트 파일 정리 (결과 저장소 TTL/개수 상한과 맞춤)
+    app.state.keypoint_sweeper = None
+    if KEYPOINT_EXPORT_CONFIG.get("enabled", True) and KEYPOINT_EXPORT_CONFIG.get("sweep_interval_sec"):
+        app.state.keypoint_sweeper = asyncio.create_task(sweep_keypoints(
+            app, KEYPOINT_EXPORT_CONFIG.get("dir", "keypoints"), float(KEYPOINT_EXPORT_CONFIG["sweep_interval_sec"]),
+        ))
+    yield
+    app.state.startup.cancel()
+    if app.state.keypoint_sweeper is not None:
+        app.state.keypoint_sweeper.cancel()
+    await app.state.scheduler.close()
+    await app.state.storage.close()
+    app.state.scratch.close()
+    app.state.engine.shutdown()
+    app.state.task_results.close()
 
 # FastAPI 애플리케이션 생성
-app = FastAPI()
-# 전역 상태 초기화
-app.state.task_results = {}
+app = FastAPI(lifespan=lifespan)
 
 # 라우터 등록
 app.include_router(root)
 app.include_router(pose)
+app.include_router(pose_batch)
+app.include_router(pose_events)
+app.include_router(keypoints)
+app.include_router(phase)
+app.include_router(ready)
 app.include_router(pose_local)
 app.include_router(pose_check)
+app.include_router(cache_check)
+app.include_router(metrics)
+app.include_router(profile)
 
 # 메인 실행부
 if __name__ == "__main__":
@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Request
+
+router = APIRouter()
+
+@router.get("/cache_check")
+async def get_cache_stats(app: Request):
+    """
+    키포인트 캐시 적중/실패 횟수(현재 워커) 및 사용량 반환.
+    """
+    keypoint_cache = app.app.state.keypoint_cache
+    if keypoint_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **keypoint_cache.stats()}
@@ -0,0 +1,34 @@
+import os
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+
+from utils.keypoint_export import export_path
+from routers.pose import KEYPOINT_DIR
+
+router = APIRouter()
+
+@router.get("/pose/keypoints")
+async def get_keypoints(task_id: str, app: Request, segment: int | None = None):
+    """
+    작업의 프레임별 랜드마크 키포인트 파일 다운로드 (application/octet-stream).
+    Range 요청을 지원하므로 header 와 필요한 프레임 구간만 받을 수 있다
+    (``utils.keypoint_export.fetch_frames`` / ``fetch_keypoints`` + ``load_keypoints`` 로 메모리 매핑).
+    Args:
+        task_id (str): 작업 ID (``/pose`` 요청의 url).
+        segment (int | None): 세션 모드 작업의 스윙 번호 (``segments`` 순서, 생략하면 영상 전체).
+    Raises:
+        HTTPException: 작업이나 키포인트 파일이 없으면 404
+    """
+    if KEYPOINT_DIR is None:
+        raise HTTPException(status_code=404, detail="키포인트 저장이 비활성화되어 있습니다")
+    result = app.app.state.task_results.get(task_id)
+    if result is None or not result.get("keypoints"):
+        raise HTTPException(status_code=404, detail=f"{task_id}: 키포인트가 없습니다")
+    if segment is not None:
+        segments = result.get("segments") or []
+        if not 0 <= segment < len(segments) or not segments[segment].get("keypoints"):
+            raise HTTPException(status_code=404, detail=f"{task_id}: {segment}번 스윙 키포인트가 없습니다")
+    path = export_path(KEYPOINT_DIR, task_id, segment)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail=f"{task_id}: 키포인트 파일이 삭제되었습니다")
+    return FileResponse(path, media_type="application/octet-stream", filename=os.path.basename(path))
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+
+from utils.metrics import REGISTRY
+
+router = APIRouter()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(app: Request):
+    """
+    현재 워커의 분석 지표 (Prometheus 텍스트 형식).
+    단계별 소요 시간/작업당 프레임 수 히스토그램, 작업 스케줄러 대기열 상태와 다운로드 임시 공간 사용량을 포함한다.
+    """
+    stats = app.app.state.scheduler.stats()
+    scratch = app.app.state.scratch.stats()
+    gauges = {
+        "pose_scheduler_queued": stats["queued"],
+        "pose_scheduler_running": stats["running"],
+        "pose_scheduler_avg_duration_seconds": stats["avg_duration_sec"],
+        "pose_scratch_used_bytes": scratch["used_bytes"],
+        "pose_scratch_memory_used_bytes": scratch["memory_used_bytes"],
+        "pose_scratch_waiting": scratch["waiting"],
+    }
+    counters = {
+        "pose_scheduler_rejected_total": stats["rejected"],
+        "pose_scratch_waited_total": scratch["waited_total"],
+    }
+    return PlainTextResponse(REGISTRY.render(gauges, counters), media_type="text/plain; version=0.0.4")
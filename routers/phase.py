@@ -0,0 +1,74 @@
+import os
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel
+import numpy as np
+
+from utils.keypoint_export import export_path
+from utils.landmark import KEY_POINT_STRING, CHANNELS
+from utils.phase import detect_phases_batch
+from routers.pose import KEYPOINT_DIR
+
+class landmark_item(BaseModel):
+    id: str  # ex) 스윙 식별자
+    landmarks: list[list[list[float]]] | None = None  # (frames, joints, 4) [x, y, z_norm, x_norm]
+    task_id: str | None = None  # landmarks 대신 이 작업의 키포인트 파일(/pose/keypoints) 사용
+    segment: int | None = None  # task_id 지정 시 세션 모드 스윙 번호 (생략하면 영상 전체)
+
+class phase_request(BaseModel):
+    items: list[landmark_item]
+    spine_angle: tuple[float, float] = (10, 70)  # address 척추 각도 범위
+    wrist_tolerance: float = 0.01  # address 손목 안정성
+    follow_through_divisor: float = 3  # follow_through 기준선 (엉덩이-어깨 / divisor)
+
+router = APIRouter()
+
+def keypoint_file(task_results, item: landmark_item) -> str:
+    """
+    작업의 저장된 키포인트 파일 경로
+    Raises:
+        HTTPException: 작업이나 키포인트 파일이 없으면 404
+    """
+    if KEYPOINT_DIR is None:
+        raise HTTPException(status_code=404, detail="키포인트 저장이 비활성화되어 있습니다")
+    result = task_results.get(item.task_id)
+    if result is None or not result.get("keypoints"):
+        raise HTTPException(status_code=404, detail=f"{item.id}: {item.task_id} 의 키포인트가 없습니다")
+    path = export_path(KEYPOINT_DIR, item.task_id, item.segment)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail=f"{item.id}: {item.task_id} 의 키포인트 파일이 없습니다")
+    return path
+
+@router.post("/phase")
+async def phase(request: phase_request, app: Request):
+    """
+    저장된 랜드마크 배열로 스윙 단계 재검출 (Mediapipe 추론 없음).
+    항목마다 랜드마크를 직접 보내거나, task_id (+ segment) 로 서버에 저장된 키포인트 파일을 지정한다
+    (파일은 분석 프로세스에서 메모리 매핑으로 읽음).
+    Args:
+        request ``phase_request``: 스윙별 랜드마크(또는 task_id)와 검출 임계값
+    Returns:
+        dict: id 별 단계 검출 결과
+    Raises:
+        HTTPException: landmarks 와 task_id 중 하나만 지정하지 않았거나 형태가 다르면 422, 키포인트 파일이 없으면 404
+    """
+    items = {}
+    for item in request.items:
+        if (item.landmarks is None) == (item.task_id is None):
+            raise HTTPException(status_code=422, detail=f"{item.id}: landmarks 와 task_id 중 하나만 지정해야 합니다")
+        if item.task_id is not None:
+            items[item.id] = keypoint_file(app.app.state.task_results, item)
+            continue
+        landmarks = np.asarray(item.landmarks, dtype=np.float32)
+        if landmarks.ndim != 3 or landmarks.shape[1:] != (len(KEY_POINT_STRING), len(CHANNELS)):
+            raise HTTPException(
+                status_code=422,
+                detail=f"{item.id}: landmarks 는 (frames, {len(KEY_POINT_STRING)}, {len(CHANNELS)}) 형태여야 합니다",
+            )
+        items[item.id] = landmarks
+
+    return await app.app.state.engine.run(
+        detect_phases_batch, items,
+        spine_angle=request.spine_angle,
+        wrist_tolerance=request.wrist_tolerance,
+        follow_through_divisor=request.follow_through_divisor,
+    )
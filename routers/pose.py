@@ -1,228 +1,255 @@
-import mediapipe as mp
-from fastapi import APIRouter, BackgroundTasks, Request
-from pydantic import BaseModel
-import aioboto3
 import asyncio
-import cv2
+import time
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel
 
-from utils.loader import yaml_loader
-from utils.detect import is_address, is_take_away, is_half, is_top, is_down_half, is_impact, is_follow_through, is_finish
-from utils.data_process import adaptive_ema
+from utils.loader import initialize_logger, load_config
+from utils.analysis import analyze_video, model_signature
+from utils.chunked import analyze_chunked
+from utils.metrics import REGISTRY, StageTimer
+from utils.keypoint_export import export_path, write_keypoints
+from utils.phase import detect_phases
+from utils.profiling import PROFILE_MODES, artifact_dir, run_profiled
+from utils.scheduler import QueueFull
 
-# YAML 설정 값 로드
-CONFIG = yaml_loader("config.yaml")
-KEYPOINTS = yaml_loader("keypoints.yaml")
+logger = initialize_logger("app.log")
 
-S3_CONFIG = CONFIG.get("S3")
-KEY_POINT_STRING = KEYPOINTS.get("key_point_string")
-STRING_MATCH_INDEX = KEYPOINTS.get("string_match_index")
-EIGHT_STEP = KEYPOINTS.get("eight_step")
+# YAML 설정 값 로드
+CONFIG = load_config()
+
+DECODE_CONFIG = CONFIG.get("DECODE") or {}
+COARSE_PASS_CONFIG = CONFIG.get("COARSE_PASS") or {}
+# 2-pass 분석 1차 패스 설정 (비활성화 시 None: 1-pass)
+COARSE_PASS = {k: v for k, v in COARSE_PASS_CONFIG.items() if k != "enabled"} if COARSE_PASS_CONFIG.get("enabled") else None
+ROI_CONFIG = CONFIG.get("ROI") or {}
+# 사람 영역(ROI) 추론 설정 (비활성화 시 None: 전체 프레임)
+ROI = {k: v for k, v in ROI_CONFIG.items() if k != "enabled"} if ROI_CONFIG.get("enabled") else None
+SMOOTHING_CONFIG = CONFIG.get("SMOOTHING") or {}
+# 스윙 중 프레임별 보정 방식 (vectorized | scalar)
+ONLINE_SMOOTHING = SMOOTHING_CONFIG.get("online", "vectorized")
+# 분석 후 랜드마크 전체 평활 설정 (offline 미지정 시 None: 사용 안 함)
+OFFLINE_SMOOTHING = (
+    {"method": SMOOTHING_CONFIG["offline"], **(SMOOTHING_CONFIG.get(SMOOTHING_CONFIG["offline"]) or {})}
+    if SMOOTHING_CONFIG.get("offline") else None
+)
+KEYPOINT_EXPORT_CONFIG = CONFIG.get("KEYPOINT_EXPORT") or {}
+# 작업별 키포인트 파일 저장 폴더 (비활성화 시 None: 저장 안 함)
+KEYPOINT_DIR = KEYPOINT_EXPORT_CONFIG.get("dir", "keypoints") if KEYPOINT_EXPORT_CONFIG.get("enabled", True) else None
+# 요청별 프로파일 결과 저장 폴더
+PROFILE_DIR = (CONFIG.get("PROFILING") or {}).get("dir", "profiles")
+CHUNKED_CONFIG = CONFIG.get("CHUNKED") or {}
+# 영상 하나의 구간 병렬 추론 설정 (비활성화 시 None: 순차 추론)
+CHUNKED = {k: v for k, v in CHUNKED_CONFIG.items() if k != "enabled"} if CHUNKED_CONFIG.get("enabled") else None
+MODEL_SIGNATURE = model_signature(
+    DECODE_CONFIG.get("fps"), DECODE_CONFIG.get("max_width"), COARSE_PASS, ROI, OFFLINE_SMOOTHING, CHUNKED,
+)
 
 class video_info(BaseModel):
     url: str  # ex) username/videoname.mp4
     handType: str  # ex) R, L
+    priority: int = 0  # 클수록 먼저 분석
+    profile: str | None = None  # 지정 시 이 작업의 분석만 프로파일링 (cprofile | sample)
+    session: bool = False  # True: 영상 안의 모든 스윙을 segments 로 반환 (연습 세션 영상)
 
 router = APIRouter()
 
-# 비동기 S3 다운로드
-async def download_file_async(bucket, key, filename):
-    session = aioboto3.Session()
-    async with session.client(
-        "s3",
-        aws_access_key_id=S3_CONFIG.get("s3_accesskey"),
-        aws_secret_access_key=S3_CONFIG.get("s3_privatekey"),
-        region_name=S3_CONFIG.get("s3_region_name")
-    ) as s3_client:
-        await s3_client.download_file(bucket, key, filename)
-
-# 비동기 FFmpeg 실행
-async def run_ffmpeg_async(command):
-    process = await asyncio.create_subprocess_exec(
-        *command.split(),
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
-    )
-    stdout, stderr = await process.communicate()
-    return stdout, stderr
+async def lookup_keypoints(video_path, hand_type, prefetcher, keypoint_cache):
+    """
+    다운로드 없이 영상 내용 식별자로 키포인트 캐시 조회
+    Args:
+        video_path (str): 저장소 객체 키.
+        hand_type (str): 손 타입 (R 또는 L).
+        prefetcher ``Prefetcher``: 다운로드 단계 (저장소 접근).
+        keypoint_cache ``KeypointCache``: 키포인트 캐시.
+    Returns:
+        tuple[str, np.ndarray | None]: 캐시 키, 저장된 랜드마크 (없으면 None)
+    """
+    content_id = await prefetcher.storage.fingerprint(video_path)
+    cache_key = keypoint_cache.key(content_id, hand_type, MODEL_SIGNATURE)
+    return cache_key, await asyncio.to_thread(keypoint_cache.get, cache_key)
 
-async def mp_background(task_id, user_video_name, hand_type, task_results):
+async def export_keypoints(task_id, hand_type, landmarks, step, segment=None, **meta):
     """
-    Mediapipe 모델을 백그라운드에서 실행.
+    작업의 프레임별 랜드마크를 키포인트 파일(``/pose/keypoints``)로 저장
     Args:
         task_id (str): 작업 ID.
-        user_video_name (str): 다운로드된 비디오 파일 이름.
         hand_type (str): 손 타입 (R 또는 L).
+        landmarks ``np.ndarray``: (frames, joints, 4) 랜드마크.
+        step (dict): 검출된 단계 (header 에 기록).
+        segment (int | None): 세션 모드 스윙 구간 번호 (구간 파일로 저장).
+        **meta: header 에 추가할 값.
+    Returns:
+        dict | None: 결과에 기록할 ``{"frames", "bytes"}`` (저장 비활성화 시 None)
     """
-    # model init
-    mp_pose = mp.solutions.pose
-    full_model = mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5, model_complexity=1)
-    heavy_model = mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5, model_complexity=2)
-
-    # model running
-    cap = cv2.VideoCapture(user_video_name)
-    fps: float = cap.get(cv2.CAP_PROP_FPS)
-    frame: int = 0
-
-    PoseLandMark = {joint: {"x": [], "y": [], "z_norm": [], "x_norm": []} for joint in KEY_POINT_STRING}
-    none_frame = []
-    is_swing = False
-    detect_flow = "address"
-    step = {}  # 자세 기록용
-
-    try: 
-        while cap.isOpened():
-            success, image = cap.read()
-            if not success: break
-            if frame == 0: height, width, channel = image.shape
-            if hand_type == "L": image = cv2.flip(image, 1)
-
-            # 모델 선택
-            if is_swing == False : results = full_model.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-            else :  results = heavy_model.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-
-            # pose processing
-            if not results.pose_landmarks:
-                for joint in KEY_POINT_STRING:
-                    # 이전 프레임 데이터로 채움, 이전 값이 없다면 0으로 초기화
-                    PoseLandMark[joint]["x"].append(PoseLandMark[joint]["x"][-1] if frame > 0 else 0)
-                    PoseLandMark[joint]["y"].append(PoseLandMark[joint]["y"][-1] if frame > 0 else 0)
-                    PoseLandMark[joint]["z_norm"].append(PoseLandMark[joint]["z_norm"][-1] if frame > 0 else 0)
-                    PoseLandMark[joint]["x_norm"].append(PoseLandMark[joint]["x_norm"][-1] if frame > 0 else 0)
-                none_frame.append(frame)
-            else:
-                current_landmark = {}
-                for joint, index in zip(KEY_POINT_STRING, STRING_MATCH_INDEX):
-                    landmark = results.pose_landmarks.landmark[index]
-                    world_landmark = results.pose_world_landmarks.landmark[index]
-                    PoseLandMark[joint]["x"].append(landmark.x * width)  # 실제 픽셀 좌표 (x)
-                    PoseLandMark[joint]["y"].append(landmark.y * height)  # 실제 픽셀 좌표 (y)
-                    PoseLandMark[joint]["z_norm"].append(world_landmark.z)  # 정규화된 z 좌표
-                    PoseLandMark[joint]["x_norm"].append(world_landmark.x)  # 정규화된 x 좌표
-
-                # 데이터 보정
-                if is_swing==True :
-                    for joint in KEY_POINT_STRING:
-                        if frame > 0:
-                            # 속도 계산
-                            speed_x = abs(PoseLandMark[joint]["x"][-1] - PoseLandMark[joint]["x"][-2])
-                            speed_y = abs(PoseLandMark[joint]["y"][-1] - PoseLandMark[joint]["y"][-2])
-                            # Adaptive EMA 적용
-                            PoseLandMark[joint]["x"][-1] = adaptive_ema(
-                                PoseLandMark[joint]["x"][-2], PoseLandMark[joint]["x"][-1], speed_x
-                            )
-                            PoseLandMark[joint]["y"][-1] = adaptive_ema(
-                                PoseLandMark[joint]["y"][-2], PoseLandMark[joint]["y"][-1], speed_y
-                            ) 
-
-                current_landmark = {
-                    joint: {
-                        "x": PoseLandMark[joint]["x"][-1],
-                        "y": PoseLandMark[joint]["y"][-1],
-                    }
-                    for joint in KEY_POINT_STRING
-                }
-
-            # detect
-            match detect_flow :
-                case "address":
-                    if frame>=3 :
-                        if is_address(current_landmark, PoseLandMark):
-                            step["address"] = frame
-                            is_swing=True
-                            detect_flow = "take_away"
-
-                case "take_away" :
-                    if is_take_away(current_landmark) :
-                        step["take_away"] = frame
-                        detect_flow = "half"
-
-                case "half" :
-                    if is_half(current_landmark) :
-                        step["half"] = frame
-                        detect_flow = "top" 
-                
-                case "top" :
-                    if is_top(current_landmark, PoseLandMark, step["half"]) :
-                        step["top"] = frame
-                    else :
-                        detect_flow = "donw_half"
-                
-                case "donw_half" :
-                    if is_down_half(current_landmark) :
-                        step["down_half"] = frame
-                        detect_flow = "impact"
-
-                case "impact" :
-                    if is_impact(current_landmark, PoseLandMark, step["down_half"]) :
-                        step["impact"] = frame
-                    else :
-                        detect_flow = "follow_through"
-
-                case "follow_through" :
-                    if is_follow_through(current_landmark) :
-                        step["follow_through"] = frame
-                        detect_flow = "finish_top"  
-
-                case "finish_top" :
-                    if is_top(current_landmark, PoseLandMark, step["follow_through"]) :
-                        step["finish_top"] = frame
-                    else :
-                        detect_flow = "finish"
-
-                case "finish" :
-                    if is_finish(current_landmark, PoseLandMark, step["finish_top"]) :
-                        step["finish"] = frame
-                        task_results[task_id] = {"status": "step_completed", "step": step}
-                        print(task_results[task_id])
-                        return
-
-            if detect_flow != "address":
-                if is_address(current_landmark, PoseLandMark):
-                    step = {}
-                    step["address"] = frame
-                    is_swing=True
-                    detect_flow = "take_away"
-
-            frame += 1
-        cap.release()
-        task_results[task_id] = {"status": "step_completed", "step": step}
-        print(task_results[task_id])
+    if KEYPOINT_DIR is None:
+        return None
+    size = await asyncio.to_thread(
+        write_keypoints, export_path(KEYPOINT_DIR, task_id, segment), landmarks,
+        hand_type=hand_type, step=step, **meta,
+    )
+    return {"frames": len(landmarks), "bytes": size}
 
+async def export_segments(task_id, hand_type, landmarks, segments):
+    """
+    세션 모드 스윙 구간별 키포인트 파일을 동시에 저장하고 각 구간에 ``keypoints`` 기록.
+    구간 파일의 단계 frame 은 구간 시작(address) 기준이며, header 의 start 로 영상 기준 frame 을 구할 수 있다.
+    Args:
+        landmarks ``np.ndarray``: (frames, joints, 4) 영상 전체 랜드마크.
+        segments (list[dict]): ``segment_info`` 목록.
+    """
+    exports = await asyncio.gather(*(
+        export_keypoints(
+            task_id, hand_type, landmarks[segment["start"]:segment["end"] + 1],
+            {name: frame - segment["start"] for name, frame in segment["step"].items()},
+            segment=index, start=segment["start"], start_sec=segment["start_sec"],
+        )
+        for index, segment in enumerate(segments)
+    ))
+    for segment, keypoints in zip(segments, exports):
+        segment["keypoints"] = keypoints
+
+def record_result(task_results, task_id, result, timer):
+    """
+    작업 결과에 단계별 소요 시간(``metrics``)을 붙여 기록하고 워커 지표(``/metrics``)에 반영
+    Args:
+        result (dict): 분석 결과 (분석 프로세스의 ``metrics`` 포함 가능).
+        timer ``StageTimer``: 이벤트 루프 쪽 단계(queue_wait, cache_lookup, download, analysis) 시간.
+    """
+    metrics = result.get("metrics") or {}
+    stages = {**timer.stages, **metrics.get("stages", {})}
+    metrics["stages"] = {name: round(seconds, 4) for name, seconds in stages.items()}
+    result["metrics"] = metrics
+    REGISTRY.record(result.get("status", "error"), metrics)
+    task_results[task_id] = result
+
+async def mp_background(task_id, video_path, hand_type, task_results, engine, prefetcher, keypoint_cache=None, cache_key=None, queued_at=None, profile=None, session=False):
+    """
+    비디오 다운로드(프리페치) 후 Mediapipe 분석 작업을 엔진(프로세스 풀)에 제출하고 결과를 기록.
+    다운로드 파일은 작업별 임시 폴더에 저장되어 분석이 끝나거나 실패하면 삭제된다.
+    같은 내용의 영상이 키포인트 캐시에 있으면 다운로드/추론 없이 단계 검출만 수행한다.
+    상태 변화, 단계 검출, 프레임 진행, 최종 결과는 ``engine.progress`` 로 발행된다.
+    프레임별 랜드마크는 키포인트 파일로 저장되어 ``/pose/keypoints`` 로 받을 수 있다.
+    Args:
+        task_id (str): 작업 ID.
+        video_path (str): 저장소 객체 키.
+        hand_type (str): 손 타입 (R 또는 L).
+        engine ``AnalysisEngine``: 분석 실행 엔진.
+        prefetcher ``Prefetcher``: 다운로드 단계 (임시 공간 포함).
+        keypoint_cache ``KeypointCache | None``: 키포인트 캐시 (None 이면 항상 추론).
+        cache_key (str | None): 이미 조회해 없음을 확인한 캐시 키 (None 이면 여기서 조회).
+        queued_at (float | None): 대기열 등록 시각 (``time.perf_counter()``, 대기 시간 측정용).
+        profile (str | None): 지정 시 분석을 프로파일러(cprofile | sample)로 감싸 실행하고 결과 파일을 저장
+            (키포인트 캐시를 건너뛰고 항상 분석).
+        session (bool): 세션 모드. 영상 전체를 한 번에 분석해 모든 스윙을 ``segments`` 로 기록하고
+            구간별 키포인트 파일을 동시에 저장 (키포인트 캐시는 첫 스윙까지만 저장되므로 사용하지 않음).
+    CHUNKED 설정 시 영상을 시간 구간으로 나눠 엔진의 여러 프로세스에서 동시에 추론한다
+    (프로파일링 요청은 순차 추론, 진행 이벤트는 구간 추론이 끝날 때마다 progress, 단계 검출 후 phase/segment 발행).
+    """
+    task_results[task_id] = {"status": "processing"}
+    engine.progress.publish(task_id, {"event": "status", "status": "processing"})
+    timer = StageTimer()
+    if queued_at is not None:
+        timer.add("queue_wait", time.perf_counter() - queued_at)
+    try:
+        if keypoint_cache is not None and cache_key is None and profile is None and not session:
+            with timer.stage("cache_lookup"):
+                cache_key, landmarks = await lookup_keypoints(video_path, hand_type, prefetcher, keypoint_cache)
+            if landmarks is not None:
+                with timer.stage("detect"):
+                    step = await asyncio.to_thread(detect_phases, landmarks)
+                result = {"status": "step_completed", "step": step, "metrics": {"frames": len(landmarks)}}
+                with timer.stage("export"):
+                    result["keypoints"] = await export_keypoints(task_id, hand_type, landmarks, step)
+                record_result(task_results, task_id, result, timer)
+                engine.progress.publish(task_id, {"event": "result", **result})
+                logger.info(f"pose 작업 완료 : {task_id} -> {result['status']} (키포인트 캐시)")
+                return task_results[task_id]
+
+        # 프로파일링은 요청한 작업에만 (미지정 시 analyze_video 를 그대로 실행)
+        analysis = (analyze_video,) if profile is None else (run_profiled, profile, artifact_dir(PROFILE_DIR, task_id), analyze_video)
+
+        # download: 프리페치 슬롯 대기 + 임시 공간 대기 + 다운로드, analysis: 엔진 제출부터 결과 수신까지 (프로세스 간 전달 포함)
+        start = time.perf_counter()
+        async with prefetcher.fetch(video_path) as user_video_name:
+            timer.add("download", time.perf_counter() - start)
+            with timer.stage("analysis"):
+                if CHUNKED is not None and profile is None:
+                    result = await analyze_chunked(
+                        engine, user_video_name, hand_type, CHUNKED.get("chunks") or engine.max_workers,
+                        overlap_sec=CHUNKED.get("overlap_sec", 1.0), min_chunk_sec=CHUNKED.get("min_chunk_sec", 2.0),
+                        complexity=CHUNKED.get("complexity", 2),
+                        fps=DECODE_CONFIG.get("fps"), max_width=DECODE_CONFIG.get("max_width"),
+                        return_landmarks=cache_key is not None or KEYPOINT_DIR is not None,
+                        offline_smoothing=OFFLINE_SMOOTHING, session=session, progress_id=task_id,
+                    )
+                else:
+                    result = await engine.run(
+                        *analysis, user_video_name, hand_type,
+                        fps=DECODE_CONFIG.get("fps"), max_width=DECODE_CONFIG.get("max_width"),
+                        return_landmarks=cache_key is not None or KEYPOINT_DIR is not None, coarse_pass=COARSE_PASS, roi=ROI,
+                        online_smoothing=ONLINE_SMOOTHING, offline_smoothing=OFFLINE_SMOOTHING, progress_id=task_id,
+                        session=session,
+                    )
+        landmarks = result.pop("landmarks", None)
+        # 오프라인 재검출이 온라인 결과로 되돌아간 랜드마크는 캐시 적중 시 재검출 결과가 달라지고,
+        # 구간 병렬 추론이 순차 분석으로 대체된 랜드마크는 캐시 키의 모델 설정(CHUNKED)과 다르므로 저장하지 않음
+        metrics = result.get("metrics", {})
+        if landmarks is not None and cache_key is not None and not metrics.get("offline_fallback") and not metrics.get("chunked_fallback"):
+            with timer.stage("cache_store"):
+                await asyncio.to_thread(keypoint_cache.put, cache_key, landmarks)
+        if landmarks is not None:
+            with timer.stage("export"):
+                result["keypoints"] = await export_keypoints(task_id, hand_type, landmarks, result["step"])
+                # 경계가 정해진 스윙 구간별 키포인트 파일은 동시에 저장
+                if result.get("segments"):
+                    await export_segments(task_id, hand_type, landmarks, result["segments"])
+        record_result(task_results, task_id, result, timer)
     except Exception as e:
-        # 작업 실패 시 오류 저장
-        task_results[task_id] = {"status": "error", "error": str(e)}
-
+        # 작업 실패 시 오류 저장 (프로세스 비정상 종료 등)
+        record_result(task_results, task_id, {"status": "error", "error": str(e)}, timer)
+    # 진행 이벤트 구독자(/pose/events)에게 최종 결과 전달
+    engine.progress.publish(task_id, {"event": "result", **task_results[task_id]})
+    logger.info(f"pose 작업 완료 : {task_id} -> {task_results[task_id]['status']}")
     return task_results[task_id]
 
 @router.post("/pose")
-async def pose(request: video_info, background_tasks: BackgroundTasks, app: Request):
+async def pose(request: video_info, app: Request):
     """
     pose 추정 데이터 생성
     Args:
-        request ``video_info``: 받은 요청 데이터 (비디오 경로 및 손 타입)
+        request ``video_info``: 받은 요청 데이터 (비디오 경로, 손 타입, 우선순위)
     Returns:
+    Raises:
+        HTTPException: 알 수 없는 profile 이면 422, 대기열이 가득 찬 경우 429 (Retry-After 헤더 포함)
     """
+    if request.profile is not None and request.profile not in PROFILE_MODES:
+        raise HTTPException(status_code=422, detail=f"profile 은 {', '.join(PROFILE_MODES)} 중 하나여야 합니다")
 
     # request, config
     video_path, hand_type = request.url, request.handType
-    user_video_name = video_path.replace("/", "_")  # ex) username/videoname.mp4 -> username_videoname.mp4
     task_results = app.app.state.task_results
     task_id = video_path
-    task_results[task_id] = {"status": "processing"}
-
-    # video 다운로드
-    await download_file_async(S3_CONFIG.get("s3_bucket_name"), video_path, user_video_name)
-
-    # 20fps 변환
-    ffmpeg_command = (
-        f"ffmpeg -i {user_video_name} "
-        f"-an -c:v libx264 "
-        f"-r 20 "
-        f"-vf \"setpts=N/(20*TB)\" "
-        f"-y {user_video_name} -loglevel error"
-    )
-    await run_ffmpeg_async(ffmpeg_command)
-
-    # 백그라운드 작업 추가
-    background_tasks.add_task(mp_background, task_id, user_video_name, hand_type, task_results)
-    return {"task_id": task_id, "message": "Processing started"}
+    scheduler = app.app.state.scheduler
+
+    # 스케줄러 대기열에 등록 (다운로드는 앞선 작업의 추론과 겹쳐 진행, 디코딩은 ffmpeg 파이프로 스트리밍)
+    # 등록 직후 워커가 먼저 "processing" 으로 바꿀 수 있으므로 상태를 미리 기록
+    previous = task_results.get(task_id)
+    task_results[task_id] = {"status": "queued"}
+    try:
+        position = await scheduler.submit(
+            task_id, mp_background, task_id, video_path, hand_type, task_results,
+            app.app.state.engine, app.app.state.prefetcher, app.app.state.keypoint_cache, None, time.perf_counter(),
+            request.profile, request.session, priority=request.priority,
+        )
+    except QueueFull as e:
+        if previous is None:
+            task_results.delete(task_id)
+        else:
+            task_results[task_id] = previous
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    return {
+        "task_id": task_id,
+        "message": "Processing started",
+        "position": position,
+        "estimated_wait_sec": round(scheduler.estimated_wait(position), 1),
+    }
@@ -0,0 +1,224 @@
+import asyncio
+import shutil
+import time
+import uuid
+from collections import Counter
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel
+
+from utils.phase import detect_phases
+from utils.scheduler import QueueFull
+from utils.keypoint_export import export_path
+from utils.profiling import PROFILE_MODES
+from routers.pose import KEYPOINT_DIR, video_info, lookup_keypoints, mp_background, export_keypoints
+
+# 완료로 보는 작업 상태 (expired: 결과 보존 시간이 지나 조회 불가)
+FINAL_STATUSES = ("step_completed", "error", "expired")
+
+class batch_info(BaseModel):
+    items: list[video_info]
+    priority: int = 0  # 클수록 먼저 분석 (항목별 priority 대신 사용)
+
+router = APIRouter()
+
+def batch_key(batch_id: str) -> str:
+    return f"batch:{batch_id}"
+
+def copy_keypoints(source_id, task_id, result):
+    """
+    공유한 분석 결과의 키포인트 파일(세션 모드 스윙 구간 파일 포함)을 다른 작업 ID 로 복사 (블로킹)
+    """
+    shutil.copyfile(export_path(KEYPOINT_DIR, source_id), export_path(KEYPOINT_DIR, task_id))
+    for index, segment in enumerate(result.get("segments") or []):
+        if segment.get("keypoints"):
+            shutil.copyfile(export_path(KEYPOINT_DIR, source_id, index), export_path(KEYPOINT_DIR, task_id, index))
+
+async def mp_batch_item(batch_id, task_ids, video_path, hand_type, task_results, engine, prefetcher, keypoint_cache=None, cache_key=None, queued_at=None, session=False, profile=None):
+    """
+    배치 안에서 내용이 같은 항목들을 한 번만 분석하고 결과를 모든 항목에 기록.
+    Args:
+        batch_id (str): 배치 ID (마지막 완료 시각 기록).
+        task_ids (list[str]): 같은 분석 결과를 공유하는 작업 ID (첫 번째로 분석).
+        나머지 인자는 ``mp_background`` 와 같음.
+    """
+    for task_id in task_ids[1:]:
+        task_results[task_id] = {"status": "processing"}
+        engine.progress.publish(task_id, {"event": "status", "status": "processing"})
+    result = await mp_background(
+        task_ids[0], video_path, hand_type, task_results,
+        engine, prefetcher, keypoint_cache, cache_key, queued_at, profile=profile, session=session,
+    )
+    for task_id in task_ids[1:]:
+        # 키포인트 파일은 작업 ID 별로 저장
+        member = result
+        if result.get("keypoints"):
+            try:
+                await asyncio.to_thread(copy_keypoints, task_ids[0], task_id, result)
+            except Exception as e:
+                member = {"status": "error", "error": str(e)}
+        task_results[task_id] = member
+        engine.progress.publish(task_id, {"event": "result", **member})
+    batch = task_results.get(batch_key(batch_id))
+    if batch is not None:
+        task_results[batch_key(batch_id)] = {**batch, "updated_at": time.time()}
+
+async def cached_item(task_id, hand_type, landmarks):
+    """
+    캐시 적중 항목의 단계 검출(스레드에서 실행) + 키포인트 파일 저장. 실패하면 이 항목만 오류로 기록한다.
+    Returns:
+        dict: 항목 결과
+    """
+    try:
+        step = await asyncio.to_thread(detect_phases, landmarks)
+        keypoints = await export_keypoints(task_id, hand_type, landmarks, step)
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+    return {"status": "step_completed", "step": step, "keypoints": keypoints}
+
+@router.post("/pose/batch")
+async def pose_batch(request: batch_info, app: Request):
+    """
+    여러 영상의 pose 추정을 한 번에 요청.
+    모든 항목의 내용 식별자/키포인트 캐시를 동시에 조회해 적중한 항목은 바로 완료하고,
+    같은 내용(+ handType)의 항목은 한 번만 분석하며, 나머지는 한꺼번에 대기열에 넣어
+    다운로드(프리페치)와 추론이 항목 간에 겹쳐 진행되게 한다 (session/profile 항목은 캐시 없이 각각 분석).
+    Args:
+        request ``batch_info``: 항목 목록 (비디오 경로, 손 타입)과 우선순위
+    Returns:
+        dict: batch_id 와 항목별 초기 상태
+    Raises:
+        HTTPException: 알 수 없는 profile, 같은 url 에 다른 handType/session/profile 이 있거나 대기열보다 큰 배치면 422,
+            대기열 자리가 부족하면 429 (Retry-After 헤더 포함)
+    """
+    state = app.app.state
+    task_results, scheduler, keypoint_cache = state.task_results, state.scheduler, state.keypoint_cache
+
+    # task_id 는 /pose 와 같이 url (같은 url 은 한 항목)
+    hand_types, sessions, profiles = {}, {}, {}
+    for item in request.items:
+        if item.profile is not None and item.profile not in PROFILE_MODES:
+            raise HTTPException(status_code=422, detail=f"{item.url}: profile 은 {', '.join(PROFILE_MODES)} 중 하나여야 합니다")
+        if hand_types.setdefault(item.url, item.handType) != item.handType:
+            raise HTTPException(status_code=422, detail=f"{item.url}: 같은 영상에 다른 handType 이 지정되었습니다")
+        if sessions.setdefault(item.url, item.session) != item.session:
+            raise HTTPException(status_code=422, detail=f"{item.url}: 같은 영상에 다른 session 이 지정되었습니다")
+        if profiles.setdefault(item.url, item.profile) != item.profile:
+            raise HTTPException(status_code=422, detail=f"{item.url}: 같은 영상에 다른 profile 이 지정되었습니다")
+    if not hand_types:
+        raise HTTPException(status_code=422, detail="items 가 비어 있습니다")
+
+    # 캐시 조회 (저장소 HEAD 요청을 항목 간에 동시에 진행, session/profile 항목은 조회하지 않음)
+    task_ids = list(hand_types)
+    lookups: list = [(None, None)] * len(task_ids)
+    if keypoint_cache is not None:
+        cached = [task_id for task_id in task_ids if not sessions[task_id] and profiles[task_id] is None]
+        found = await asyncio.gather(
+            *(lookup_keypoints(task_id, hand_types[task_id], state.prefetcher, keypoint_cache) for task_id in cached),
+            return_exceptions=True,
+        )
+        found = dict(zip(cached, found))
+        lookups = [found.get(task_id, (None, None)) for task_id in task_ids]
+
+    # 캐시 적중/조회 실패 항목은 바로 기록 (적중 항목의 단계 검출은 동시에), 나머지는 내용이 같은 항목끼리 묶음
+    finished, hits, groups = {}, {}, {}
+    for task_id, lookup in zip(task_ids, lookups):
+        if isinstance(lookup, Exception):
+            finished[task_id] = {"status": "error", "error": str(lookup)}
+            continue
+        cache_key, landmarks = lookup
+        if landmarks is not None:
+            hits[task_id] = landmarks
+            continue
+        groups.setdefault(cache_key or (task_id, hand_types[task_id]), []).append(task_id)
+    if len(groups) > scheduler.max_queue:
+        raise HTTPException(status_code=422, detail=f"한 배치에서 분석할 영상은 최대 {scheduler.max_queue}개입니다")
+
+    finished.update(zip(hits, await asyncio.gather(
+        *(cached_item(task_id, hand_types[task_id], landmarks) for task_id, landmarks in hits.items())
+    )))
+
+    batch_id = uuid.uuid4().hex
+    jobs = [
+        (
+            members[0], mp_batch_item,
+            (
+                batch_id, members, members[0], hand_types[members[0]], task_results,
+                state.engine, state.prefetcher, keypoint_cache, key if isinstance(key, str) else None,
+                time.perf_counter(), sessions[members[0]], profiles[members[0]],
+            ),
+        )
+        for key, members in groups.items()
+    ]
+    # 등록 직후 워커가 먼저 "processing" 으로 바꿀 수 있으므로 상태를 미리 기록
+    previous = {task_id: task_results.get(task_id) for members in groups.values() for task_id in members}
+    for task_id in previous:
+        task_results[task_id] = {"status": "queued"}
+    now = time.time()
+    task_results[batch_key(batch_id)] = {"status": "batch", "items": task_ids, "created_at": now, "updated_at": now}
+    try:
+        positions = await scheduler.submit_many(jobs, priority=request.priority)
+    except QueueFull as e:
+        for task_id, value in previous.items():
+            if value is None:
+                task_results.delete(task_id)
+            else:
+                task_results[task_id] = value
+        task_results.delete(batch_key(batch_id))
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+    for task_id, result in finished.items():
+        task_results[task_id] = result
+
+    items = dict(finished)
+    for (_, members), position in zip(groups.items(), positions):
+        for task_id in members:
+            items[task_id] = {
+                "status": "queued",
+                "position": position,
+                "estimated_wait_sec": round(scheduler.estimated_wait(position), 1),
+            }
+    return {
+        "batch_id": batch_id,
+        "message": "Processing started",
+        "total": len(task_ids),
+        "queued_jobs": len(jobs),
+        "items": {task_id: items[task_id] for task_id in task_ids},
+    }
+
+@router.get("/pose/batch/{batch_id}")
+async def pose_batch_status(batch_id: str, app: Request):
+    """
+    배치 진행 상황 (항목별 상태, 상태별 개수, 완료율, 처리량)
+    Args:
+        batch_id (str): ``/pose/batch`` 가 반환한 배치 ID.
+    Raises:
+        HTTPException: 배치가 없거나 만료된 경우 404
+    """
+    task_results, scheduler = app.app.state.task_results, app.app.state.scheduler
+    batch = task_results.get(batch_key(batch_id))
+    if batch is None:
+        raise HTTPException(status_code=404, detail=f"{batch_id}: 배치를 찾을 수 없습니다")
+
+    items = {}
+    for task_id in batch["items"]:
+        result = task_results.get(task_id) or {"status": "expired"}
+        if result.get("status") == "queued":
+            result = {**result, **(scheduler.status(task_id) or {})}
+        items[task_id] = result
+
+    counts = Counter(result["status"] for result in items.values())
+    done = sum(counts[status] for status in FINAL_STATUSES)
+    # 처리량은 마지막 항목 완료 시각 기준 (완료 후 조회해도 줄어들지 않음)
+    elapsed = (batch["updated_at"] if done == len(items) else time.time()) - batch["created_at"]
+    return {
+        "batch_id": batch_id,
+        "status": "completed" if done == len(items) else "processing",
+        "total": len(items),
+        "completed": counts["step_completed"],
+        "failed": counts["error"],
+        "progress": round(done / len(items), 3),
+        "counts": dict(counts),
+        "elapsed_sec": round(elapsed, 1),
+        "videos_per_minute": round(done / elapsed * 60, 1) if elapsed > 0 else None,
+        "items": items,
+    }
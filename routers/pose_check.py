@@ -1,10 +1,30 @@
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Request
 
 router = APIRouter()
 
 @router.get("/pose_check")
-async def get_all_task_results(app: Request):
+async def get_task_results(app: Request, task_id: str | None = None):
     """
-    모든 task_results 반환.
+    작업 결과 조회 (만료되지 않은 결과).
+    이 워커의 대기열에 있는 작업은 현재 대기열 위치와 예상 대기 시간을 포함한다.
+    Args:
+        task_id (str | None): 지정 시 해당 작업의 결과 하나만 반환 (폴링 클라이언트용).
+            생략하면 모든 task_results 를 반환한다.
+    Raises:
+        HTTPException: task_id 의 작업이 없으면 404
     """
-    return app.app.state.task_results
\ No newline at end of file
+    task_results = app.app.state.task_results
+    scheduler = app.app.state.scheduler
+    if task_id is not None:
+        result = task_results.get(task_id)
+        if result is None:
+            raise HTTPException(status_code=404, detail=f"{task_id}: 작업을 찾을 수 없습니다")
+        if result.get("status") == "queued":
+            result = {**result, **(scheduler.status(task_id) or {})}
+        return result
+
+    # 메모리 저장소는 저장된 dict 를 그대로 반환하므로 복사해서 대기열 정보를 합친다
+    return {
+        key: {**result, **(scheduler.status(key) or {})} if result.get("status") == "queued" else result
+        for key, result in task_results.all().items()
+    }
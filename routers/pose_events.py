@@ -0,0 +1,93 @@
+import asyncio
+import json
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from routers.pose_batch import FINAL_STATUSES
+
+# 진행 이벤트가 없을 때 작업 상태(대기열 위치, 다른 워커에서 끝난 결과)를 다시 확인하는 간격(초)
+POLL_SEC = 1.0
+# 연결 유지용 주석 전송 간격(초)
+KEEPALIVE_SEC = 15.0
+
+router = APIRouter()
+
+def sse(event: dict) -> str:
+    """
+    Server-Sent Events 메시지 (event: 이름, data: JSON)
+    """
+    return f"event: {event['event']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+def current_status(state, task_id: str) -> dict:
+    """
+    작업 저장소의 현재 상태 (대기 중이면 이 워커의 대기열 위치/예상 대기 시간 포함, 없으면 expired)
+    """
+    result = state.task_results.get(task_id) or {"status": "expired"}
+    if result.get("status") == "queued":
+        result = {**result, **(state.scheduler.status(task_id) or {})}
+    return result
+
+async def task_events(state, task_id: str):
+    """
+    작업 하나의 진행 이벤트 스트림.
+    현재 상태(status)와 지금까지의 진행(progress/phase)을 먼저 보내고, 이후 이벤트를 그대로 전달하며
+    result 이벤트(최종 결과)를 보낸 뒤 종료한다.
+    다른 워커에서 실행 중인 작업은 진행 이벤트 없이 상태 변화와 최종 결과만 전달된다.
+    """
+    hub = state.engine.progress
+    with hub.subscribe(task_id) as events:
+        status = None
+        idle = 0.0
+        snapshot = hub.snapshot(task_id)
+        if snapshot is not None:
+            yield sse(snapshot)
+        while True:
+            # 처음과 이벤트가 없을 때만 저장소 상태 확인 (구독 후 확인하므로 그 사이의 결과도 놓치지 않음)
+            result = current_status(state, task_id)
+            if result.get("status") in FINAL_STATUSES:
+                yield sse({"event": "result", **result})
+                return
+            if result != status:
+                status = result
+                yield sse({"event": "status", **result})
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(events.get(), POLL_SEC)
+                except asyncio.TimeoutError:
+                    idle += POLL_SEC
+                    if idle >= KEEPALIVE_SEC:
+                        idle = 0.0
+                        yield ": keep-alive\n\n"
+                    break
+                idle = 0.0
+                yield sse(event)
+                if event["event"] == "result":
+                    return
+                # 같은 상태를 다시 보내지 않도록 발행된 상태를 기록
+                if event["event"] == "status":
+                    status = {"status": event["status"]}
+
+@router.get("/pose/events")
+async def pose_events(task_id: str, app: Request):
+    """
+    작업 진행 이벤트 스트림 (text/event-stream, ``/pose_check`` 폴링 대체).
+    이벤트:
+        status: 작업 상태 변화 (queued 는 position, estimated_wait_sec 포함)
+        progress: 처리한 frame / 예상 전체 frame (total), 지금까지 검출된 단계별 frame (phases)
+        phase: 새 단계 진입 (phase, frame). top 등 같은 단계의 frame 갱신은 이후 progress 의 phases 에 반영
+        segment: 세션 모드에서 스윙 하나 완료 (index, step, start, end, start_sec, end_sec)
+        result: 최종 결과 (``/pose_check`` 와 같은 형식), 전송 후 스트림 종료
+    Args:
+        task_id (str): 작업 ID (``/pose`` 요청의 url).
+    Raises:
+        HTTPException: 작업이 없으면 404
+    """
+    state = app.app.state
+    if state.task_results.get(task_id) is None:
+        raise HTTPException(status_code=404, detail=f"{task_id}: 작업을 찾을 수 없습니다")
+    return StreamingResponse(
+        task_events(state, task_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,34 @@
+import os
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+
+from utils.profiling import artifact_dir
+from routers.pose import PROFILE_DIR
+
+router = APIRouter()
+
+@router.get("/profile")
+async def get_profile(task_id: str, app: Request, file: str | None = None):
+    """
+    profile 을 지정해 요청한 작업의 프로파일 결과 조회/다운로드.
+    Args:
+        task_id (str): 작업 ID (``/pose`` 요청의 url).
+        file (str | None): 결과 파일 이름 (analysis.pstats, analysis.txt, analysis.collapsed).
+            생략하면 작업 상태와 결과 파일 목록을 반환한다.
+    Raises:
+        HTTPException: 작업이나 프로파일 결과가 없으면 404
+    """
+    result = app.app.state.task_results.get(task_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"{task_id}: 작업을 찾을 수 없습니다")
+    profile = result.get("profile")
+    if file is None:
+        return {"task_id": task_id, "status": result.get("status"), "profile": profile}
+
+    # 결과 파일 목록에 있는 이름만 허용 (경로 조작 방지)
+    if profile is None or file not in profile["artifacts"]:
+        raise HTTPException(status_code=404, detail=f"{task_id}: 프로파일 결과 {file} 이 없습니다")
+    path = os.path.join(artifact_dir(PROFILE_DIR, task_id), file)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail=f"{task_id}: 프로파일 결과 {file} 이 삭제되었습니다")
+    return FileResponse(path, filename=f"{task_id.replace('/', '_')}.{file}")
@@ -0,0 +1,22 @@
+import time
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+router = APIRouter()
+
+@router.get("/ready", summary="Readiness Endpoint", description="분석 프로세스 모델 로딩/워밍업 완료 여부")
+async def ready(app: Request):
+    """
+    현재 워커의 준비 상태 (readiness probe 용).
+    분석 프로세스 기동과 모델 로딩/워밍업이 끝나기 전이나 실패한 경우 503, 끝나면 200.
+    `/` 는 워커가 요청을 받는지(liveness)만 확인한다.
+    """
+    state = app.app.state
+    startup = state.startup
+    if not startup.done():
+        return JSONResponse(status_code=503, content={"status": "starting", "elapsed_sec": round(time.perf_counter() - state.started_at, 3)})
+    if startup.cancelled() or startup.exception() is not None:
+        detail = "cancelled" if startup.cancelled() else repr(startup.exception())
+        return JSONResponse(status_code=503, content={"status": "failed", "detail": detail})
+    return {"status": "ready", "ready_sec": round(state.ready_sec, 3), "workers": list(state.workers.values())}
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# utils.landmark 는 import 시 keypoints.yaml 을 상대 경로로 읽으므로 저장소 루트에서 실행
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
@@ -0,0 +1,122 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import utils.analysis as analysis
+from utils.analysis import analyze_video
+from utils.chunked import replay
+from utils.landmark import STRING_MATCH_INDEX
+
+from test_phase import ADDRESS, SWING, TAIL, trajectory
+
+class FakeModel:
+    """
+    frame index 를 입력으로 받아 미리 만든 랜드마크를 Mediapipe 결과 형식으로 반환 (1x1 프레임 기준 좌표)
+    """
+
+    def __init__(self, landmarks: np.ndarray, detected: np.ndarray):
+        self.landmarks = landmarks
+        self.detected = detected
+
+    def process(self, frame: int):
+        if not self.detected[frame]:
+            return SimpleNamespace(pose_landmarks=None, pose_world_landmarks=None)
+        image = [SimpleNamespace(x=0.0, y=0.0) for _ in range(33)]
+        world = [SimpleNamespace(x=0.0, z=0.0) for _ in range(33)]
+        for joint, index in enumerate(STRING_MATCH_INDEX):
+            x, y, z_norm, x_norm = self.landmarks[frame, joint].tolist()
+            image[index] = SimpleNamespace(x=x, y=y)
+            world[index] = SimpleNamespace(x=x_norm, z=z_norm)
+        return SimpleNamespace(
+            pose_landmarks=SimpleNamespace(landmark=image), pose_world_landmarks=SimpleNamespace(landmark=world),
+        )
+
+    def reset(self):
+        pass
+
+class FakePool:
+    def __init__(self, model: FakeModel):
+        self.model = model
+        self.checked_out = 0
+
+    @contextmanager
+    def checkout(self, complexity: int, timeout: float | None = None):
+        self.checked_out += 1
+        try:
+            yield self.model
+        finally:
+            self.checked_out -= 1
+
+@pytest.fixture
+def video(monkeypatch):
+    """
+    (landmarks, detected) 를 프레임으로 디코딩하는 가짜 영상 설정
+    """
+    def setup(landmarks: np.ndarray, detected: np.ndarray) -> FakePool:
+        info = {"width": 1, "height": 1, "fps": 30.0, "frame_count": len(landmarks)}
+        monkeypatch.setattr(analysis, "probe_video", lambda path: info)
+        monkeypatch.setattr(analysis, "iter_frames", lambda path, **kwargs: (frame for frame in range(len(landmarks))))
+        return FakePool(FakeModel(landmarks, detected))
+    return setup
+
+def with_gaps(landmarks: np.ndarray, *frames: int) -> np.ndarray:
+    detected = np.ones(len(landmarks), dtype=bool)
+    detected[list(frames)] = False
+    return detected
+
+@pytest.mark.parametrize("online_smoothing", ["vectorized", "scalar"])
+@pytest.mark.parametrize("offline_smoothing", [None, {"method": "one_euro"}])
+def test_analyze_video_matches_replay(video, online_smoothing, offline_smoothing):
+    landmarks = trajectory(ADDRESS * 3, SWING, TAIL * 3)
+    # 스윙 전/중 미검출 프레임 포함
+    detected = with_gaps(landmarks, 2, len(ADDRESS) * 3 + 4)
+    pool = video(landmarks, detected)
+
+    result = analyze_video(
+        "video.mp4", "R", model_pool=pool, return_landmarks=True,
+        online_smoothing=online_smoothing, offline_smoothing=offline_smoothing,
+    )
+    expected = replay(landmarks, detected, 30.0, offline_smoothing)
+    assert result["status"] == "step_completed"
+    assert result["step"] == expected["step"]
+    assert "finish" in result["step"]
+    np.testing.assert_allclose(result["landmarks"], expected["landmarks"], rtol=0, atol=1e-4)
+    assert result["metrics"]["none_frames"] == expected["metrics"]["none_frames"] == 2
+    assert pool.checked_out == 0
+
+def test_session_matches_replay(video, monkeypatch):
+    events = []
+    monkeypatch.setattr(analysis, "report", lambda task_id, event, **data: events.append((event, data)))
+    landmarks = np.concatenate([trajectory(ADDRESS, SWING, TAIL)] * 3)
+    detected = with_gaps(landmarks, 1, 26)
+    pool = video(landmarks, detected)
+
+    result = analyze_video("video.mp4", "R", model_pool=pool, return_landmarks=True, session=True, progress_id="task")
+    expected = replay(landmarks, detected, 30.0, session=True)
+    assert result["segments"] == expected["segments"]
+    assert len(result["segments"]) == 3
+    assert result["step"] == expected["step"] == result["segments"][0]["step"]
+    np.testing.assert_allclose(result["landmarks"], expected["landmarks"], rtol=0, atol=1e-4)
+
+    # 스윙마다 segment 이벤트, 단계 이벤트의 frame 은 검출 단계와 같음
+    segments = [data for event, data in events if event == "segment"]
+    assert [data.pop("index") for data in segments] == [0, 1, 2]
+    assert segments == result["segments"]
+    phases = [(data["phase"], data["frame"]) for event, data in events if event == "phase"]
+    assert ("finish", result["segments"][1]["end"]) in phases
+
+def test_setup_error_returns_models(video, monkeypatch):
+    landmarks = trajectory(ADDRESS, SWING, TAIL)
+    pool = video(landmarks, with_gaps(landmarks))
+
+    def probe_error(path):
+        raise RuntimeError("ffprobe 실패")
+    monkeypatch.setattr(analysis, "probe_video", probe_error)
+
+    result = analyze_video("video.mp4", "R", model_pool=pool)
+    assert result["status"] == "error"
+    assert result["error"] == "ffprobe 실패"
+    assert result["metrics"]["frames"] == 0
+    assert pool.checked_out == 0
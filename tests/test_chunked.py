@@ -0,0 +1,86 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+import utils.chunked as chunked
+from utils.chunked import analyze_chunked, infer_chunk, plan_chunks, replay
+
+from test_phase import ADDRESS, SWING, TAIL, streaming_steps, trajectory
+
+class Progress:
+    def __init__(self):
+        self.events = []
+
+    def publish(self, task_id, event):
+        self.events.append(event)
+
+class FakeEngine:
+    """
+    구간 추론(``infer_chunk``)은 미리 만든 랜드마크 배열을 잘라 반환하고, 나머지는 그대로 실행하는 엔진
+    """
+
+    def __init__(self, landmarks: np.ndarray, short_chunk: int | None = None):
+        self.landmarks = landmarks
+        self.short_chunk = short_chunk
+        self.progress = Progress()
+        self.calls = []
+
+    async def run(self, fn, *args, **kwargs):
+        self.calls.append(fn.__name__)
+        if fn is infer_chunk:
+            _, _, warmup_start, start, end = args[:5]
+            end = len(self.landmarks) if end is None else end
+            if start == self.short_chunk:
+                end -= 1
+            rows = self.landmarks[start:end]
+            return {
+                "landmarks": rows.copy(), "detected": np.ones(len(rows), dtype=bool),
+                "metrics": {"stages": {"decode": 0.0, "inference": 0.0}, "warmup_frames": start - warmup_start},
+            }
+        if fn.__name__ == "analyze_video":
+            return {"status": "step_completed", "step": {}, "metrics": {"stages": {"inference_full": 0.0}}}
+        return fn(*args, **kwargs)
+
+@pytest.fixture
+def swing(monkeypatch):
+    landmarks = trajectory(ADDRESS * 20, SWING, TAIL * 20)
+    info = {"width": 400, "height": 400, "fps": 30.0, "frame_count": len(landmarks)}
+    monkeypatch.setattr(chunked, "probe_video", lambda path: info)
+    return landmarks
+
+def test_plan_chunks():
+    assert plan_chunks(100, 4, overlap=10) == [(0, 0, 25), (15, 25, 50), (40, 50, 75), (65, 75, None)]
+    # 짧은 영상은 구간 수를 줄임
+    assert plan_chunks(100, 4, overlap=10, min_frames=40) == [(0, 0, 50), (40, 50, None)]
+
+def test_replay_stops_at_finish(swing):
+    result = replay(swing, np.ones(len(swing), dtype=bool), 30.0)
+    step = result["step"]
+    assert list(step) == list(streaming_steps(swing))
+    assert len(result["landmarks"]) == step["finish"] + 1
+    # 스윙 전 프레임은 보정하지 않음
+    assert np.array_equal(result["landmarks"][:step["address"] + 1], swing[:step["address"] + 1])
+
+def test_analyze_chunked_progress_per_chunk(swing):
+    engine = FakeEngine(swing)
+    result = asyncio.run(analyze_chunked(engine, "video.mp4", "R", chunks=3, overlap_sec=0.1, min_chunk_sec=0.5, progress_id="task"))
+    # 구간을 이어 붙인 결과는 영상 전체를 한 번에 보정/검출한 결과와 같음
+    assert result["step"] == replay(swing, np.ones(len(swing), dtype=bool), 30.0)["step"]
+    assert result["metrics"]["chunks"] == 3 and "chunked_fallback" not in result["metrics"]
+
+    progress = [event for event in engine.progress.events if event["event"] == "progress"]
+    assert len(progress) == 3
+    assert [event["frame"] for event in progress][-1] == len(swing)
+    assert all(event["total"] == len(swing) for event in progress)
+    phases = [event for event in engine.progress.events if event["event"] == "phase"]
+    assert {event["phase"]: event["frame"] for event in phases} == result["step"]
+
+def test_analyze_chunked_falls_back_on_frame_mismatch(swing):
+    # 가운데 구간이 1 frame 짧으면 이어 붙인 frame index 가 밀리므로 순차 분석
+    plan = plan_chunks(len(swing), 3, overlap=3, min_frames=15)
+    engine = FakeEngine(swing, short_chunk=plan[1][1])
+    result = asyncio.run(analyze_chunked(engine, "video.mp4", "R", chunks=3, overlap_sec=0.1, min_chunk_sec=0.5))
+    assert engine.calls[-1] == "analyze_video" and "replay" not in engine.calls
+    assert result["metrics"]["chunked_fallback"] == 1
+    assert "inference_chunks" in result["metrics"]["stages"]
@@ -0,0 +1,36 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from utils.keypoint_cache import KeypointCache
+
+def landmarks(value: float, frames: int = 50) -> np.ndarray:
+    return np.full((frames, 17, 4), value, dtype=np.float32)
+
+def test_put_get(tmp_path):
+    cache = KeypointCache(root=str(tmp_path))
+    key = KeypointCache.key("sha256:abc", "R", {"fps": None})
+    assert cache.get(key) is None
+    cache.put(key, landmarks(1.0))
+    assert np.array_equal(cache.get(key), landmarks(1.0))
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+def test_concurrent_put_same_key(tmp_path):
+    # 같은 워커에서 같은 내용 키를 동시에 저장 (asyncio.to_thread 로 호출되는 경우)
+    cache = KeypointCache(root=str(tmp_path))
+    key = KeypointCache.key("sha256:abc", "R", {"fps": None})
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: cache.put(key, landmarks(float(i % 2))), range(64)))
+    assert cache.get(key)[0, 0, 0] in (0.0, 1.0)
+    assert sorted(os.listdir(tmp_path)) == [f"{key}.npy"]
+
+def test_evict_oldest(tmp_path):
+    size = landmarks(0.0).nbytes
+    cache = KeypointCache(root=str(tmp_path), max_bytes=int(size * 2.5))
+    for i in range(3):
+        cache.put(f"key{i}", landmarks(float(i)))
+        os.utime(tmp_path / f"key{i}.npy", (i, i))
+    cache.evict()
+    assert cache.get("key0") is None
+    assert cache.get("key2") is not None
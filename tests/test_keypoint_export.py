@@ -0,0 +1,47 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from utils.keypoint_export import export_path, load_keypoints, sweep_exports, write_keypoints
+from utils.result_store import MemoryResultStore
+
+def landmarks(value: float, frames: int = 40) -> np.ndarray:
+    return np.full((frames, 17, 4), value, dtype=np.float32)
+
+def test_write_load(tmp_path):
+    path = export_path(str(tmp_path), "user/video.mp4")
+    write_keypoints(path, landmarks(2.0), task_id="user/video.mp4", step={"address": 3})
+    header, array = load_keypoints(path)
+    assert header["task_id"] == "user/video.mp4" and header["step"] == {"address": 3}
+    assert np.array_equal(array, landmarks(2.0))
+
+def test_concurrent_write_same_task(tmp_path):
+    # task_id 는 url 이라 같은 작업을 다시 요청하면 같은 파일을 동시에 저장할 수 있음
+    path = export_path(str(tmp_path), "user/video.mp4")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: write_keypoints(path, landmarks(float(i % 2))), range(64)))
+    assert load_keypoints(path)[1][0, 0, 0] in (0.0, 1.0)
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+def test_export_path_collision_free(tmp_path):
+    task_ids = ["a/b.mp4", "a_b.mp4", "a%2Fb.mp4", ".", "..", "x" * 500, "x" * 501]
+    paths = {export_path(str(tmp_path), task_id) for task_id in task_ids}
+    paths |= {export_path(str(tmp_path), "a/b.mp4", segment) for segment in range(3)}
+    assert len(paths) == len(task_ids) + 3
+    assert all(os.path.dirname(path) == str(tmp_path) for path in paths)
+
+def test_sweep_exports(tmp_path):
+    root = str(tmp_path)
+    store = MemoryResultStore()
+    store["kept.mp4"] = {"status": "step_completed"}
+    for task_id in ("kept.mp4", "gone.mp4", "old.mp4"):
+        write_keypoints(export_path(root, task_id), landmarks(0.0))
+    write_keypoints(export_path(root, "gone.mp4", 0), landmarks(0.0))
+    store["old.mp4"] = {"status": "step_completed"}
+    old = time.time() - 100
+    os.utime(export_path(root, "old.mp4"), (old, old))
+
+    assert sweep_exports(root, ttl_sec=50, task_results=store) == 3
+    assert os.listdir(root) == [os.path.basename(export_path(root, "kept.mp4"))]
@@ -0,0 +1,80 @@
+import re
+
+from utils.metrics import MetricsRegistry, StageTimer
+
+# exposition format 0.0.4 의 sample 줄: 이름{label="값",...} 값
+SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{((?:[a-zA-Z_][a-zA-Z0-9_]*="[^"]*",?)*)\})? (\S+)$')
+
+def parse(text: str) -> tuple[dict[str, str], list[tuple[str, dict[str, str], float]]]:
+    """
+    Prometheus 텍스트를 (metric family -> TYPE, sample 목록) 으로 읽으며 형식 검사
+    """
+    assert text.endswith("\n")
+    types, samples = {}, []
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            _, _, name, kind = line.split(" ")
+            assert kind in ("counter", "gauge", "histogram")
+            assert name not in types, f"TYPE 중복: {name}"
+            types[name] = kind
+        elif line.startswith("# HELP "):
+            continue
+        else:
+            match = SAMPLE.match(line)
+            assert match, f"잘못된 sample 줄: {line}"
+            name, labels, value = match.groups()
+            labels = dict(re.findall(r'([a-zA-Z_][a-zA-Z0-9_]*)="([^"]*)"', labels or ""))
+            family = re.sub(r"_(bucket|sum|count)$", "", name) if name not in types else name
+            # sample 앞에 family 의 TYPE 이 있어야 함
+            assert family in types, f"TYPE 없는 sample: {name}"
+            samples.append((name, labels, float(value)))
+    return types, samples
+
+def test_render_exposition_format():
+    registry = MetricsRegistry()
+    timer = StageTimer()
+    timer.add("decode", 0.02)
+    timer.add("inference_heavy", 3.0)
+    timer.counters.update(frames=120, none_frames=3)
+    registry.record("step_completed", timer.summary())
+    registry.record("step_completed", {"stages": {"decode": 0.2}, "frames": 40, "none_frames": 0})
+    registry.record("error", {})
+
+    types, samples = parse(registry.render(
+        {"pose_scheduler_queued": 2, "pose_scheduler_avg_duration_seconds": None},
+        {"pose_scheduler_rejected_total": 5},
+    ))
+    assert types == {
+        "pose_tasks_total": "counter",
+        "pose_stage_seconds": "histogram",
+        "pose_task_frames": "histogram",
+        "pose_task_none_frames": "histogram",
+        "pose_scheduler_queued": "gauge",
+        "pose_scheduler_rejected_total": "counter",
+    }
+    values = {(name, tuple(sorted(labels.items()))): value for name, labels, value in samples}
+    assert values[("pose_tasks_total", (("status", "step_completed"),))] == 2
+    assert values[("pose_tasks_total", (("status", "error"),))] == 1
+    assert values[("pose_scheduler_queued", ())] == 2
+    assert values[("pose_scheduler_rejected_total", ())] == 5
+    # 값이 None 인 지표는 내보내지 않음
+    assert not any(name.startswith("pose_scheduler_avg") for name, _, _ in samples)
+    # counter 는 _total 로 끝남
+    assert all(name.endswith("_total") for name, kind in types.items() if kind == "counter")
+
+    # 히스토그램: label 별 버킷은 누적(단조 증가)이고 +Inf 버킷 == _count, _sum 은 관측값 합계
+    decode = [(labels["le"], value) for name, labels, value in samples if name == "pose_stage_seconds_bucket" and labels["stage"] == "decode"]
+    assert decode[-1][0] == "+Inf"
+    counts = [value for _, value in decode]
+    assert counts == sorted(counts)
+    assert dict(decode)["0.025"] == 1 and dict(decode)["0.25"] == 2
+    assert counts[-1] == values[("pose_stage_seconds_count", (("stage", "decode"),))] == 2
+    assert abs(values[("pose_stage_seconds_sum", (("stage", "decode"),))] - 0.22) < 1e-6
+    frames = {labels["le"]: value for name, labels, value in samples if name == "pose_task_frames_bucket"}
+    assert frames["25"] == 0 and frames["50"] == 1 and frames["250"] == 2 and frames["+Inf"] == 2
+    assert values[("pose_task_frames_count", ())] == 2
+
+def test_render_empty_registry():
+    types, samples = parse(MetricsRegistry().render())
+    assert types["pose_tasks_total"] == "counter"
+    assert samples == []
@@ -0,0 +1,228 @@
+import numpy as np
+import pytest
+
+from utils.detect import (
+    is_address, is_take_away, is_half, is_top, is_down_half, is_impact, is_follow_through, is_finish,
+    LEFT_WRIST, RIGHT_WRIST, LEFT_HIP, RIGHT_HIP, LEFT_SHOULDER, RIGHT_SHOULDER, RIGHT_KNEE, LEFT_ELBOW, RIGHT_ELBOW,
+)
+from utils.keypoint_export import write_keypoints
+from utils.landmark import CHANNELS, KEY_POINT_STRING, Y
+from utils.phase import PhaseDetector, detect_phases, detect_phases_batch, detect_segments
+
+# 오른손목 y (픽셀, 아래로 갈수록 큼) 궤적. 몸통은 고정: 어깨 y=100, 엉덩이 y=200, 무릎 y=300
+ADDRESS = [250.0] * 6
+SWING = [
+    190, 170,  # take_away (손목이 엉덩이 위)
+    100, 90, 80, 70, 75,  # half, top (손목 최고점), 꺾임
+    110, 150, 200, 240, 230,  # down_half, impact (손목 최저점), 꺾임
+    160, 120, 80, 40, 45,  # follow_through, finish_top, 꺾임
+    70,  # finish (finish_top 기준선보다 아래)
+]
+TAIL = [100.0] * 4
+
+def pose(wrist_y: float, wrist_x: float = 150.0) -> np.ndarray:
+    """
+    손목 y 만 바뀌는 (joints, 4) 랜드마크 (척추 각도 45도)
+    """
+    row = np.zeros((len(KEY_POINT_STRING), len(CHANNELS)), dtype=np.float32)
+    row[RIGHT_SHOULDER, :2] = (200, 100)
+    row[LEFT_SHOULDER, :2] = (210, 100)
+    row[RIGHT_HIP, :2] = (100, 200)
+    row[LEFT_HIP, :2] = (110, 200)
+    row[RIGHT_KNEE, :2] = (100, 300)
+    row[RIGHT_ELBOW, :2] = (150, 150)
+    row[LEFT_ELBOW, :2] = (160, 150)
+    row[RIGHT_WRIST, :2] = (wrist_x, wrist_y)
+    row[LEFT_WRIST, :2] = (wrist_x + 10, wrist_y)
+    return row
+
+def trajectory(*parts: list[float]) -> np.ndarray:
+    return np.stack([pose(y) for part in parts for y in part])
+
+def reference_steps(landmarks: np.ndarray) -> dict[str, int]:
+    """
+    기존 ``match detect_flow`` 상태 머신 (프레임마다 누적 배열 전체를 슬라이스)
+    """
+    detect_flow = "address"
+    step = {}
+    for frame in range(len(landmarks)):
+        PoseLandMark = landmarks[:frame + 1]
+        current_landmark = landmarks[frame]
+        match detect_flow :
+            case "address":
+                if frame>=3 :
+                    if is_address(current_landmark, PoseLandMark):
+                        step["address"] = frame
+                        detect_flow = "take_away"
+            case "take_away" :
+                if is_take_away(current_landmark) :
+                    step["take_away"] = frame
+                    detect_flow = "half"
+            case "half" :
+                if is_half(current_landmark) :
+                    step["half"] = frame
+                    detect_flow = "top"
+            case "top" :
+                if is_top(current_landmark, PoseLandMark, step["half"]) :
+                    step["top"] = frame
+                else :
+                    detect_flow = "donw_half"
+            case "donw_half" :
+                if is_down_half(current_landmark) :
+                    step["down_half"] = frame
+                    detect_flow = "impact"
+            case "impact" :
+                if is_impact(current_landmark, PoseLandMark, step["down_half"]) :
+                    step["impact"] = frame
+                else :
+                    detect_flow = "follow_through"
+            case "follow_through" :
+                if is_follow_through(current_landmark) :
+                    step["follow_through"] = frame
+                    detect_flow = "finish_top"
+            case "finish_top" :
+                if is_top(current_landmark, PoseLandMark, step["follow_through"]) :
+                    step["finish_top"] = frame
+                else :
+                    detect_flow = "finish"
+            case "finish" :
+                if is_finish(current_landmark, PoseLandMark, step["finish_top"]) :
+                    step["finish"] = frame
+                    return step
+        if detect_flow != "address":
+            if is_address(current_landmark, PoseLandMark):
+                step = {"address": frame}
+                detect_flow = "take_away"
+    return step
+
+def streaming_steps(landmarks: np.ndarray) -> dict[str, int]:
+    detector = PhaseDetector()
+    for current_landmark in landmarks:
+        detector.update(current_landmark)
+        if detector.finished:
+            break
+    return detector.step
+
+def all_steps(landmarks: np.ndarray) -> list:
+    """
+    세 방식의 결과 (예외는 예외 종류와 메시지로 비교)
+    """
+    results = []
+    for fn in (reference_steps, streaming_steps, detect_phases):
+        try:
+            results.append(fn(landmarks))
+        except KeyError as e:
+            results.append(("KeyError", str(e)))
+    return results
+
+def test_full_swing():
+    landmarks = trajectory(ADDRESS, SWING, TAIL)
+    expected = {
+        "address": 5, "take_away": 6, "half": 8, "top": 11, "down_half": 13, "impact": 16,
+        "follow_through": 18, "finish_top": 21, "finish": 23,
+    }
+    assert all_steps(landmarks) == [expected] * 3
+
+def test_re_address():
+    # top 직후 다시 address 자세로 돌아가 처음부터 스윙
+    landmarks = trajectory(ADDRESS, SWING[:5], [250.0] * 4, SWING, TAIL)
+    reference, streaming, vectorized = all_steps(landmarks)
+    assert reference == streaming == vectorized
+    assert reference["address"] > len(ADDRESS) + 5
+    assert "finish" in reference
+
+def test_no_finish_top():
+    # follow_through 직후 손목이 내려가 finish_top 없이 finish 단계에 도달
+    landmarks = trajectory(ADDRESS, SWING[:13], [170.0, 180.0], TAIL)
+    assert all_steps(landmarks) == [("KeyError", "'finish_top'")] * 3
+    with pytest.raises(KeyError, match="finish_top"):
+        detect_phases(landmarks)
+
+def test_no_finish():
+    # finish 전에 영상이 끝나면 검출된 단계까지
+    landmarks = trajectory(ADDRESS, SWING[:-1])
+    reference, streaming, vectorized = all_steps(landmarks)
+    assert reference == streaming == vectorized
+    assert "finish_top" in reference and "finish" not in reference
+
+def test_no_address():
+    landmarks = trajectory(SWING, TAIL)
+    assert all_steps(landmarks) == [{}] * 3
+
+def stretch(rng: np.random.Generator, wrist_y: list[float]) -> list[float]:
+    """
+    궤적 점 사이를 임의 개수의 프레임으로 선형 보간하고 잡음 추가 (느린 스윙/다른 fps 모사)
+    """
+    frames = [wrist_y[0]]
+    for start, stop in zip(wrist_y, wrist_y[1:]):
+        frames += np.linspace(start, stop, int(rng.integers(1, 4)) + 1)[1:].tolist()
+    return (np.asarray(frames) + rng.normal(0, 0.5, len(frames))).tolist()
+
+@pytest.mark.parametrize("seed", range(30))
+def test_noisy_swings(seed):
+    # 잡음 섞인 스윙 여러 개를 임의 위치에서 끊고 address 로 되돌아감 (재-address, finish_top 없음, 미완료 포함)
+    rng = np.random.default_rng(seed)
+    parts = [ADDRESS]
+    for _ in range(3):
+        wrist_y = stretch(rng, SWING)
+        parts += [wrist_y[:int(rng.integers(len(wrist_y) // 2, len(wrist_y) + 1))], ADDRESS[:int(rng.integers(1, 5))]]
+    parts.append(TAIL)
+    reference, streaming, vectorized = all_steps(trajectory(*parts))
+    assert reference == streaming == vectorized
+
+def session_swings() -> list[np.ndarray]:
+    # 두 번째 스윙은 느리고 잡음이 섞인 스윙
+    return [
+        trajectory(ADDRESS, SWING, TAIL),
+        trajectory(ADDRESS, stretch(np.random.default_rng(0), SWING), TAIL),
+        trajectory(ADDRESS, SWING, TAIL),
+    ]
+
+def test_detect_segments_matches_detector_per_swing():
+    swings = session_swings()
+    session = np.concatenate(swings)
+    segments, pending = detect_segments(session, fps=30.0)
+    assert len(segments) == len(swings)
+    assert pending == {}
+
+    offset = 0
+    for segment, swing in zip(segments, swings):
+        expected = {name: frame + offset for name, frame in streaming_steps(swing).items()}
+        assert segment["step"] == expected
+        assert (segment["start"], segment["end"]) == (expected["address"], expected["finish"])
+        assert segment["start_sec"] == round(expected["address"] / 30.0, 3)
+        offset += len(swing)
+
+    # 일괄 검출은 첫 스윙
+    assert detect_phases(session) == segments[0]["step"]
+
+def test_detect_segments_pending_swing():
+    session = np.concatenate([trajectory(ADDRESS, SWING, TAIL), trajectory(ADDRESS, SWING[:6])])
+    segments, pending = detect_segments(session, fps=30.0)
+    assert len(segments) == 1
+    assert pending == {name: frame + len(ADDRESS) + len(SWING) + len(TAIL) for name, frame in streaming_steps(trajectory(ADDRESS, SWING[:6])).items()}
+
+def test_detect_phases_batch_matches_detector(tmp_path):
+    swings = session_swings()
+    items = {str(i): swing for i, swing in enumerate(swings)}
+    items["no_finish_top"] = trajectory(ADDRESS, SWING[:13], [170.0, 180.0], TAIL)
+    # 저장된 키포인트 파일 경로 (/phase 의 task_id 항목)
+    path = str(tmp_path / "swing.kpt")
+    write_keypoints(path, swings[1])
+    items["file"] = path
+    items["missing"] = str(tmp_path / "missing.kpt")
+
+    results = detect_phases_batch(items)
+    for i, swing in enumerate(swings):
+        assert results[str(i)] == {"status": "step_completed", "step": streaming_steps(swing)}
+    assert results["file"] == results["1"]
+    assert results["no_finish_top"]["status"] == "error"
+    assert results["missing"]["status"] == "error"
+
+def test_thresholds():
+    landmarks = trajectory(ADDRESS, SWING, TAIL)
+    # 척추 각도(45도)가 범위 밖이면 address 없음
+    assert detect_phases(landmarks, spine_angle=(50, 70)) == {}
+    # follow_through 기준선을 낮추면 (divisor 작게) 손목이 더 올라가야 follow_through
+    assert detect_phases(landmarks, follow_through_divisor=1)["follow_through"] > detect_phases(landmarks)["follow_through"]
+    assert landmarks[detect_phases(landmarks)["top"], RIGHT_WRIST, Y] == min(SWING[2:6])
@@ -0,0 +1,76 @@
+import time
+
+import pytest
+
+from utils.result_store import MemoryResultStore, ResultStore, SQLiteResultStore, create_result_store
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    stores = []
+
+    def make(**options):
+        if request.param == "memory":
+            store = MemoryResultStore(**options)
+        else:
+            store = SQLiteResultStore(path=str(tmp_path / "results.db"), **options)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.close()
+
+def test_dict_interface(make_store):
+    store = make_store()
+    store["a"] = {"status": "queued"}
+    assert store["a"] == {"status": "queued"} and "a" in store
+    assert store.get("missing", {}) == {}
+    with pytest.raises(KeyError):
+        store["missing"]
+    del store["a"]
+    assert "a" not in store
+
+def test_ttl(make_store, monkeypatch):
+    store = make_store(ttl_sec=10)
+    store["old"] = {"status": "step_completed"}
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 5)
+    store["new"] = {"status": "processing"}
+    assert set(store.all()) == {"old", "new"}
+    monkeypatch.setattr(time, "time", lambda: now + 12)
+    assert store.get("old") is None
+    assert list(store.all()) == ["new"]
+
+def test_max_items_evicts_least_recently_updated(make_store, monkeypatch):
+    store = make_store(max_items=2)
+    now = time.time()
+    # a 를 다시 갱신하면 b 가 가장 오래 갱신되지 않은 결과
+    for i, task_id in enumerate(["a", "b", "a", "c"]):
+        monkeypatch.setattr(time, "time", lambda i=i: now + i)
+        store[task_id] = {"status": "queued"}
+    assert set(store.all()) == {"a", "c"}
+
+def test_sqlite_shared_between_connections(tmp_path):
+    # 같은 파일을 여는 다른 워커(연결)에서 갱신/삭제가 바로 보임
+    path = str(tmp_path / "results.db")
+    first, second = SQLiteResultStore(path=path), SQLiteResultStore(path=path)
+    try:
+        first["a"] = {"status": "processing", "step": {"address": 3}}
+        assert second["a"] == {"status": "processing", "step": {"address": 3}}
+        second["a"] = {"status": "step_completed"}
+        assert first["a"] == {"status": "step_completed"}
+        first.delete("a")
+        assert second.get("a") is None
+    finally:
+        first.close()
+        second.close()
+
+def test_create_result_store(tmp_path):
+    assert isinstance(create_result_store(None), MemoryResultStore)
+    store = create_result_store({"backend": "sqlite", "path": str(tmp_path / "r.db"), "ttl_sec": 5})
+    assert isinstance(store, SQLiteResultStore) and store.ttl_sec == 5
+    store.close()
+    with pytest.raises(ValueError):
+        create_result_store({"backend": "redis"})
+    with pytest.raises(TypeError):
+        ResultStore()
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from utils.result_store import MemoryResultStore
+from utils.scheduler import JobScheduler, QueueFull
+
+def run(coro):
+    return asyncio.run(coro)
+
+async def record(order: list, name: str, gate: asyncio.Event | None = None):
+    if gate is not None:
+        await gate.wait()
+    order.append(name)
+
+def test_priority_then_fifo():
+    async def main():
+        scheduler = JobScheduler(max_queue=8, concurrency=1)
+        order, gate = [], asyncio.Event()
+        # 첫 작업이 실행 중인 동안 나머지는 대기열에서 priority/등록 순서로 정렬
+        await scheduler.submit("blocker", record, order, "blocker", gate)
+        await scheduler.start()
+        await asyncio.sleep(0)
+        assert scheduler.running == 1
+        for name, priority in [("low1", 0), ("high", 5), ("low2", 0), ("mid", 1)]:
+            await scheduler.submit(name, record, order, name, priority=priority)
+        assert [scheduler.position(name) for name in ("high", "mid", "low1", "low2")] == [1, 2, 3, 4]
+        assert scheduler.status("low2")["position"] == 4
+        assert scheduler.status("blocker") is None
+        gate.set()
+        while scheduler.queued or scheduler.running:
+            await asyncio.sleep(0.01)
+        await scheduler.close()
+        return order
+    assert run(main()) == ["blocker", "high", "mid", "low1", "low2"]
+
+def test_queue_full():
+    async def main():
+        scheduler = JobScheduler(max_queue=2, concurrency=1, initial_duration_sec=10)
+        await scheduler.submit("a", record, [], "a")
+        await scheduler.submit("b", record, [], "b")
+        with pytest.raises(QueueFull) as info:
+            await scheduler.submit("c", record, [], "c")
+        assert info.value.retry_after == 10
+        assert scheduler.stats()["rejected"] == 1
+        await scheduler.close()
+    run(main())
+
+def test_submit_many_all_or_nothing():
+    async def main():
+        scheduler = JobScheduler(max_queue=3, concurrency=2, initial_duration_sec=4)
+        await scheduler.submit("a", record, [], "a")
+        jobs = [(name, record, ([], name)) for name in ("b", "c", "d")]
+        with pytest.raises(QueueFull) as info:
+            await scheduler.submit_many(jobs)
+        # 한 자리 부족: 2개 슬롯 기준 1개 작업 시간
+        assert info.value.retry_after == 2
+        assert scheduler.queued == 1 and scheduler.rejected == 3
+        assert await scheduler.submit_many(jobs[:2], priority=1) == [1, 2]
+        assert scheduler.position("a") == 3
+        await scheduler.close()
+    run(main())
+
+def test_close_cancels_running_and_queued():
+    async def main():
+        scheduler = JobScheduler(max_queue=4, concurrency=1)
+        started, cancelled = asyncio.Event(), []
+
+        async def forever():
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        await scheduler.start()
+        await scheduler.submit("run", forever)
+        await scheduler.submit("wait", forever)
+        await started.wait()
+        await scheduler.close()
+        assert cancelled == [True]
+        assert scheduler.queued == 0
+    run(main())
+
+def test_failed_job_recorded_as_error():
+    async def main():
+        task_results = MemoryResultStore()
+        scheduler = JobScheduler(max_queue=4, concurrency=1, task_results=task_results)
+
+        async def broken(task_id):
+            task_results[task_id] = {"status": "processing"}
+            raise RuntimeError("boom")
+
+        async def broken_after_result(task_id):
+            task_results[task_id] = {"status": "step_completed"}
+            raise RuntimeError("late")
+
+        await scheduler.start()
+        task_results["a"] = task_results["b"] = {"status": "queued"}
+        await scheduler.submit("a", broken, "a")
+        await scheduler.submit("b", broken_after_result, "b")
+        while scheduler.queued or scheduler.running:
+            await asyncio.sleep(0.01)
+        await scheduler.close()
+        return task_results
+    task_results = run(main())
+    assert task_results["a"] == {"status": "error", "error": "boom"}
+    # 이미 최종 결과를 기록한 작업은 덮어쓰지 않음
+    assert task_results["b"] == {"status": "step_completed"}
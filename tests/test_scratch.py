@@ -0,0 +1,110 @@
+import asyncio
+import multiprocessing
+import os
+import time
+
+from utils.scratch import LEDGER_NAME, ScratchSpace, _Ledger
+
+def run(coro):
+    return asyncio.run(coro)
+
+def test_workers_share_quota(tmp_path):
+    # 같은 root 를 쓰는 두 워커의 임시 공간 합계가 quota_bytes 를 넘지 않음
+    async def main():
+        spaces = [ScratchSpace(root=str(tmp_path), quota_bytes=100) for _ in range(2)]
+        held, peak = [0], [0]
+
+        async def job(space, i):
+            async with space.allocate(f"video{i}.mp4", 40):
+                held[0] += 40
+                peak[0] = max(peak[0], held[0])
+                assert spaces[0].stats()["used_bytes"] <= 100
+                await asyncio.sleep(0.05)
+                held[0] -= 40
+
+        await asyncio.gather(*(job(spaces[i % 2], i) for i in range(6)))
+        stats = [space.stats() for space in spaces]
+        for space in spaces:
+            space.close()
+        return peak[0], stats
+    peak, stats = run(main())
+    assert peak == 80
+    assert all(s["used_bytes"] == 0 and s["worker_used_bytes"] == 0 for s in stats)
+    assert sum(s["waited_total"] for s in stats) >= 1
+
+def test_waiter_wakes_after_release(tmp_path):
+    async def main():
+        first = ScratchSpace(root=str(tmp_path), quota_bytes=100)
+        second = ScratchSpace(root=str(tmp_path), quota_bytes=100)
+        release, acquired = asyncio.Event(), []
+
+        async def holder():
+            async with first.allocate("a.mp4", 80):
+                await release.wait()
+
+        async def waiter(space):
+            start = time.perf_counter()
+            async with space.allocate("b.mp4", 40):
+                acquired.append(time.perf_counter() - start)
+
+        hold = asyncio.create_task(holder())
+        await asyncio.sleep(0.05)
+        # 같은 워커의 대기는 반납 즉시, 다른 워커의 대기는 POLL_SEC 안에 깨어남
+        waiters = [asyncio.create_task(waiter(first)), asyncio.create_task(waiter(second))]
+        await asyncio.sleep(0.3)
+        assert acquired == []
+        assert first.stats()["waiting"] == 1 and second.stats()["waiting"] == 1
+        release.set()
+        await asyncio.wait_for(asyncio.gather(hold, *waiters), 2)
+        first.close()
+        second.close()
+        return acquired
+    acquired = run(main())
+    assert len(acquired) == 2
+
+def _reserve_and_die(path):
+    ledger = _Ledger(path)
+    ledger.reserve(90, False, 100)
+    # 정리 없이 종료 (비정상 종료한 워커)
+    os._exit(0)
+
+def test_dead_worker_reservations_reclaimed(tmp_path):
+    os.makedirs(tmp_path, exist_ok=True)
+    child = multiprocessing.get_context("fork").Process(target=_reserve_and_die, args=(str(tmp_path / LEDGER_NAME),))
+    child.start()
+    child.join()
+
+    async def main():
+        space = ScratchSpace(root=str(tmp_path), quota_bytes=100)
+        assert space.stats()["used_bytes"] == 90
+        async with space.allocate("video.mp4", 50):
+            used = space.stats()["used_bytes"]
+        space.close()
+        return used
+    assert run(asyncio.wait_for(main(), 2)) == 50
+
+def test_oversized_file_waits_for_empty_quota(tmp_path):
+    # 상한보다 큰 파일은 다른 예약이 모두 반납된 뒤 단독으로 허용
+    async def main():
+        space = ScratchSpace(root=str(tmp_path), quota_bytes=100)
+        release, order = asyncio.Event(), []
+
+        async def small():
+            async with space.allocate("small.mp4", 30):
+                await release.wait()
+                order.append("small")
+
+        async def large():
+            async with space.allocate("large.mp4", 150):
+                order.append(("large", space.stats()["used_bytes"]))
+
+        tasks = [asyncio.create_task(small())]
+        await asyncio.sleep(0.05)
+        tasks.append(asyncio.create_task(large()))
+        await asyncio.sleep(0.05)
+        assert order == []
+        release.set()
+        await asyncio.wait_for(asyncio.gather(*tasks), 2)
+        space.close()
+        return order
+    assert run(main()) == ["small", ("large", 150)]
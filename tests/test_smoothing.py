@@ -0,0 +1,86 @@
+import math
+
+import numpy as np
+import pytest
+
+from utils.data_process import adaptive_ema
+from utils.landmark import X, Y, Z_NORM, X_NORM
+from utils.smoothing import adaptive_ema_vector, ema, one_euro, smooth_offline
+
+def random_landmarks(seed: int, frames: int = 60) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    landmarks = rng.uniform(0, 1000, (frames, 17, 4)).astype(np.float32)
+    # 느린 움직임과 빠른 움직임(속도 임계값 전후)이 섞인 궤적
+    landmarks[:, :, :2] = np.cumsum(rng.normal(0, 8, (frames, 17, 2)), axis=0).astype(np.float32) + 500
+    return landmarks
+
+@pytest.mark.parametrize("seed", range(5))
+def test_adaptive_ema_vector_matches_scalar_loop(seed):
+    landmarks = random_landmarks(seed)
+    for prev, current in zip(landmarks, landmarks[1:]):
+        # 기존 analyze_video 의 관절별 루프
+        expected = [
+            [
+                adaptive_ema(prev_x, current_x, abs(current_x - prev_x)),
+                adaptive_ema(prev_y, current_y, abs(current_y - prev_y)),
+            ]
+            for (prev_x, prev_y), (current_x, current_y) in zip(prev[:, :2].tolist(), current[:, :2].tolist())
+        ]
+        vectorized = adaptive_ema_vector(prev[:, :2], current[:, :2])
+        assert vectorized.dtype == np.float64
+        assert vectorized.tolist() == expected
+
+def scalar_one_euro(values: list[float], fps: float, min_cutoff: float, beta: float, d_cutoff: float) -> list[float]:
+    """
+    값 하나씩 처리하는 One Euro 필터 (참조 구현)
+    """
+    def factor(cutoff):
+        return 1.0 / (1.0 + fps / (2 * math.pi * cutoff))
+
+    result, derivative = [values[0]], 0.0
+    for value in values[1:]:
+        derivative = factor(d_cutoff) * (value - result[-1]) * fps + (1 - factor(d_cutoff)) * derivative
+        alpha = factor(min_cutoff + beta * abs(derivative))
+        result.append(alpha * value + (1 - alpha) * result[-1])
+    return result
+
+def test_one_euro_matches_scalar():
+    values = random_landmarks(0)[:, :, :2]
+    smoothed = one_euro(values, 30.0, min_cutoff=1.5, beta=0.01, d_cutoff=1.0)
+    for joint in range(values.shape[1]):
+        for channel in range(2):
+            expected = scalar_one_euro(values[:, joint, channel].tolist(), 30.0, 1.5, 0.01, 1.0)
+            np.testing.assert_allclose(smoothed[:, joint, channel], expected, rtol=1e-12)
+
+def test_ema_matches_scalar():
+    values = random_landmarks(1)[:, 0, 0].astype(np.float64)
+    expected = [values[0]]
+    for value in values[1:]:
+        expected.append(0.3 * value + 0.7 * expected[-1])
+    np.testing.assert_allclose(ema(values, alpha=0.3), expected, rtol=1e-12)
+
+@pytest.mark.parametrize("method, params", [("one_euro", {"min_cutoff": 1.5, "beta": 0.01}), ("ema", {"alpha": 0.5})])
+def test_smooth_offline_keeps_shape_and_dtype(method, params):
+    landmarks = random_landmarks(2)
+    original = landmarks.copy()
+    smoothed = smooth_offline(landmarks, 30.0, method=method, **params)
+    assert smoothed.shape == landmarks.shape and smoothed.dtype == np.float32
+    # 입력은 그대로, 픽셀 좌표(x, y)만 보정
+    assert np.array_equal(landmarks, original)
+    assert np.array_equal(smoothed[:, :, [Z_NORM, X_NORM]], landmarks[:, :, [Z_NORM, X_NORM]])
+    assert not np.array_equal(smoothed[:, :, [X, Y]], landmarks[:, :, [X, Y]])
+    assert smooth_offline(landmarks[:0], 30.0, method=method, **params).shape == (0, 17, 4)
+
+def test_smooth_offline_has_no_lag():
+    # 좌우 대칭인 손목 궤적: 순방향/역방향 평활 후에도 최고점 frame 이 그대로
+    landmarks = np.zeros((41, 17, 4), dtype=np.float32)
+    landmarks[:, :, Y] = (400 - 10 * np.abs(np.arange(41) - 20))[:, np.newaxis]
+    for method in ("one_euro", "ema"):
+        smoothed = smooth_offline(landmarks, 30.0, method=method)
+        assert int(np.argmax(smoothed[:, 0, Y])) == 20
+    # 순방향만 적용하면 최고점이 뒤로 밀림
+    assert int(np.argmax(ema(landmarks[:, 0, Y], alpha=0.3))) > 20
+
+def test_smooth_offline_unknown_method():
+    with pytest.raises(ValueError):
+        smooth_offline(random_landmarks(0), 30.0, method="kalman")
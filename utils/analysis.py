@@ -0,0 +1,529 @@
+import numpy as np
+from contextlib import ExitStack
+from importlib.metadata import version
+
+from utils.data_process import adaptive_ema
+from utils.debug_writer import DebugWriter
+from utils.model_pool import PoseModelPool, get_model_pool
+from utils.decode import iter_frames, probe_video, expected_frames, output_size
+from utils.landmark import LandmarkBuffer, extract_landmarks
+from utils.metrics import StageTimer
+from utils.phase import PhaseDetector, detect_phases, detect_segments, segment_info
+from utils.progress import report
+from utils.roi import PersonRoi
+from utils.smoothing import ONLINE_METHODS, adaptive_ema_vector, smooth_offline
+
+# 추론에 사용하는 model_complexity (스윙 전: full, 스윙 중: heavy)
+FULL_COMPLEXITY, HEAVY_COMPLEXITY = 1, 2
+# 랜드마크 계산 방식(보정 등)이 바뀌면 올려서 기존 키포인트 캐시를 무효화
+LANDMARK_VERSION = 2
+# progress_id 지정 시 진행(progress) 이벤트 전송 간격(frame)
+PROGRESS_INTERVAL = 10
+
+def model_signature(
+    fps: float | None = None,
+    max_width: int | None = None,
+    coarse_pass: dict | None = None,
+    roi: dict | None = None,
+    offline_smoothing: dict | None = None,
+    chunked: dict | None = None,
+) -> dict:
+    """
+    랜드마크 결과에 영향을 주는 모델/디코딩 설정 (키포인트 캐시 키 구성용)
+    Args:
+        fps (float | None): 디코딩 리샘플링 fps.
+        max_width (int | None): 디코딩 가로 해상도 상한.
+        coarse_pass (dict | None): 2-pass 분석의 1차 패스 설정.
+        roi (dict | None): 사람 영역(ROI) 추론 설정.
+        offline_smoothing (dict | None): 분석 후 랜드마크 전체 평활 설정.
+        chunked (dict | None): 구간 병렬 추론 설정.
+    """
+    return {
+        "landmark_version": LANDMARK_VERSION,
+        "mediapipe": version("mediapipe"),  # 서버 프로세스는 mediapipe 를 import 하지 않음
+        "complexity": [FULL_COMPLEXITY, HEAVY_COMPLEXITY],
+        "fps": fps,
+        "max_width": max_width,
+        "coarse_pass": coarse_pass,
+        "roi": roi,
+        "offline_smoothing": offline_smoothing,
+        "chunked": chunked,
+    }
+
+def _interpolate(samples: np.ndarray, stride: int, frames: int) -> np.ndarray:
+    """
+    stride 간격 샘플을 시간축 선형 보간으로 프레임 단위 (frames, joints, 4) 로 복원
+    """
+    source = np.arange(len(samples)) * stride
+    target = np.arange(frames)
+    flat = samples.reshape(len(samples), -1)
+    result = np.empty((frames, flat.shape[1]), dtype=np.float32)
+    for c in range(flat.shape[1]):
+        result[:, c] = np.interp(target, source, flat[:, c])
+    return result.reshape(frames, *samples.shape[1:])
+
+def scan_swing_window(
+    user_video_name: str,
+    hand_type: str,
+    model_pool: PoseModelPool | None = None,
+    complexity: int = 0,
+    stride: int = 2,
+    max_width: int | None = 320,
+    margin_sec: float = 0.5,
+    fps: float | None = None,
+    size: tuple[int, int] | None = None,
+    info: dict[str, float] | None = None,
+) -> dict | None:
+    """
+    2-pass 분석의 1차 (coarse) 패스: 가벼운 모델로 축소/간격 샘플링한 프레임만 추론하여
+    address ~ finish 구간을 찾는다.
+    Args:
+        user_video_name (str): 비디오 파일 경로.
+        hand_type (str): 손 타입 (R 또는 L).
+        model_pool ``PoseModelPool | None``: 사용할 모델 풀 (기본: 프로세스 풀).
+        complexity (int): 1차 패스 model_complexity.
+        stride (int): N 프레임마다 1개만 추론.
+        max_width (int | None): 1차 패스 디코딩 가로 해상도 상한.
+        margin_sec (float): 구간 앞뒤 여유(초).
+        fps (float | None): 2차 패스와 같은 디코딩 리샘플링 fps (프레임 index 기준을 맞춤).
+        size (tuple[int, int] | None): 2차 패스 프레임 크기 (픽셀 좌표 기준, 기본: 원본).
+        info (dict[str, float] | None): ``probe_video`` 결과.
+    Returns:
+        dict | None: ``{"start": int, "end": int | None, "landmarks": (start, joints, 4)}``.
+            start 이전 프레임은 1차 패스 랜드마크를 보간해 채운다. end 가 None 이면 영상 끝까지.
+            address 를 찾지 못하면 None (전체 구간 분석).
+    """
+    model_pool = model_pool or get_model_pool()
+    info = info or probe_video(user_video_name)
+    width, height = size or (info["width"], info["height"])
+    samples = LandmarkBuffer(expected_frames(info, fps) // stride + 1)
+    detector = PhaseDetector()
+
+    frames = iter_frames(
+        user_video_name, fps=fps, max_width=max_width, hflip=hand_type == "L", info=info, stride=stride,
+    )
+    try:
+        with model_pool.checkout(complexity) as model:
+            for rgb in frames:
+                results = model.process(rgb)
+                if not results.pose_landmarks:
+                    current_landmark = samples.append_previous()
+                else:
+                    # 원본(2차 패스) 해상도 픽셀 좌표로 기록
+                    current_landmark = samples.append(extract_landmarks(results, width, height))
+                detector.update(current_landmark)
+                if detector.finished:
+                    break
+    except KeyError:
+        # finish_top 없이 finish 단계 도달: 끝 구간은 알 수 없으므로 영상 끝까지 분석
+        pass
+    finally:
+        frames.close()
+
+    if "address" not in detector.step:
+        return None
+    margin = int(round(margin_sec * (fps or info["fps"] or 30)))
+    start = max(0, detector.step["address"] * stride - margin)
+    end = detector.step["finish"] * stride + margin + 1 if detector.finished else None
+    return {"start": start, "end": end, "landmarks": _interpolate(samples.array, stride, start)}
+
+def redetect_offline(
+    landmarks: np.ndarray,
+    fps: float,
+    offline_smoothing: dict,
+    step: dict[str, int],
+    segments: list[dict],
+    session: bool,
+    timer: StageTimer,
+) -> tuple[np.ndarray, dict[str, int], list[dict]]:
+    """
+    분석이 끝난 랜드마크 전체를 오프라인 평활한 뒤 단계 재검출.
+    배열은 온라인 검출의 finish 에서 끝나므로, 평활로 손목 궤적이 바뀌어 finish 가 배열 밖으로 밀리면
+    재검출 결과의 단계(세션 모드는 스윙)가 온라인보다 적을 수 있다. 이 경우 온라인 결과를 유지하고
+    ``offline_fallback`` 카운터를 1 로 기록한다 (평활한 랜드마크는 그대로 반환).
+    Args:
+        landmarks ``np.ndarray``: (frames, joints, 4) 온라인 보정까지 적용된 랜드마크.
+        fps (float): 분석 frame 기준 fps.
+        offline_smoothing (dict): ``smooth_offline`` 인자.
+        step (dict[str, int]): 온라인 검출 단계 (세션 모드는 첫 스윙, 없으면 미완료 단계).
+        segments (list[dict]): 온라인 검출 스윙 구간 (세션 모드).
+        session (bool): 세션 모드.
+        timer ``StageTimer``: offline_smoothing/detect 시간과 offline_fallback 기록.
+    Returns:
+        tuple[np.ndarray, dict[str, int], list[dict]]: 평활한 랜드마크, 단계, 스윙 구간
+    """
+    with timer.stage("offline_smoothing"):
+        smoothed = smooth_offline(landmarks, fps, **offline_smoothing)
+    with timer.stage("detect"):
+        try:
+            if session:
+                found, pending = detect_segments(smoothed, fps)
+                redetected = found[0]["step"] if found else pending
+            else:
+                found, redetected = segments, detect_phases(smoothed)
+        except KeyError:
+            # 평활 후 finish_top 없이 finish 단계에 도달
+            found, redetected = [], {}
+    fallback = len(redetected) < len(step) or len(found) < len(segments)
+    timer.counters["offline_fallback"] = int(fallback)
+    if fallback:
+        return smoothed, step, segments
+    return smoothed, redetected, found
+
+class SwingTracker:
+    """
+    프레임별 스윙 추적: 랜드마크 기록 (미검출 프레임은 이전 값으로 채움) -> 스윙 중 Adaptive EMA 보정 -> 단계 검출.
+    세션 모드는 finish 마다 스윙 구간을 기록하고 다음 프레임부터 다시 address 를 찾는다.
+    ``analyze_video`` 의 추론 루프와 구간 병렬 추론의 ``replay`` 가 함께 사용한다.
+    Args:
+        capacity (int): 예상 frame 수 (버퍼 초기 크기).
+        fps (float): 분석 frame 기준 fps (스윙 구간 시각, 오프라인 평활).
+        session (bool): 세션 모드.
+        online_smoothing (str): 스윙 중 Adaptive EMA 보정 방식 (vectorized, scalar).
+        timer ``StageTimer | None``: smoothing/detect 시간 기록.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        fps: float,
+        session: bool = False,
+        online_smoothing: str = "vectorized",
+        timer: StageTimer | None = None,
+    ):
+        self.fps = fps
+        self.session = session
+        self.online_smoothing = online_smoothing
+        self.timer = timer or StageTimer()
+        self.landmarks = LandmarkBuffer(capacity)
+        self.detector = PhaseDetector()
+        self.segments: list[dict] = []
+        self.none_frames: list[int] = []
+
+    @property
+    def frame(self) -> int:
+        """다음에 기록할 frame index"""
+        return len(self.landmarks)
+
+    @property
+    def is_swing(self) -> bool:
+        """address 이후 finish 전 (다음 프레임을 heavy 모델로 추론)"""
+        return self.detector.is_swing and not self.detector.finished
+
+    @property
+    def swing_finished(self) -> bool:
+        """마지막 프레임에서 finish 검출"""
+        return self.detector.finished
+
+    @property
+    def done(self) -> bool:
+        """분석 종료 여부 (세션 모드가 아니면 첫 finish 에서 종료)"""
+        return self.detector.finished and not self.session
+
+    @property
+    def step(self) -> dict[str, int]:
+        """검출 단계 (세션 모드는 첫 번째 스윙, 완료된 스윙이 없으면 미완료 단계)"""
+        return self.segments[0]["step"] if self.segments else self.detector.step
+
+    def update(self, row: np.ndarray | None, smooth: bool = True) -> tuple[np.ndarray, list[str]]:
+        """
+        다음 프레임 처리
+        Args:
+            row ``np.ndarray | None``: (joints, 4) 랜드마크. None 이면 미검출 (이전 프레임 값으로 채움).
+            smooth (bool): 스윙 중이면 Adaptive EMA 보정 (1차 패스 랜드마크로 채우는 프레임은 False).
+        Returns:
+            tuple[np.ndarray, list[str]]: 기록된 (보정된) 랜드마크, 이 프레임에서 검출된 단계 이름
+        Raises:
+            KeyError: finish_top 없이 finish 단계에 도달한 경우 (``PhaseDetector.update``)
+        """
+        # 세션 모드: 이전 프레임의 finish 이후 다음 스윙 검출 (finish 프레임에서는 detector.step 을 유지)
+        if self.detector.finished and self.session:
+            self.detector.restart()
+        frame = self.frame
+        if row is None:
+            # 이전 프레임 데이터로 채움, 이전 값이 없다면 0으로 초기화
+            current_landmark = self.landmarks.append_previous()
+            self.none_frames.append(frame)
+        else:
+            current_landmark = self.landmarks.append(row)
+            if smooth and self.detector.is_swing and frame > 0:
+                with self.timer.stage("smoothing"):
+                    self._smooth(self.landmarks.data[frame - 1, :, :2], current_landmark)
+
+        # detect (프레임당 O(1) 스트리밍 상태 머신)
+        with self.timer.stage("detect"):
+            names = self.detector.update(current_landmark)
+        if self.detector.finished and self.session:
+            self.segments.append(segment_info(self.detector.step, self.fps))
+        return current_landmark, names
+
+    def _smooth(self, prev_xy: np.ndarray, current_landmark: np.ndarray):
+        """
+        속도(이전 프레임과의 차이) 기반 Adaptive EMA 적용 (current_landmark 의 x, y 를 제자리에서 갱신)
+        """
+        if self.online_smoothing == "vectorized":
+            current_landmark[:, :2] = adaptive_ema_vector(prev_xy, current_landmark[:, :2])
+            return
+        current_landmark[:, :2] = [
+            (
+                adaptive_ema(prev_x, current_x, abs(current_x - prev_x)),
+                adaptive_ema(prev_y, current_y, abs(current_y - prev_y)),
+            )
+            for (prev_x, prev_y), (current_x, current_y) in zip(prev_xy.tolist(), current_landmark[:, :2].tolist())
+        ]
+
+    def result(self, offline_smoothing: dict | None = None) -> tuple[np.ndarray, dict[str, int], list[dict]]:
+        """
+        분석 종료 후 랜드마크, 단계, 스윙 구간
+        Args:
+            offline_smoothing (dict | None): 지정 시 전체 배열을 평활 후 단계 재검출 (``redetect_offline``).
+        Returns:
+            tuple[np.ndarray, dict[str, int], list[dict]]: (frames, joints, 4) 랜드마크, 단계, 스윙 구간
+        """
+        landmarks, step, segments = self.landmarks.array, self.step, self.segments
+        if offline_smoothing is not None:
+            landmarks, step, segments = redetect_offline(
+                landmarks, self.fps, offline_smoothing, step, segments, self.session, self.timer,
+            )
+        return landmarks, step, segments
+
+class ProgressReporter:
+    """
+    ``SwingTracker`` 의 프레임별 검출 결과를 진행 이벤트로 전송 (progress_id 가 없으면 보내지 않음).
+    새 단계는 phase, PROGRESS_INTERVAL 프레임마다 progress, 세션 모드의 스윙 완료는 segment 이벤트.
+    Args:
+        progress_id (str | None): 작업 ID.
+        total (int): 예상 frame 수.
+    """
+
+    def __init__(self, progress_id: str | None, total: int):
+        self.progress_id = progress_id
+        self.total = total
+        self.last_phase = None
+
+    def update(self, tracker: SwingTracker, names: list[str]):
+        """
+        마지막으로 처리한 프레임의 이벤트 전송
+        Args:
+            tracker ``SwingTracker``: 방금 ``update`` 한 추적기.
+            names (list[str]): ``SwingTracker.update`` 가 반환한 단계 이름.
+        """
+        if self.progress_id is None:
+            return
+        frame, step = tracker.frame - 1, tracker.detector.step
+        for name in names:
+            # 검출 시점 상태명 -> 단계 이름 (donw_half 상태에서 down_half 검출)
+            phase = "down_half" if name == "donw_half" else name
+            # 같은 단계의 frame 갱신(top 등)과 연속된 address 재검출은 progress 의 phases 로만 전달
+            if phase != self.last_phase:
+                self.last_phase = phase
+                report(self.progress_id, "phase", phase=phase, frame=step[phase])
+        if frame % PROGRESS_INTERVAL == 0:
+            report(self.progress_id, "progress", frame=frame, total=self.total, phases=dict(step))
+        if tracker.swing_finished and tracker.session:
+            report(self.progress_id, "segment", index=len(tracker.segments) - 1, **tracker.segments[-1])
+
+def _summary(
+    timer: StageTimer,
+    tracker: SwingTracker | None,
+    writer: DebugWriter | None,
+    switch_frame: int | None,
+) -> dict:
+    """
+    ``analyze_video`` 의 metrics (debug writer 를 닫고 frame 수/미검출 수/모델 전환 frame 기록)
+    """
+    if writer is not None:
+        with timer.stage("debug_flush"):
+            written = writer.close()
+        timer.counters.update(debug_written=written["written"], debug_dropped=written["dropped"])
+    timer.counters.update(
+        frames=tracker.frame if tracker is not None else 0,
+        none_frames=len(tracker.none_frames) if tracker is not None else 0,
+        switch_frame=switch_frame,
+    )
+    return timer.summary()
+
+def _completed(
+    tracker: SwingTracker,
+    writer: DebugWriter | None,
+    switch_frame: int | None,
+    offline_smoothing: dict | None,
+    return_landmarks: bool,
+) -> dict:
+    """
+    ``analyze_video`` 의 완료 결과
+    """
+    landmarks, step, segments = tracker.result(offline_smoothing)
+    result = {"status": "step_completed", "step": step, "metrics": _summary(tracker.timer, tracker, writer, switch_frame)}
+    if tracker.session:
+        result["segments"] = segments
+    if return_landmarks:
+        result["landmarks"] = landmarks.copy()
+    return result
+
+def analyze_video(
+    user_video_name: str,
+    hand_type: str,
+    debug_dir: str | None = None,
+    model_pool: PoseModelPool | None = None,
+    fps: float | None = None,
+    max_width: int | None = None,
+    return_landmarks: bool = False,
+    coarse_pass: dict | None = None,
+    roi: dict | None = None,
+    online_smoothing: str = "vectorized",
+    offline_smoothing: dict | None = None,
+    progress_id: str | None = None,
+    debug: dict | None = None,
+    session: bool = False,
+) -> dict:
+    """
+    Mediapipe 스윙 분석 (동기, 블로킹).
+    이벤트 루프를 막지 않도록 ``AnalysisEngine`` 의 프로세스 풀에서 실행된다.
+    Args:
+        user_video_name (str): 분석할 비디오 파일 경로.
+        hand_type (str): 손 타입 (R 또는 L).
+        debug_dir (str | None): 지정 시 프레임/단계 이미지를 저장할 폴더.
+        model_pool ``PoseModelPool | None``: 사용할 모델 풀 (기본: 프로세스 풀).
+        fps (float | None): 디코딩 시 리샘플링 fps (None 이면 모든 프레임 분석).
+        max_width (int | None): 디코딩 시 가로 해상도 상한 (다운스케일).
+        return_landmarks (bool): 결과에 프레임별 랜드마크 배열 (frames, joints, 4) 포함 여부.
+        coarse_pass (dict | None): 지정 시 2-pass 분석. ``scan_swing_window`` 인자
+            (complexity, stride, max_width, margin_sec) 로 스윙 구간을 먼저 찾고,
+            구간 밖 앞부분은 추론하지 않고 1차 패스 랜드마크로 채운다.
+        roi (dict | None): 지정 시 ``PersonRoi`` 인자 (padding, probe_frames, ...) 로
+            사람 영역만 디코딩/추론하고, 영역을 벗어나면 전체 프레임으로 되돌린다.
+        online_smoothing (str): 스윙 중 프레임별 Adaptive EMA 보정 방식
+            (vectorized: 전체 관절을 배열 연산으로, scalar: 관절별 ``adaptive_ema`` 호출). 결과는 같다.
+        offline_smoothing (dict | None): 지정 시 ``smooth_offline`` 인자 (method, 필터 파라미터) 로
+            분석이 끝난 랜드마크 전체를 지연 없이 평활한 뒤 단계를 다시 검출한다.
+        progress_id (str | None): 지정 시 이 작업 ID 로 단계 검출(phase)과 프레임 진행(progress) 이벤트를
+            ``AnalysisEngine`` 의 진행 채널에 보낸다.
+        debug (dict | None): debug_dir 저장 옵션 (``DebugWriter`` 인자: mode, every, format, quality, video,
+            workers, queue_size). 생략하면 모든 프레임을 png 로 저장한다.
+        session (bool): 세션 모드. 첫 finish 에서 멈추지 않고 영상 끝까지 한 번에 디코딩/추론하며
+            모든 address ~ finish 스윙을 ``segments`` 로 반환한다 (coarse_pass 는 사용하지 않음).
+    Returns:
+        dict: ``{"status": "step_completed", "step": {...}}`` 또는 ``{"status": "error", "error": ...}``.
+            세션 모드는 ``segments`` (스윙별 step, start/end frame, start_sec/end_sec) 를 포함하고
+            step 은 첫 번째 스윙 (완료된 스윙이 없으면 미완료 단계).
+            ``metrics`` 에 단계별 소요 시간(probe, decode, inference_full/heavy, smoothing, detect 등)과
+            frames, none_frames, switch_frame(heavy 모델로 바뀐 프레임) 포함.
+    Raises:
+        ValueError: 알 수 없는 online_smoothing 인 경우
+    """
+    if online_smoothing not in ONLINE_METHODS:
+        raise ValueError(f"알 수 없는 온라인 보정 방식입니다: {online_smoothing}")
+    timer = StageTimer()
+
+    # model checkout 이후의 준비(probe, 추적기/ROI/writer 생성)도 try 안에서 실행해
+    # 실패해도 모델을 반납하고 오류 결과(metrics 포함)를 반환한다
+    model_pool = model_pool or get_model_pool()
+    models = ExitStack()
+    tracker = None
+    frames = None
+    switch_frame = None
+    # 결과 이미지 저장 (writer 스레드에서 인코딩/쓰기, 추론 루프는 대기하지 않음)
+    writer = None
+
+    try:
+        # model checkout (영상 종료 시 리셋 후 반납)
+        full_model = models.enter_context(model_pool.checkout(FULL_COMPLEXITY))
+        heavy_model = models.enter_context(model_pool.checkout(HEAVY_COMPLEXITY))
+
+        with timer.stage("probe"):
+            info = probe_video(user_video_name)
+        width, height = output_size(info["width"], info["height"], max_width)
+        total_frames = expected_frames(info, fps)
+        # 분석 frame 기준 fps (시각 계산, 오프라인 평활, 디버그 영상)
+        analysis_fps = fps or info["fps"] or 30.0
+        # (frames, joints, 4) 버퍼를 영상 프레임 수만큼 미리 할당
+        tracker = SwingTracker(total_frames, analysis_fps, session, online_smoothing, timer)
+        reporter = ProgressReporter(progress_id, total_frames)
+        person_roi = PersonRoi(width, height, **roi) if roi is not None else None
+        if debug_dir is not None:
+            writer = DebugWriter(debug_dir, fps=analysis_fps, size=(width, height), **(debug or {}))
+
+        # 2-pass: 1차 패스로 찾은 스윙 구간 [start, end) 만 디코딩/추론
+        window = None
+        if coarse_pass is not None and not session:
+            with timer.stage("coarse_pass"):
+                window = scan_swing_window(
+                    user_video_name, hand_type, model_pool=model_pool, fps=fps, size=(width, height), info=info,
+                    **coarse_pass,
+                )
+        start, end = (window["start"], window["end"]) if window is not None else (0, None)
+
+        # 구간 이전 프레임은 1차 패스 랜드마크로 채우고 검출기만 진행
+        for row in window["landmarks"] if window is not None else ():
+            _, names = tracker.update(row, smooth=False)
+            reporter.update(tracker, names)
+            if tracker.done:
+                return _completed(tracker, writer, switch_frame, offline_smoothing, return_landmarks)
+
+        # ffmpeg 파이프 디코딩 (좌우 반전/RGB 변환은 디코더에서 처리)
+        if person_roi is None:
+            frames = iter_frames(
+                user_video_name, fps=fps, max_width=max_width, hflip=hand_type == "L", info=info,
+                start_frame=start, end_frame=end,
+            )
+        else:
+            # 앞부분 프레임으로 사람 영역을 정하고 그 영역만 디코딩 (탐색에 쓴 모델은 트래킹 상태 리셋)
+            with timer.stage("roi_locate"):
+                person_roi.locate(user_video_name, full_model, start_frame=start, fps=fps, hflip=hand_type == "L", info=info)
+                full_model.reset()
+            frames = person_roi.frames(
+                user_video_name, start_frame=start, end_frame=end,
+                fps=fps, max_width=max_width, hflip=hand_type == "L", info=info,
+            )
+
+        # 디코딩 시간: ffmpeg 파이프에서 다음 프레임을 받을 때까지 대기한 시간
+        for rgb in timer.iterate("decode", frames):
+            # ROI 사용 시 rgb 는 사람 영역 이미지 (box: 원본 프레임 좌표)
+            box = person_roi.current if person_roi is not None else (0, 0, width, height)
+            frame, swing = tracker.frame, len(tracker.segments)
+
+            # 모델 선택
+            model = heavy_model if tracker.is_swing else full_model
+            if tracker.is_swing and switch_frame is None:
+                switch_frame = frame
+            with timer.stage("inference_full" if model is full_model else "inference_heavy"):
+                results = model.process(rgb)
+
+            # 영역을 벗어나면 다음 프레임부터 전체 프레임 (입력 좌표계가 바뀌므로 트래킹 상태 리셋)
+            if person_roi is not None and person_roi.update(results, box):
+                model.reset()
+
+            # pose processing: [x(픽셀), y(픽셀), z_norm, x_norm] (ROI 좌표 -> 원본 프레임 픽셀 좌표)
+            row = None
+            if results.pose_landmarks:
+                x0, y0, x1, y1 = box
+                row = extract_landmarks(results, x1 - x0, y1 - y0, (x0, y0))
+            current_landmark, names = tracker.update(row)
+            reporter.update(tracker, names)
+
+            if writer is not None:
+                # 보정된 좌표 기준으로 원(circle) 그리기
+                points = current_landmark[:, :2] if row is not None else None
+                with timer.stage("debug_write"):
+                    writer.frame(frame, rgb, points, box)
+                for name in names:
+                    # 세션 모드는 스윙 번호를 붙여 저장
+                    writer.step(f"{swing}_{name}" if session else name, rgb, points, box)
+
+            if tracker.done:
+                return _completed(tracker, writer, switch_frame, offline_smoothing, return_landmarks)
+            if tracker.swing_finished:
+                # 세션 모드: 다시 full 모델로 추론 (스윙 전 마지막 프레임 기준 트래킹 상태 리셋)
+                full_model.reset()
+
+        return _completed(tracker, writer, switch_frame, offline_smoothing, return_landmarks)
+
+    except Exception as e:
+        # 작업 실패 시 오류 저장
+        return {"status": "error", "error": str(e), "metrics": _summary(timer, tracker, writer, switch_frame)}
+
+    finally:
+        if frames is not None:
+            frames.close()
+        models.close()
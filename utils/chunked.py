@@ -0,0 +1,232 @@
+import asyncio
+
+import numpy as np
+
+from utils.analysis import HEAVY_COMPLEXITY, SwingTracker, analyze_video
+from utils.decode import iter_frames, probe_video, expected_frames, output_size
+from utils.landmark import LandmarkBuffer, extract_landmarks
+from utils.metrics import StageTimer
+from utils.model_pool import PoseModelPool, get_model_pool
+
+def plan_chunks(frames: int, chunks: int, overlap: int, min_frames: int = 1) -> list[tuple[int, int, int | None]]:
+    """
+    영상을 시간 구간(chunk)으로 나눔. 각 구간 앞의 overlap 프레임은 트래킹 재확립용으로 추론만 하고 버린다.
+    Args:
+        frames (int): 예상 전체 frame 수 (``expected_frames``).
+        chunks (int): 구간 수 (프로세스 수).
+        overlap (int): 구간 앞 여유 frame 수.
+        min_frames (int): 구간 하나의 최소 frame 수 (짧은 영상은 구간 수를 줄임).
+    Returns:
+        list[tuple[int, int, int | None]]: (warmup_start, start, end). 마지막 구간의 end 는 None (영상 끝까지).
+    """
+    chunks = max(1, min(int(chunks), frames // max(int(min_frames), 1)))
+    bounds = np.linspace(0, frames, chunks + 1).round().astype(int).tolist()
+    plan = [(max(0, start - overlap), start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+    warmup_start, start, _ = plan[-1]
+    plan[-1] = (warmup_start, start, None)
+    return plan
+
+def infer_chunk(
+    user_video_name: str,
+    hand_type: str,
+    warmup_start: int,
+    start: int,
+    end: int | None,
+    complexity: int = HEAVY_COMPLEXITY,
+    fps: float | None = None,
+    max_width: int | None = None,
+    info: dict[str, float] | None = None,
+    model_pool: PoseModelPool | None = None,
+) -> dict:
+    """
+    구간 하나의 Pose 추론 (``AnalysisEngine`` 자식 프로세스에서 실행, 블로킹).
+    보정/단계 검출 없이 프레임별 원본 랜드마크와 검출 여부만 반환한다.
+    Args:
+        user_video_name (str): 비디오 파일 경로.
+        hand_type (str): 손 타입 (R 또는 L).
+        warmup_start (int): 추론 시작 frame (start 이전 프레임은 트래킹 재확립용).
+        start (int): 결과에 포함할 첫 frame.
+        end (int | None): 결과에 포함할 마지막 frame + 1 (None 이면 영상 끝까지).
+        complexity (int): model_complexity.
+        fps (float | None): 디코딩 리샘플링 fps.
+        max_width (int | None): 디코딩 가로 해상도 상한.
+        info (dict[str, float] | None): ``probe_video`` 결과.
+        model_pool ``PoseModelPool | None``: 사용할 모델 풀 (기본: 프로세스 풀).
+    Returns:
+        dict: landmarks (frames, joints, 4), detected (frames,) bool, metrics (decode/inference 시간, warmup_frames)
+    """
+    model_pool = model_pool or get_model_pool()
+    info = info or probe_video(user_video_name)
+    width, height = output_size(info["width"], info["height"], max_width)
+    timer = StageTimer()
+    rows = LandmarkBuffer((end if end is not None else expected_frames(info, fps)) - start)
+    detected = []
+
+    frames = iter_frames(
+        user_video_name, fps=fps, max_width=max_width, hflip=hand_type == "L", info=info,
+        start_frame=warmup_start, end_frame=end,
+    )
+    try:
+        with model_pool.checkout(complexity) as model:
+            for frame, rgb in enumerate(timer.iterate("decode", frames), warmup_start):
+                with timer.stage("inference"):
+                    results = model.process(rgb)
+                if frame < start:
+                    continue
+                if results.pose_landmarks:
+                    rows.append(extract_landmarks(results, width, height))
+                else:
+                    rows.append_previous()
+                detected.append(bool(results.pose_landmarks))
+    finally:
+        frames.close()
+    timer.counters["warmup_frames"] = start - warmup_start
+    return {"landmarks": rows.array.copy(), "detected": np.array(detected, dtype=bool), "metrics": timer.summary()}
+
+def replay(
+    landmarks: np.ndarray,
+    detected: np.ndarray,
+    fps: float,
+    offline_smoothing: dict | None = None,
+    session: bool = False,
+) -> dict:
+    """
+    이어 붙인 구간 추론 결과에 ``analyze_video`` 와 같은 ``SwingTracker`` 로 보정과 단계 검출을 적용 (블로킹).
+    미검출 프레임은 이전 프레임 값으로 채우고, 스윙 중 프레임만 Adaptive EMA 로 보정하며 finish 에서 멈춘다
+    (세션 모드는 모든 스윙을 ``segments`` 로 기록).
+    Args:
+        landmarks ``np.ndarray``: (frames, joints, 4) 프레임 순서의 원본 랜드마크.
+        detected ``np.ndarray``: (frames,) 랜드마크 검출 여부.
+        fps (float): 분석 frame 기준 fps.
+        offline_smoothing (dict | None): 분석 후 랜드마크 전체 평활 설정.
+        session (bool): 세션 모드.
+    Returns:
+        dict: ``analyze_video`` 와 같은 형식 (landmarks 포함)
+    """
+    timer = StageTimer()
+    tracker = SwingTracker(len(landmarks), fps, session, timer=timer)
+    for row, found in zip(landmarks, detected):
+        tracker.update(row if found else None)
+        if tracker.done:
+            break
+
+    array, step, segments = tracker.result(offline_smoothing)
+    timer.counters["none_frames"] = len(tracker.none_frames)
+    result = {"status": "step_completed", "step": step, "metrics": timer.summary(), "landmarks": array.copy()}
+    if session:
+        result["segments"] = segments
+    return result
+
+async def analyze_chunked(
+    engine,
+    user_video_name: str,
+    hand_type: str,
+    chunks: int,
+    overlap_sec: float = 1.0,
+    min_chunk_sec: float = 2.0,
+    complexity: int = HEAVY_COMPLEXITY,
+    fps: float | None = None,
+    max_width: int | None = None,
+    return_landmarks: bool = False,
+    offline_smoothing: dict | None = None,
+    session: bool = False,
+    progress_id: str | None = None,
+) -> dict:
+    """
+    영상 하나를 시간 구간으로 나눠 구간별 추론을 엔진의 여러 프로세스에서 동시에 실행하고,
+    프레임 순서로 이어 붙인 뒤 보정/단계 검출(``replay``)을 적용한다.
+    스윙 시작 전에는 어느 모델이 쓰일지 알 수 없으므로 모든 프레임을 complexity 모델로 추론한다.
+    마지막이 아닌 구간의 frame 수가 계획(end - start)과 다르면 (VFR 영상 등에서 seek/trim 이 frame 단위로
+    맞지 않으면) 이후 frame index 가 모두 밀리므로, 구간 결과를 버리고 ``analyze_video`` 로 순차 분석한다.
+    Args:
+        engine ``AnalysisEngine``: 분석 실행 엔진 (구간 수만큼 슬롯을 사용).
+        user_video_name (str): 다운로드된 비디오 파일 경로.
+        hand_type (str): 손 타입 (R 또는 L).
+        chunks (int): 구간 수.
+        overlap_sec (float): 구간 앞 트래킹 재확립용 여유(초).
+        min_chunk_sec (float): 구간 하나의 최소 길이(초), 짧은 영상은 구간 수를 줄인다.
+        complexity (int): 구간 추론 model_complexity.
+        fps (float | None): 디코딩 리샘플링 fps.
+        max_width (int | None): 디코딩 가로 해상도 상한.
+        return_landmarks (bool): 결과에 보정된 (frames, joints, 4) 랜드마크 포함.
+        offline_smoothing (dict | None): 분석 후 랜드마크 전체 평활 설정.
+        session (bool): 세션 모드 (모든 스윙을 ``segments`` 로 반환).
+        progress_id (str | None): 지정 시 구간 추론이 끝날 때마다 progress 이벤트(추론을 마친 frame 수)와
+            단계 검출 후 phase 이벤트를 ``engine.progress`` 로 발행한다.
+    Returns:
+        dict: ``analyze_video`` 와 같은 형식. ``metrics`` 의 decode/inference_heavy 는 구간 합계(CPU 시간),
+            inference_chunks 는 구간 추론 전체 경과 시간이며 chunks, warmup_frames 포함.
+            순차 분석으로 대체한 경우 ``chunked_fallback`` 이 1.
+    """
+    timer = StageTimer()
+    with timer.stage("probe"):
+        info = await asyncio.to_thread(probe_video, user_video_name)
+    analysis_fps = fps or info["fps"] or 30.0
+    total_frames = expected_frames(info, fps)
+    plan = plan_chunks(
+        total_frames, chunks,
+        overlap=int(round(overlap_sec * analysis_fps)), min_frames=int(round(min_chunk_sec * analysis_fps)),
+    )
+
+    with timer.stage("inference_chunks"):
+        tasks = [
+            asyncio.ensure_future(engine.run(
+                infer_chunk, user_video_name, hand_type, warmup_start, start, end, complexity, fps, max_width, info,
+            ))
+            for warmup_start, start, end in plan
+        ]
+        try:
+            # 끝난 구간부터 진행 이벤트 발행 (frame: 추론을 마친 frame 수)
+            inferred = 0
+            for finished in asyncio.as_completed(tasks):
+                inferred += len((await finished)["detected"])
+                if progress_id is not None:
+                    engine.progress.publish(progress_id, {
+                        "event": "progress", "frame": inferred, "total": total_frames, "phases": {},
+                    })
+        finally:
+            for task in tasks:
+                task.cancel()
+        parts = [task.result() for task in tasks]
+
+    if any(end is not None and len(part["detected"]) != end - start for part, (_, start, end) in zip(parts, plan)):
+        with timer.stage("analysis_sequential"):
+            result = await engine.run(
+                analyze_video, user_video_name, hand_type, fps=fps, max_width=max_width,
+                return_landmarks=return_landmarks, offline_smoothing=offline_smoothing, progress_id=progress_id,
+                session=session,
+            )
+        metrics = result.setdefault("metrics", {})
+        metrics["stages"] = {**timer.summary()["stages"], **metrics.get("stages", {})}
+        metrics["chunked_fallback"] = 1
+        return result
+
+    with timer.stage("stitch"):
+        landmarks = np.concatenate([part["landmarks"] for part in parts])
+        detected = np.concatenate([part["detected"] for part in parts])
+    result = await engine.run(replay, landmarks, detected, analysis_fps, offline_smoothing, session)
+    if progress_id is not None:
+        for phase, frame in result["step"].items():
+            engine.progress.publish(progress_id, {"event": "phase", "phase": phase, "frame": frame})
+        for index, segment in enumerate(result.get("segments") or []):
+            engine.progress.publish(progress_id, {"event": "segment", "index": index, **segment})
+
+    # 구간별 단계 시간은 합산 (inference 는 complexity 에 맞춰 inference_full/heavy 로 기록)
+    inference = "inference_heavy" if complexity == HEAVY_COMPLEXITY else "inference_full"
+    for part in parts:
+        for name, seconds in part["metrics"]["stages"].items():
+            timer.add(inference if name == "inference" else name, seconds)
+    for name, seconds in result["metrics"]["stages"].items():
+        timer.add(name, seconds)
+    timer.counters.update({
+        "frames": len(landmarks),
+        "none_frames": result["metrics"]["none_frames"],
+        "chunks": len(plan),
+        "warmup_frames": sum(part["metrics"]["warmup_frames"] for part in parts),
+    })
+    if "offline_fallback" in result["metrics"]:
+        timer.counters["offline_fallback"] = result["metrics"]["offline_fallback"]
+    result["metrics"] = timer.summary()
+    if not return_landmarks:
+        result.pop("landmarks")
+    return result
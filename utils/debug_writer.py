@@ -0,0 +1,160 @@
+import os
+import queue
+import threading
+
+import cv2
+import numpy as np
+
+# 디버그 프레임 저장 범위 (all: 모든 프레임 + 단계, step: 단계 이미지만)
+DEBUG_MODES = ("all", "step")
+# 이미지 형식별 확장자와 품질 옵션 (png 는 무손실, quality 무시)
+IMAGE_FORMATS = {
+    "png": (".png", None),
+    "jpg": (".jpg", cv2.IMWRITE_JPEG_QUALITY),
+    "webp": (".webp", cv2.IMWRITE_WEBP_QUALITY),
+}
+
+def render(rgb: np.ndarray, points: np.ndarray | None, offset: tuple[int, int] = (0, 0)) -> np.ndarray:
+    """
+    RGB 프레임을 BGR 이미지로 바꾸고 랜드마크 위치에 원(circle)을 그림
+    Args:
+        rgb ``np.ndarray``: (height, width, 3) 프레임 (ROI 사용 시 사람 영역 이미지).
+        points ``np.ndarray | None``: (joints, 2) 원본 프레임 픽셀 좌표 (None 이면 그리지 않음).
+        offset (tuple[int, int]): rgb 의 원본 프레임 내 좌상단 좌표 (x0, y0).
+    """
+    image = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+    if points is not None:
+        x0, y0 = offset
+        for x, y in points.astype(int).tolist():
+            cv2.circle(image, (x - x0, y - y0), radius=5, color=(0, 255, 0), thickness=-1)
+    return image
+
+class DebugWriter:
+    """
+    디버그 프레임/단계 이미지 비동기 저장.
+    추론 루프는 프레임 복사본만 bounded 큐에 넣고(디코더 ring buffer 는 재사용되므로), 색 변환/그리기/인코딩/쓰기는
+    writer 스레드가 처리한다 (cv2 인코딩은 GIL 을 놓으므로 추론과 병렬로 진행). 큐가 가득 차면 기다리지 않고 해당 프레임을 버린다.
+    단계 이미지는 top/impact 처럼 연속 프레임에서 갱신되므로 단계별 마지막 프레임만 보관했다가 close 에서 한 번 저장한다.
+    """
+
+    def __init__(
+        self,
+        debug_dir: str,
+        mode: str = "all",
+        every: int = 1,
+        format: str = "png",
+        quality: int = 90,
+        video: bool = False,
+        fps: float = 30.0,
+        size: tuple[int, int] | None = None,
+        workers: int = 2,
+        queue_size: int = 64,
+    ):
+        """
+        Args:
+            debug_dir (str): 저장 폴더 (frame/, step/, 또는 frames.mp4).
+            mode (str): all (프레임 + 단계) 또는 step (단계 이미지만).
+            every (int): N 프레임마다 1개만 저장.
+            format (str): 이미지 형식 (png | jpg | webp). 기존 결과와 같은 무손실 png 가 기본, jpg/webp 는 선택.
+            quality (int): jpg/webp 품질 (0~100).
+            video (bool): 프레임을 개별 파일 대신 주석을 그린 MP4 하나(frames.mp4)로 저장.
+            fps (float): video 저장 시 fps.
+            size (tuple[int, int] | None): video 저장 시 (width, height) 원본 프레임 크기.
+            workers (int): writer 스레드 수 (video 는 프레임 순서 유지를 위해 1).
+            queue_size (int): 대기 프레임 수 상한.
+        Raises:
+            ValueError: 알 수 없는 mode/format 이거나 video 에 size 가 없는 경우
+        """
+        if mode not in DEBUG_MODES:
+            raise ValueError(f"알 수 없는 디버그 저장 범위입니다: {mode}")
+        if format not in IMAGE_FORMATS:
+            raise ValueError(f"알 수 없는 이미지 형식입니다: {format}")
+        if video and size is None:
+            raise ValueError("video 저장에는 size 가 필요합니다")
+        self.mode = mode
+        self.every = max(1, int(every))
+        self.extension, flag = IMAGE_FORMATS[format]
+        self.params = [flag, int(quality)] if flag is not None else []
+        self.size = size
+        self.written = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+        self.frame_dir = os.path.join(debug_dir, "frame")
+        self.step_dir = os.path.join(debug_dir, "step")
+        os.makedirs(self.step_dir, exist_ok=True)
+        self._video = None
+        if mode == "all":
+            if video:
+                self._video = cv2.VideoWriter(os.path.join(debug_dir, "frames.mp4"), cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+                workers = 1
+            else:
+                os.makedirs(self.frame_dir, exist_ok=True)
+
+        self._steps: dict[str, tuple] = {}
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._threads = [threading.Thread(target=self._run, daemon=True) for _ in range(workers if mode == "all" else 0)]
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            index, rgb, points, box = item
+            x0, y0, x1, y1 = box
+            image = render(rgb, points, (x0, y0))
+            if self._video is not None:
+                # ROI 사용 시 사람 영역을 원본 크기 캔버스의 제자리에 배치
+                if image.shape[1::-1] != self.size:
+                    canvas = np.zeros((self.size[1], self.size[0], 3), dtype=np.uint8)
+                    canvas[y0:y1, x0:x1] = image
+                    image = canvas
+                self._video.write(image)
+            else:
+                cv2.imwrite(os.path.join(self.frame_dir, f"{index}{self.extension}"), image, self.params)
+            with self._lock:
+                self.written += 1
+
+    def frame(self, index: int, rgb: np.ndarray, points: np.ndarray | None, box: tuple[int, int, int, int]) -> None:
+        """
+        프레임 저장 요청 (대기 없음, 큐가 가득 차면 버림)
+        Args:
+            index (int): 프레임 번호 (파일 이름).
+            rgb ``np.ndarray``: 프레임 (저장할 때만 복사하므로 디코더 버퍼를 그대로 넘겨도 됨).
+            points ``np.ndarray | None``: (joints, 2) 원본 프레임 픽셀 좌표 (미검출 프레임은 None).
+            box (tuple[int, int, int, int]): rgb 의 원본 프레임 내 영역 (x0, y0, x1, y1).
+        """
+        if self.mode != "all" or index % self.every:
+            return
+        # 큐에서 꺼내는 쪽만 있으므로 가득 차지 않았으면 put_nowait 는 실패하지 않음 (버릴 프레임은 복사하지 않음)
+        if self._queue.full():
+            self.dropped += 1
+            return
+        self._queue.put_nowait((index, rgb.copy(), None if points is None else points.copy(), box))
+
+    def step(self, name: str, rgb: np.ndarray, points: np.ndarray | None, box: tuple[int, int, int, int]) -> None:
+        """
+        단계 이미지 갱신 (close 에서 단계별 마지막 프레임만 저장)
+        """
+        self._steps[name] = (rgb.copy(), None if points is None else points.copy(), box)
+
+    def close(self) -> dict:
+        """
+        남은 프레임을 모두 저장하고 단계 이미지를 기록
+        Returns:
+            dict: written (저장한 프레임 수), dropped (큐가 가득 차 버린 프레임 수)
+        """
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        if self._video is not None:
+            self._video.release()
+            self._video = None
+        for name, (rgb, points, box) in self._steps.items():
+            cv2.imwrite(os.path.join(self.step_dir, f"{name}{self.extension}"), render(rgb, points, box[:2]), self.params)
+        self._steps.clear()
+        return {"written": self.written, "dropped": self.dropped}
@@ -0,0 +1,261 @@
+import json
+import queue
+import subprocess
+import tempfile
+import threading
+from typing import BinaryIO, Iterator
+
+import numpy as np
+
+# 디코딩 선행 ring buffer 슬롯 수 (0: 추론 루프에서 파이프를 직접 읽고 프레임마다 새 배열 생성)
+PREFETCH_FRAMES = 4
+# 입력 seek 위치를 시작 frame 보다 앞당기는 frame 수 (seek 반올림 오차 흡수, 구간은 타임스탬프 trim 으로 자름)
+SEEK_MARGIN_FRAMES = 2
+
+def _rate(value: str | None) -> float:
+    """
+    ffprobe 분수 표기 frame rate ("30000/1001") 를 float 로 (알 수 없으면 0)
+    """
+    numerator, _, denominator = (value or "0/0").partition("/")
+    try:
+        return float(numerator) / float(denominator or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+def _rotation(stream: dict) -> int:
+    """
+    회전 메타데이터(각도) 조회: display matrix side data, 없으면 구버전 rotate 태그
+    """
+    for side_data in stream.get("side_data_list", []):
+        if "rotation" in side_data:
+            return int(float(side_data["rotation"]))
+    return int(float(stream.get("tags", {}).get("rotate", 0)))
+
+def probe_video(path: str) -> dict[str, float]:
+    """
+    비디오 메타데이터 조회 (ffprobe, 디코딩 없이 컨테이너 정보만 읽음).
+    ffmpeg 는 회전 메타데이터대로 프레임을 돌려서(autorotate) 출력하므로, 90/270 도 회전 영상은
+    width/height 를 바꿔 디코딩 출력 크기와 맞춘다.
+    Args:
+        path (str): 비디오 파일 경로
+    Returns:
+        dict[str, float]: width, height (회전 적용 후), fps, frame_count, rotation
+    Raises:
+        FileNotFoundError: 비디오를 열 수 없는 경우
+    """
+    command = [
+        "ffprobe", "-v", "error", "-select_streams", "v:0",
+        "-show_entries", "stream=width,height,avg_frame_rate,r_frame_rate,nb_frames,duration:stream_tags=rotate"
+        ":stream_side_data=rotation:format=duration",
+        "-of", "json", path,
+    ]
+    completed = subprocess.run(command, capture_output=True)
+    probed = json.loads(completed.stdout or b"{}") if completed.returncode == 0 else {}
+    if not probed.get("streams"):
+        raise FileNotFoundError(f"비디오를 열 수 없습니다: {path}")
+    stream = probed["streams"][0]
+    width, height = int(stream["width"]), int(stream["height"])
+    rotation = _rotation(stream)
+    if rotation % 180:
+        width, height = height, width
+    fps = _rate(stream.get("avg_frame_rate")) or _rate(stream.get("r_frame_rate"))
+    frame_count = int(stream.get("nb_frames") or 0)
+    if not frame_count:
+        # nb_frames 가 없는 컨테이너 (mkv/webm 등) 는 길이로 추정
+        duration = float(stream.get("duration") or probed.get("format", {}).get("duration") or 0)
+        frame_count = int(round(duration * fps))
+    return {"width": width, "height": height, "fps": fps, "frame_count": frame_count, "rotation": rotation}
+
+def output_size(width: int, height: int, max_width: int | None = None) -> tuple[int, int]:
+    """
+    다운스케일 후 출력 해상도 계산 (비율 유지, 짝수 크기)
+    """
+    if not max_width or width <= max_width:
+        return width, height
+    scaled_width = max_width - max_width % 2
+    scaled_height = max(2, int(round(height * scaled_width / width / 2)) * 2)
+    return scaled_width, scaled_height
+
+def expected_frames(info: dict[str, float], fps: float | None = None) -> int:
+    """
+    디코딩될 프레임 수 추정 (버퍼 사전 할당용)
+    """
+    if fps and info["fps"]:
+        return int(info["frame_count"] * fps / info["fps"]) + 1
+    return info["frame_count"]
+
+class FrameRing:
+    """
+    디코더 출력 파이프를 미리 읽는 producer 스레드 + 재사용 프레임 ring buffer.
+    스레드가 빈 슬롯(미리 할당한 RGB 배열)에 다음 프레임을 바로 readinto 하므로 추론하는 동안에도 디코딩 결과를
+    받아 두고, 프레임마다 새 배열을 만들지 않는다 (파이프 읽기는 GIL 을 놓는다).
+    반환한 배열은 다음 프레임을 요청하면 producer 가 다시 채우므로, 보관하려면 복사해야 한다.
+    """
+
+    def __init__(self, stream: BinaryIO, shape: tuple[int, int, int], depth: int = PREFETCH_FRAMES):
+        """
+        Args:
+            stream ``BinaryIO``: 디코더 stdout (버퍼 없는 raw 파이프 권장).
+            shape (tuple[int, int, int]): 프레임 (height, width, 3).
+            depth (int): 슬롯 수 (소비 중인 1개 + 미리 읽을 프레임 수, 최소 2).
+        """
+        self._stream = stream
+        self._buffers = np.empty((max(2, int(depth)), *shape), dtype=np.uint8)
+        self._free: queue.Queue = queue.Queue()
+        self._ready: queue.Queue = queue.Queue()
+        self._error: Exception | None = None
+        for slot in range(len(self._buffers)):
+            self._free.put(slot)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _fill(self, slot: int) -> bool:
+        view = memoryview(self._buffers[slot]).cast("B")
+        filled = 0
+        while filled < len(view):
+            count = self._stream.readinto(view[filled:])
+            if not count:
+                return False
+            filled += count
+        return True
+
+    def _run(self) -> None:
+        try:
+            while (slot := self._free.get()) is not None and self._fill(slot):
+                self._ready.put(slot)
+        except Exception as e:
+            self._error = e
+        finally:
+            # 끝(EOF, 마지막 불완전 프레임 포함)이나 오류를 소비자에게 알림
+            self._ready.put(None)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        held = None
+        while True:
+            slot = self._ready.get()
+            # 소비자가 다음 프레임을 요청했으므로 이전 슬롯을 다시 채울 수 있음
+            if held is not None:
+                self._free.put(held)
+            if slot is None:
+                if self._error is not None:
+                    raise self._error
+                return
+            held = slot
+            yield self._buffers[slot]
+
+    def close(self) -> None:
+        """
+        producer 스레드 종료 대기 (디코더 프로세스를 먼저 종료해 파이프 읽기를 끝내야 함)
+        """
+        self._free.put(None)
+        self._thread.join()
+
+def iter_frames(
+    path: str,
+    fps: float | None = None,
+    max_width: int | None = None,
+    hflip: bool = False,
+    pix_fmt: str = "rgb24",
+    info: dict[str, float] | None = None,
+    start_frame: int = 0,
+    end_frame: int | None = None,
+    stride: int = 1,
+    crop: tuple[int, int, int, int] | None = None,
+    prefetch: int = PREFETCH_FRAMES,
+) -> Iterator[np.ndarray]:
+    """
+    ffmpeg 로 디코딩한 raw 프레임을 파이프로 받아 numpy 배열로 순차 반환.
+    중간 트랜스코딩 파일/H.264 인코딩 없이 디코딩과 분석이 동시에 진행된다.
+    Args:
+        path (str): 비디오 파일 경로
+        fps (float | None): 지정 시 해당 fps 로 리샘플링 (프레임 drop/dup). None 이면 모든 프레임 유지.
+        max_width (int | None): 지정 시 가로 해상도를 이 값 이하로 축소
+        hflip (bool): 좌우 반전 (왼손잡이)
+        pix_fmt (str): 출력 픽셀 포맷 (rgb24 | bgr24)
+        info (dict[str, float] | None): ``probe_video`` 결과 (이미 조회한 경우 재사용)
+        start_frame (int): 이 프레임부터 반환 (fps 리샘플링 이후 index 기준). 입력 seek 로 이전 프레임은 디코딩하지 않는다.
+        end_frame (int | None): 이 프레임 전까지 반환 (None 이면 끝까지)
+        stride (int): N 프레임마다 1개만 반환
+        crop (tuple[int, int, int, int] | None): 지정 시 (x0, y0, x1, y1) 영역만 반환
+            (축소/좌우 반전 이후 좌표 기준, 짝수 좌표 권장)
+        prefetch (int): ``FrameRing`` 슬롯 수. 0 이면 소비자가 파이프를 직접 읽는다.
+    Yields:
+        np.ndarray: (height, width, 3) uint8 프레임. prefetch 사용 시 다음 프레임을 요청하면 재사용되는 버퍼이므로
+            보관하려면 복사해야 한다.
+    Raises:
+        RuntimeError: ffmpeg 디코딩 실패 시
+    """
+    info = info or probe_video(path)
+    width, height = output_size(info["width"], info["height"], max_width)
+
+    # 구간 시작 근처로 입력 seek (-ss 를 -i 앞에) 해서 앞부분 프레임을 디코딩하지 않고,
+    # seek 위치 기준 타임스탬프로 남은 여유 프레임만 잘라 낸다 (고정 frame rate 기준 frame 단위로 정확)
+    rate = fps or info["fps"]
+    seek = max(0, start_frame - SEEK_MARGIN_FRAMES) if rate else 0
+
+    filters = []
+    if fps:
+        filters.append(f"fps={fps}")
+    if start_frame or end_frame is not None:
+        if rate:
+            # 반 frame 여유: 타임스탬프 반올림 오차
+            trim = [f"start={(start_frame - seek - 0.5) / rate:.6f}"] if start_frame else []
+            trim += [f"end={(end_frame - seek - 0.5) / rate:.6f}"] if end_frame is not None else []
+        else:
+            trim = [f"start_frame={start_frame}"] + ([f"end_frame={end_frame}"] if end_frame is not None else [])
+        filters.append("trim=" + ":".join(trim))
+    if stride > 1:
+        filters.append(f"select=not(mod(n\\,{stride}))")
+    if (width, height) != (info["width"], info["height"]):
+        filters.append(f"scale={width}:{height}:flags=area")
+    if hflip:
+        filters.append("hflip")
+    if crop is not None:
+        x0, y0, x1, y1 = crop
+        filters.append(f"crop={x1 - x0}:{y1 - y0}:{x0}:{y0}")
+        width, height = x1 - x0, y1 - y0
+
+    command = ["ffmpeg", "-loglevel", "error"]
+    if seek:
+        command += ["-ss", f"{seek / rate:.6f}"]
+    command += ["-i", path, "-an", "-sn"]
+    if filters:
+        command += ["-vf", ",".join(filters)]
+    if start_frame or end_frame is not None or stride > 1:
+        # 구간/간격 선택 시 빈 타임스탬프를 프레임 복제로 채우지 않도록
+        command += ["-vsync", "passthrough"]
+    command += ["-f", "rawvideo", "-pix_fmt", pix_fmt, "pipe:1"]
+
+    frame_bytes = width * height * 3
+    # ring buffer 는 파이프에서 슬롯으로 바로 읽으므로 중간 버퍼 없이 (bufsize=0)
+    # stderr 는 파이프 대신 임시 파일로 받아, 경고가 많아도 파이프 버퍼(약 64KiB)가 차서 ffmpeg 가 멈추지 않게 한다
+    errors = tempfile.TemporaryFile()
+    try:
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=errors, bufsize=0 if prefetch else frame_bytes * 2,
+        )
+    except BaseException:
+        errors.close()
+        raise
+    ring = FrameRing(process.stdout, (height, width, 3), prefetch) if prefetch else None
+    try:
+        if ring is not None:
+            yield from ring
+        else:
+            while True:
+                buffer = process.stdout.read(frame_bytes)
+                if len(buffer) < frame_bytes:
+                    break
+                yield np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 3)
+        if process.wait() != 0:
+            errors.seek(0)
+            raise RuntimeError(f"ffmpeg 디코딩 실패: {errors.read().decode(errors='ignore').strip()}")
+    finally:
+        # 소비자가 중간에 멈춘 경우(finish 조기 종료 등) 프로세스 정리 후 producer 스레드 종료
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        if ring is not None:
+            ring.close()
+        process.stdout.close()
+        errors.close()
@@ -0,0 +1,80 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from utils.progress import ProgressHub, init_progress
+
+# 기동 확인 작업 하나를 붙잡는 시간 (먼저 뜬 프로세스가 모든 확인 작업을 가져가지 않도록)
+PING_HOLD_SEC = 0.05
+
+def _ping(probe: Callable | None = None) -> tuple[int, Any]:
+    time.sleep(PING_HOLD_SEC)
+    return os.getpid(), probe() if probe is not None else None
+
+def _init_worker(channel, initializer: Callable | None, initargs: tuple) -> None:
+    init_progress(channel)
+    if initializer is not None:
+        initializer(*initargs)
+
+class AnalysisEngine:
+    """
+    분석 작업 실행 엔진.
+    uvicorn 워커마다 고정된 슬롯 수의 프로세스 풀을 두고, 블로킹 분석 함수는 풀에서 실행한다.
+    async 핸들러는 작업을 제출하고 결과를 await 하기만 하므로 이벤트 루프가 막히지 않는다.
+    """
+
+    def __init__(self, max_workers: int = 2, initializer: Callable | None = None, initargs: tuple = ()):
+        """
+        Args:
+            max_workers (int): 워커당 동시 분석 슬롯 수 (프로세스 수).
+            initializer (Callable | None): 각 자식 프로세스 시작 시 실행할 함수.
+            initargs (tuple): initializer 인자.
+        """
+        self.max_workers = max_workers
+        # mediapipe 는 fork 이후 상태 공유에 안전하지 않으므로 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        # 자식 프로세스의 분석 진행 이벤트 (단계 검출, 프레임 진행) 전달용
+        self.progress = ProgressHub(context.Queue())
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.progress.channel, initializer, initargs),
+        )
+
+    async def start(self, probe: Callable | None = None) -> dict[int, Any]:
+        """
+        모든 슬롯의 자식 프로세스를 미리 기동하여 initializer(모델 로딩 등)를 시작 시점에 끝낸다.
+        먼저 준비된 프로세스가 확인 작업을 모두 처리할 수 있으므로, 모든 프로세스(pid)가 응답할 때까지 반복한다.
+        Args:
+            probe (Callable | None): 각 프로세스에서 실행해 결과를 받을 함수 (pickle 가능한 모듈 수준 함수).
+        Returns:
+            dict[int, Any]: pid 별 probe 결과 (probe 가 없으면 None)
+        """
+        self.progress.start()
+        workers = {}
+        while len(workers) < self.max_workers:
+            workers.update(await asyncio.gather(*(self.run(_ping, probe) for _ in range(self.max_workers))))
+        return workers
+
+    async def run(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        프로세스 풀에 작업을 제출하고 완료될 때까지 대기.
+        Args:
+            fn (Callable): 실행할 함수 (pickle 가능한 모듈 수준 함수).
+        Returns:
+            Any: fn 의 반환값
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        프로세스 풀 종료. 대기 중인 작업은 취소한다.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self.progress.close()
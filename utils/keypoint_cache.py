@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+class KeypointCache:
+    """
+    영상 내용 기반 키포인트 캐시 (로컬 디스크).
+    (영상 content hash, 손 타입, 모델/디코딩 설정) 이 같으면 같은 랜드마크가 나오므로
+    프레임별 랜드마크 배열 (frames, joints, 4) float32 를 ``<key>.npy`` 로 저장해 재추론을 생략한다.
+    전체 크기가 ``max_bytes`` 를 넘으면 가장 오래 사용되지 않은(mtime 기준) 항목부터 제거한다.
+    """
+
+    def __init__(self, root: str = "keypoint_cache", max_bytes: int = 512 * 1024 * 1024):
+        """
+        Args:
+            root (str): 캐시 폴더 (워커 간 공유).
+            max_bytes (int): 캐시 전체 크기 상한(bytes).
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def key(content_id: str, hand_type: str, signature: dict) -> str:
+        """
+        캐시 키 생성
+        Args:
+            content_id (str): 영상 내용 식별자 (``Storage.fingerprint``).
+            hand_type (str): 손 타입 (R 또는 L).
+            signature (dict): 랜드마크에 영향을 주는 모델/디코딩 설정.
+        Returns:
+            str: sha256 hex
+        """
+        payload = json.dumps([content_id, hand_type, signature], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.npy")
+
+    def get(self, key: str) -> np.ndarray | None:
+        """
+        캐시 조회. 적중 시 mtime 을 갱신해 LRU 순서를 유지한다.
+        Returns:
+            np.ndarray | None: (frames, joints, 4) 랜드마크, 없으면 None
+        """
+        path = self._path(key)
+        try:
+            landmarks = np.load(path)
+            os.utime(path)
+        except (FileNotFoundError, ValueError, OSError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return landmarks
+
+    def put(self, key: str, landmarks: np.ndarray) -> None:
+        """
+        캐시 저장. 임시 파일에 기록한 뒤 교체하므로 다른 워커가 불완전한 파일을 읽지 않는다.
+        임시 파일 이름은 호출마다 달라 같은 키를 동시에 저장해도(같은 워커의 여러 스레드 포함) 충돌하지 않는다.
+        Args:
+            key (str): 캐시 키.
+            landmarks (np.ndarray): (frames, joints, 4) 랜드마크.
+        """
+        fd, partial = tempfile.mkstemp(prefix=f"{key}.", suffix=".part", dir=self.root)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.save(file, np.ascontiguousarray(landmarks, dtype=np.float32))
+            os.replace(partial, self._path(key))
+        except BaseException:
+            os.remove(partial)
+            raise
+        self.evict()
+
+    def _entries(self) -> list[os.DirEntry]:
+        return [entry for entry in os.scandir(self.root) if entry.name.endswith(".npy")]
+
+    def evict(self) -> None:
+        """
+        전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용되지 않은 항목 제거
+        """
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def stats(self) -> dict:
+        """
+        적중/실패 횟수(현재 워커) 및 캐시 사용량
+        """
+        entries = self._entries()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(entries),
+            "bytes": sum(entry.stat().st_size for entry in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+def create_keypoint_cache(config: dict | None) -> KeypointCache | None:
+    """
+    설정에 따른 키포인트 캐시 생성
+    Args:
+        config (dict | None): KEYPOINT_CACHE 설정 (enabled, path, max_bytes)
+    Returns:
+        KeypointCache | None: 비활성화 시 None
+    """
+    config = config or {}
+    if not config.get("enabled", True):
+        return None
+    return KeypointCache(
+        root=config.get("path", "keypoint_cache"),
+        max_bytes=int(config.get("max_bytes", 512 * 1024 * 1024)),
+    )
@@ -0,0 +1,204 @@
+import json
+import os
+import struct
+import tempfile
+import time
+import urllib.request
+
+import numpy as np
+
+from utils.landmark import CHANNELS, KEY_POINT_STRING
+from utils.task_path import MARK, task_filename, task_id_of
+
+# 파일 형식: MAGIC(4) + header 길이(uint32 LE) + JSON header + 공백 padding + (frames, joints, 4) float32 C-order 본문
+# 본문 시작 위치는 ALIGN 배수라 np.memmap 으로 바로 매핑할 수 있다.
+MAGIC = b"PLMK"
+VERSION = 1
+ALIGN = 64
+EXTENSION = ".kpt"
+# 세션 모드 스윙 구간 파일 접미사 (``task_filename`` 결과에 나오지 않는 문자로 시작해 task_id 와 겹치지 않음)
+SEGMENT_SUFFIX = MARK + "seg"
+
+def export_path(root: str, task_id: str, segment: int | None = None) -> str:
+    """
+    작업별 키포인트 파일 경로 (``task_filename`` 으로 인코딩, 세션 모드 스윙 구간은 ``@seg<번호>`` 추가)
+    """
+    name = task_filename(task_id) + (f"{SEGMENT_SUFFIX}{segment}" if segment is not None else "")
+    return os.path.join(root, name + EXTENSION)
+
+def sweep_exports(root: str, ttl_sec: float, task_results=None) -> int:
+    """
+    ttl_sec 보다 오래된 키포인트 파일(임시 파일 포함)과, task_results 지정 시 결과 저장소에서 사라진
+    (TTL 만료/개수 초과로 제거된) 작업의 키포인트 파일 삭제.
+    Args:
+        root (str): 키포인트 파일 폴더.
+        ttl_sec (float): 파일 보존 시간(초, 수정 시각 기준).
+        task_results ``ResultStore | None``: 모든 워커가 공유하는 작업 결과 저장소 (워커별 저장소는 다른 워커의
+            작업을 모르므로 지정하지 않음).
+    Returns:
+        int: 삭제한 파일 수
+    """
+    now, removed = time.time(), 0
+    for entry in os.scandir(root) if os.path.isdir(root) else ():
+        if entry.name.endswith(EXTENSION):
+            task_id = task_id_of(entry.name[:-len(EXTENSION)].split(SEGMENT_SUFFIX)[0])
+        elif entry.name.endswith(".part"):
+            # 중단된 쓰기가 남긴 임시 파일은 보존 시간만 확인
+            task_id = None
+        else:
+            continue
+        try:
+            if now - entry.stat().st_mtime > ttl_sec or (task_results is not None and task_id is not None and task_id not in task_results):
+                os.remove(entry.path)
+                removed += 1
+        except FileNotFoundError:
+            # 다른 워커가 먼저 삭제
+            pass
+    return removed
+
+def _partial(path: str) -> tuple[int, str]:
+    """
+    path 와 같은 폴더의 임시 파일 (호출마다 다른 이름이라 같은 task_id 를 동시에 저장해도 충돌하지 않음)
+    Returns:
+        tuple[int, str]: 파일 디스크립터, 경로
+    """
+    return tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".part", dir=os.path.dirname(path) or ".")
+
+def encode_header(landmarks: np.ndarray, **meta) -> bytes:
+    """
+    파일 앞부분 (MAGIC + 길이 + JSON header + padding)
+    Args:
+        landmarks ``np.ndarray``: (frames, joints, 4) 랜드마크.
+        **meta: header 에 추가할 값 (task_id, hand_type, step 등).
+    """
+    header = {
+        "version": VERSION,
+        "dtype": "<f4",
+        "shape": list(landmarks.shape),
+        "joints": KEY_POINT_STRING,
+        "channels": list(CHANNELS),
+        **meta,
+    }
+    body = json.dumps(header, ensure_ascii=False).encode()
+    prefix = len(MAGIC) + 4
+    padding = -(prefix + len(body)) % ALIGN
+    body += b" " * padding
+    return MAGIC + struct.pack("<I", len(body)) + body
+
+def write_keypoints(path: str, landmarks: np.ndarray, **meta) -> int:
+    """
+    랜드마크를 키포인트 파일로 저장. 임시 파일에 기록한 뒤 교체하므로 읽는 쪽이 불완전한 파일을 보지 않는다.
+    Args:
+        path (str): 저장 경로.
+        landmarks ``np.ndarray``: (frames, joints, 4) 랜드마크.
+        **meta: header 에 추가할 값.
+    Returns:
+        int: 파일 크기(bytes)
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    data = np.ascontiguousarray(landmarks, dtype="<f4")
+    fd, partial = _partial(path)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(encode_header(data, **meta))
+            file.write(memoryview(data).cast("B"))
+        os.replace(partial, path)
+    except BaseException:
+        os.remove(partial)
+        raise
+    return os.path.getsize(path)
+
+def decode_header(prefix: bytes) -> tuple[dict, int]:
+    """
+    파일 앞부분에서 header 와 본문 시작 위치(bytes)를 읽음
+    Args:
+        prefix (bytes): 파일 앞부분 (header 전체를 포함해야 함).
+    Raises:
+        ValueError: 키포인트 파일이 아니거나 header 가 잘린 경우
+    """
+    if prefix[:len(MAGIC)] != MAGIC:
+        raise ValueError("키포인트 파일이 아닙니다")
+    (length,) = struct.unpack("<I", prefix[len(MAGIC):len(MAGIC) + 4])
+    offset = len(MAGIC) + 4 + length
+    if len(prefix) < offset:
+        raise ValueError("header 가 잘렸습니다")
+    return json.loads(prefix[len(MAGIC) + 4:offset]), offset
+
+def read_header(path: str) -> tuple[dict, int]:
+    """
+    키포인트 파일의 header 와 본문 시작 위치(bytes)
+    """
+    with open(path, "rb") as file:
+        prefix = file.read(len(MAGIC) + 4)
+        if len(prefix) < len(MAGIC) + 4:
+            raise ValueError("키포인트 파일이 아닙니다")
+        (length,) = struct.unpack("<I", prefix[len(MAGIC):])
+        return decode_header(prefix + file.read(length))
+
+def load_keypoints(path: str, mmap: bool = True) -> tuple[dict, np.ndarray]:
+    """
+    키포인트 파일 읽기 (클라이언트용). 기본은 메모리 매핑이라 필요한 프레임만 디스크에서 읽는다.
+    Args:
+        path (str): 키포인트 파일 경로.
+        mmap (bool): False 이면 전체를 메모리로 읽음.
+    Returns:
+        tuple[dict, np.ndarray]: header (joints, channels, shape, step 등), (frames, joints, 4) float32 배열 (읽기 전용)
+    """
+    header, offset = read_header(path)
+    shape = tuple(header["shape"])
+    if mmap:
+        if not np.prod(shape):
+            return header, np.empty(shape, dtype=header["dtype"])
+        return header, np.memmap(path, dtype=header["dtype"], mode="r", offset=offset, shape=shape)
+    with open(path, "rb") as file:
+        file.seek(offset)
+        return header, np.fromfile(file, dtype=header["dtype"]).reshape(shape)
+
+def fetch_keypoints(url: str, path: str, mmap: bool = True) -> tuple[dict, np.ndarray]:
+    """
+    ``/pose/keypoints`` 에서 키포인트 파일을 내려받아 path 에 저장한 뒤 읽음 (클라이언트용)
+    Args:
+        url (str): 예) http://host:8000/pose/keypoints?task_id=username/videoname.mp4
+        path (str): 저장 경로.
+    """
+    fd, partial = _partial(path)
+    try:
+        with os.fdopen(fd, "wb") as file, urllib.request.urlopen(url) as response:
+            while chunk := response.read(1 << 20):
+                file.write(chunk)
+        os.replace(partial, path)
+    except BaseException:
+        os.remove(partial)
+        raise
+    return load_keypoints(path, mmap=mmap)
+
+def fetch_frames(url: str, start: int, stop: int, header_bytes: int = 4096) -> tuple[dict, np.ndarray]:
+    """
+    ``/pose/keypoints`` 에서 [start, stop) 프레임만 Range 요청으로 받음 (클라이언트용)
+    Args:
+        url (str): 예) http://host:8000/pose/keypoints?task_id=username/videoname.mp4
+        start (int): 시작 frame.
+        stop (int): 끝 frame (포함하지 않음).
+        header_bytes (int): header 를 읽기 위해 처음 요청할 크기 (부족하면 한 번 더 요청).
+    Returns:
+        tuple[dict, np.ndarray]: header, (stop - start, joints, 4) float32 배열
+    """
+    def read_range(first: int, last: int) -> bytes:
+        request = urllib.request.Request(url, headers={"Range": f"bytes={first}-{last}"})
+        with urllib.request.urlopen(request) as response:
+            return response.read()
+
+    prefix = read_range(0, header_bytes - 1)
+    try:
+        header, offset = decode_header(prefix)
+    except ValueError:
+        (length,) = struct.unpack("<I", prefix[len(MAGIC):len(MAGIC) + 4])
+        header, offset = decode_header(read_range(0, len(MAGIC) + 4 + length - 1))
+
+    frames, joints, channels = header["shape"]
+    start, stop = max(0, start), min(stop, frames)
+    if stop <= start:
+        return header, np.empty((0, joints, channels), dtype=header["dtype"])
+    frame_bytes = joints * channels * np.dtype(header["dtype"]).itemsize
+    body = read_range(offset + start * frame_bytes, offset + stop * frame_bytes - 1)
+    return header, np.frombuffer(body, dtype=header["dtype"]).reshape(stop - start, joints, channels)
@@ -0,0 +1,120 @@
+import numpy as np
+
+from utils.loader import yaml_loader
+
+# YAML 설정 값 로드
+KEYPOINTS = yaml_loader("keypoints.yaml")
+
+KEY_POINT_STRING = KEYPOINTS.get("key_point_string")
+STRING_MATCH_INDEX = KEYPOINTS.get("string_match_index")
+
+# 채널 순서: 픽셀 x, 픽셀 y, 정규화 z, 정규화 x
+CHANNELS = ("x", "y", "z_norm", "x_norm")
+X, Y, Z_NORM, X_NORM = range(len(CHANNELS))
+
+# joint 이름 -> 배열 index (keypoints.yaml 의 key_point_string 순서)
+JOINT_INDEX = {joint: index for index, joint in enumerate(KEY_POINT_STRING)}
+
+def extract_landmarks(results, width: int, height: int, origin: tuple[int, int] = (0, 0)) -> np.ndarray:
+    """
+    Mediapipe 결과에서 keypoints.yaml 에 정의된 joint 만 추출
+    Args:
+        results: ``Pose.process`` 결과 (pose_landmarks 가 있어야 함)
+        width (int): 프레임(또는 ROI) 가로 크기 (픽셀 좌표 변환용)
+        height (int): 프레임(또는 ROI) 세로 크기
+        origin (tuple[int, int]): ROI 좌상단의 원본 프레임 픽셀 좌표
+    Returns:
+        np.ndarray: (joints, 4) float32 [x, y, z_norm, x_norm]
+    """
+    landmark = results.pose_landmarks.landmark
+    world_landmark = results.pose_world_landmarks.landmark
+    x0, y0 = origin
+    return np.array(
+        [
+            (
+                landmark[index].x * width + x0, landmark[index].y * height + y0,
+                world_landmark[index].z, world_landmark[index].x,
+            )
+            for index in STRING_MATCH_INDEX
+        ],
+        dtype=np.float32,
+    )
+
+class LandmarkBuffer:
+    """
+    프레임별 랜드마크를 담는 (frames, joints, 4) float32 버퍼.
+    영상 프레임 수로 미리 할당하고, 부족하면 2배씩 늘린다.
+    """
+
+    def __init__(self, capacity: int, joints: list[str] | None = None):
+        """
+        Args:
+            capacity (int): 초기 프레임 수 (보통 CAP_PROP_FRAME_COUNT)
+            joints (list[str] | None): joint 이름 목록 (기본: keypoints.yaml)
+        """
+        self.joints = joints or KEY_POINT_STRING
+        self.data = np.zeros((max(int(capacity), 1), len(self.joints), len(CHANNELS)), dtype=np.float32)
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        기록된 프레임 구간의 view (frames, joints, 4)
+        """
+        return self.data[:self.length]
+
+    @property
+    def last(self) -> np.ndarray:
+        """
+        마지막 프레임 view (joints, 4)
+        """
+        return self.data[self.length - 1]
+
+    def _reserve(self) -> None:
+        if self.length == len(self.data):
+            grown = np.zeros((len(self.data) * 2, *self.data.shape[1:]), dtype=np.float32)
+            grown[:self.length] = self.data
+            self.data = grown
+
+    def append(self, values: np.ndarray) -> np.ndarray:
+        """
+        프레임 추가
+        Args:
+            values (np.ndarray): (joints, 4) 랜드마크
+        Returns:
+            np.ndarray: 추가된 프레임 view (보정 시 직접 수정 가능)
+        """
+        self._reserve()
+        self.data[self.length] = values
+        self.length += 1
+        return self.last
+
+    def append_previous(self) -> np.ndarray:
+        """
+        이전 프레임 값으로 프레임 추가 (랜드마크 미검출 프레임). 첫 프레임이면 0.
+        """
+        self._reserve()
+        if self.length > 0:
+            self.data[self.length] = self.data[self.length - 1]
+        self.length += 1
+        return self.last
+
+    def joint(self, name: str) -> np.ndarray:
+        """
+        joint 하나의 (frames, 4) view
+        """
+        return self.array[:, JOINT_INDEX[name]]
+
+    def to_dict(self) -> dict[str, dict[str, list[float]]]:
+        """
+        JSON 출력용 ``{joint: {"x": [...], "y": [...], "z_norm": [...], "x_norm": [...]}}`` 변환.
+        요청 시에만 생성한다.
+        """
+        array = self.array
+        return {
+            joint: {channel: array[:, j, c].tolist() for c, channel in enumerate(CHANNELS)}
+            for j, joint in enumerate(self.joints)
+        }
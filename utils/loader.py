@@ -1,5 +1,6 @@
 import yaml
 import logging
+from functools import lru_cache
 from typing import Any
 
 def yaml_loader(path: str) -> dict[str, Any]:
@@ -19,4 +20,35 @@ def yaml_loader(path: str) -> dict[str, Any]:
     except FileNotFoundError as e:
         raise FileNotFoundError(f"YAML 파일을 찾을 수 없습니다: {path}") from e
     except yaml.YAMLError as e:
-        raise ValueError(f"YAML 파일 로드 중 에러가 발생했습니다: {e}") from e
\ No newline at end of file
+        raise ValueError(f"YAML 파일 로드 중 에러가 발생했습니다: {e}") from e
+
+@lru_cache(maxsize=None)
+def load_config(path: str = "config.yaml") -> dict[str, Any]:
+    """
+    설정 파일 로드 (프로세스당 한 번만 읽고 이후 호출은 같은 객체 반환, 수정하지 말 것)
+    Args:
+        path (str): 설정 파일 경로
+    Returns:
+        dict[str, Any]: 로드된 설정
+    """
+    return yaml_loader(path)
+
+def initialize_logger(path: str, level: int = logging.INFO) -> logging.Logger:
+    """
+    공통 로거 초기화
+    Args:
+        path (str): 로그 파일 경로
+        level (int): 로그 레벨
+    Returns:
+        logging.Logger: 파일/콘솔 핸들러가 연결된 로거
+    """
+    logger = logging.getLogger("km-analysis")
+    if logger.handlers:  # 이미 초기화된 경우 재사용
+        return logger
+
+    logger.setLevel(level)
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+    for handler in (logging.FileHandler(path, encoding="utf-8"), logging.StreamHandler()):
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    return logger
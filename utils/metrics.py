@@ -0,0 +1,133 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+# 단계별 소요 시간 히스토그램 버킷 (초)
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+# 작업당 프레임 수 히스토그램 버킷
+FRAME_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+class StageTimer:
+    """
+    작업 한 건의 단계별 누적 소요 시간과 프레임 카운터.
+    분석 프로세스 안에서 기록한 뒤 ``summary()`` 로 결과에 붙여 반환한다.
+    """
+
+    def __init__(self):
+        self.stages: dict[str, float] = {}
+        self.counters: dict[str, int | None] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        블록 실행 시간을 name 단계에 누적
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def iterate(self, name: str, iterable: Iterable) -> Iterator:
+        """
+        iterable 의 다음 항목을 받아오는 시간(디코딩 대기 등)을 name 단계에 누적하며 순회
+        """
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.add(name, time.perf_counter() - start)
+            yield item
+
+    def summary(self) -> dict:
+        return {"stages": {name: round(seconds, 4) for name, seconds in self.stages.items()}, **self.counters}
+
+class Histogram:
+    """
+    Prometheus 형식 히스토그램 (label 값별 누적 버킷 / 합계 / 개수)
+    """
+
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...], label: str | None = None):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self.label = label
+        self._series: dict[str | None, list] = {}  # label 값 -> [버킷별 개수, 합계, 개수]
+
+    def observe(self, value: float, label: str | None = None) -> None:
+        series = self._series.setdefault(label, [[0] * len(self.buckets), 0.0, 0])
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[0][i] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for label, (counts, total, count) in sorted(self._series.items(), key=lambda item: str(item[0])):
+            prefix = f'{self.label}="{label}",' if self.label is not None else ""
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound:g}"}} {bucket_count}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {count}')
+            labels = f"{{{prefix[:-1]}}}" if prefix else ""
+            lines.append(f"{self.name}_sum{labels} {total:.6f}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+class MetricsRegistry:
+    """
+    워커(프로세스)별 분석 지표 저장소. ``/metrics`` 에서 Prometheus 텍스트 형식으로 내보낸다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stage_seconds = Histogram("pose_stage_seconds", "작업당 단계별 소요 시간(초)", STAGE_BUCKETS, label="stage")
+        self.task_frames = Histogram("pose_task_frames", "작업당 분석 프레임 수", FRAME_BUCKETS)
+        self.task_none_frames = Histogram("pose_task_none_frames", "작업당 랜드마크 미검출 프레임 수", FRAME_BUCKETS)
+        self.tasks: dict[str, int] = {}
+
+    def record(self, status: str, metrics: dict) -> None:
+        """
+        작업 한 건의 단계별 시간/프레임 수 기록
+        Args:
+            status (str): 작업 결과 상태 (step_completed, error).
+            metrics (dict): ``StageTimer.summary()`` 형식의 작업 지표.
+        """
+        with self._lock:
+            self.tasks[status] = self.tasks.get(status, 0) + 1
+            for stage, seconds in metrics.get("stages", {}).items():
+                self.stage_seconds.observe(seconds, stage)
+            if metrics.get("frames") is not None:
+                self.task_frames.observe(metrics["frames"])
+            if metrics.get("none_frames") is not None:
+                self.task_none_frames.observe(metrics["none_frames"])
+
+    def render(self, gauges: dict[str, float] | None = None, counters: dict[str, float] | None = None) -> str:
+        """
+        Prometheus 텍스트 형식 (exposition format 0.0.4)
+        Args:
+            gauges (dict[str, float] | None): 함께 내보낼 현재 값 (이름 -> 값).
+            counters (dict[str, float] | None): 함께 내보낼 누적 값 (이름은 ``_total`` 로 끝남).
+        """
+        with self._lock:
+            lines = ["# HELP pose_tasks_total 완료된 작업 수", "# TYPE pose_tasks_total counter"]
+            lines += [f'pose_tasks_total{{status="{status}"}} {count}' for status, count in sorted(self.tasks.items())]
+            for histogram in (self.stage_seconds, self.task_frames, self.task_none_frames):
+                lines += histogram.render()
+        for kind, values in (("gauge", gauges), ("counter", counters)):
+            for name, value in (values or {}).items():
+                if value is None:
+                    continue
+                lines += [f"# TYPE {name} {kind}", f"{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+# 워커별 기본 저장소
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,145 @@
+import os
+import queue
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import numpy as np
+
+from utils.decode import iter_frames
+
+class PoseModelPool:
+    """
+    사전 초기화된 Mediapipe Pose 인스턴스 풀 (model_complexity 별).
+    요청마다 그래프 초기화/모델 로딩을 반복하지 않도록 인스턴스를 체크아웃/반납하며,
+    반납 시 그래프를 리셋하여 이전 영상의 트래킹 상태가 다음 영상에 넘어가지 않게 한다.
+    """
+
+    def __init__(self, sizes: dict[int, int], min_detection_confidence: float = 0.5, min_tracking_confidence: float = 0.5):
+        """
+        Args:
+            sizes (dict[int, int]): model_complexity 별 인스턴스 수 (풀 상한).
+            min_detection_confidence (float): 검출 신뢰도 임계값.
+            min_tracking_confidence (float): 추적 신뢰도 임계값.
+        """
+        self._options = {
+            "min_detection_confidence": min_detection_confidence,
+            "min_tracking_confidence": min_tracking_confidence,
+        }
+        self._pools: dict[int, queue.Queue] = {}
+        self._models: list = []
+        start = time.perf_counter()
+        for complexity, size in sizes.items():
+            self._add(int(complexity), int(size))
+        self.load_sec = time.perf_counter() - start
+        self.warmup_sec: float | None = None
+
+    def _add(self, complexity: int, size: int) -> None:
+        # 모델을 쓰지 않는 서버 프로세스가 mediapipe(약 0.4초)를 import 하지 않도록 인스턴스 생성 시 import
+        import mediapipe as mp
+
+        pool = queue.Queue(maxsize=size)
+        for _ in range(size):
+            model = mp.solutions.pose.Pose(model_complexity=complexity, **self._options)
+            self._models.append(model)
+            pool.put(model)
+        self._pools[complexity] = pool
+
+    @contextmanager
+    def checkout(self, complexity: int, timeout: float | None = None) -> Iterator:
+        """
+        Pose 인스턴스 체크아웃. 블록을 벗어나면 리셋 후 반납된다.
+        설정에 없는 complexity 는 인스턴스 1개로 풀을 생성한다.
+        Args:
+            complexity (int): model_complexity (0, 1, 2).
+            timeout (float | None): 사용 가능한 인스턴스 대기 시간(초).
+        Raises:
+            queue.Empty: timeout 내에 인스턴스를 얻지 못한 경우
+        """
+        if complexity not in self._pools:
+            self._add(complexity, 1)
+        pool = self._pools[complexity]
+        model = pool.get(timeout=timeout)
+        try:
+            yield model
+        finally:
+            # 그래프 재시작으로 트래킹 상태/타임스탬프 초기화
+            model.reset()
+            pool.put(model)
+
+    def warm_up(self, frame: np.ndarray, frames: int = 1) -> float:
+        """
+        모든 인스턴스에 더미 추론을 실행해 첫 추론의 일회성 초기화(추론 엔진 준비, 메모리 할당)를 미리 끝낸다.
+        추론 후 리셋하므로 트래킹 상태는 남지 않는다 (분석 결과 동일).
+        Args:
+            frame ``np.ndarray``: (H, W, 3) RGB 프레임. 사람이 있어야 랜드마크 모델까지 실행된다.
+            frames (int): 인스턴스별 추론 횟수.
+        Returns:
+            float: 소요 시간(초)
+        """
+        start = time.perf_counter()
+        for model in self._models:
+            for _ in range(frames):
+                model.process(frame)
+            model.reset()
+        self.warmup_sec = time.perf_counter() - start
+        return self.warmup_sec
+
+    def close(self) -> None:
+        """
+        모든 인스턴스의 네이티브 리소스 해제
+        """
+        for model in self._models:
+            model.close()
+        self._models.clear()
+        self._pools.clear()
+
+# 프로세스별 풀 (AnalysisEngine 자식 프로세스의 initializer 에서 생성)
+_MODEL_POOL: PoseModelPool | None = None
+DEFAULT_POOL_SIZES = {1: 1, 2: 1}
+# 워밍업 영상이 없을 때 사용하는 검은 프레임 크기 (사람이 없어 검출 모델만 실행됨)
+BLANK_FRAME_SHAPE = (256, 256, 3)
+
+def warmup_frame(video: str | None = None) -> np.ndarray:
+    """
+    워밍업용 프레임 (video 의 첫 프레임, 없으면 검은 프레임)
+    """
+    if video and os.path.exists(video):
+        frames = iter_frames(video, end_frame=1)
+        try:
+            for rgb in frames:
+                return rgb.copy()
+        finally:
+            frames.close()
+    return np.zeros(BLANK_FRAME_SHAPE, dtype=np.uint8)
+
+def init_model_pool(sizes: dict[int, int] | None = None, warmup: dict | None = None) -> None:
+    """
+    현재 프로세스의 Pose 모델 풀 초기화. ``AnalysisEngine`` initializer 로 사용한다.
+    Args:
+        sizes (dict[int, int] | None): model_complexity 별 인스턴스 수.
+        warmup (dict | None): 워밍업 설정 (enabled, video, frames). 사용 시 모든 인스턴스에 더미 추론 실행.
+    """
+    global _MODEL_POOL
+    if _MODEL_POOL is not None:
+        _MODEL_POOL.close()
+    _MODEL_POOL = PoseModelPool(sizes or DEFAULT_POOL_SIZES)
+    if warmup and warmup.get("enabled", True):
+        _MODEL_POOL.warm_up(warmup_frame(warmup.get("video")), int(warmup.get("frames", 1)))
+
+def model_pool_status() -> dict:
+    """
+    현재 프로세스의 모델 풀 초기화 결과 (``AnalysisEngine.start`` probe 로 사용)
+    Returns:
+        dict: pid, load_sec (모델 생성 시간), warmup_sec (워밍업 시간, 미사용 시 None)
+    """
+    pool = get_model_pool()
+    return {"pid": os.getpid(), "load_sec": round(pool.load_sec, 3), "warmup_sec": round(pool.warmup_sec, 3) if pool.warmup_sec is not None else None}
+
+def get_model_pool() -> PoseModelPool:
+    """
+    현재 프로세스의 Pose 모델 풀 반환 (없으면 기본 크기로 생성)
+    """
+    if _MODEL_POOL is None:
+        init_model_pool()
+    return _MODEL_POOL
@@ -0,0 +1,359 @@
+import numpy as np
+
+from utils.detect import (
+    is_address, is_take_away, is_half, is_down_half, is_follow_through, is_finish,
+    LEFT_WRIST, RIGHT_WRIST, LEFT_HIP, RIGHT_HIP, LEFT_SHOULDER, RIGHT_SHOULDER, RIGHT_KNEE, LEFT_ELBOW, RIGHT_ELBOW,
+)
+from utils.keypoint_export import load_keypoints
+from utils.landmark import X, Y
+
+class PhaseDetector:
+    """
+    스윙 단계(address ~ finish) 스트리밍 검출기.
+    프레임마다 현재 랜드마크만 받아 상태를 갱신하며, top/impact/finish_top 판정에 필요한
+    손목 y 의 최고/최저점과 address 안정성 판정용 최근 2프레임을 누적 관리하여 프레임당 O(1) 로 동작한다.
+    기존 ``match detect_flow`` 상태 머신과 동일한 단계 프레임을 반환한다.
+    """
+
+    def __init__(self):
+        self.frame = -1
+        self.flow = "address"  # 현재 검출 중인 단계
+        self.step: dict[str, int] = {}  # 자세 기록용
+        self.is_swing = False  # address 이후 (heavy 모델 사용 구간)
+        self.finished = False
+        self._window: np.ndarray | None = None  # address 안정성 판정용 최근 2프레임
+        self._extreme = 0.0  # 기준 단계 이후 손목 y 최저(top)/최고(impact)값
+        self._finish_top_row: np.ndarray | None = None
+
+    def _push_window(self, current_landmark: np.ndarray) -> np.ndarray:
+        if self._window is None:
+            self._window = np.zeros((2, *current_landmark.shape), dtype=current_landmark.dtype)
+        # 두 슬롯을 번갈아 사용 (is_address 는 최근 2프레임의 순서와 무관)
+        self._window[self.frame % 2] = current_landmark
+        return self._window[:min(self.frame + 1, 2)]
+
+    def _start_swing(self) -> None:
+        self.step = {"address": self.frame}
+        self.is_swing = True
+        self.flow = "take_away"
+
+    def restart(self) -> None:
+        """
+        finish 이후 다음 스윙을 검출하도록 단계 상태 초기화 (세션 모드).
+        frame 번호와 address 안정성 판정용 최근 프레임은 유지하므로 이후 단계 frame 도 영상 기준이다.
+        """
+        self.flow = "address"
+        self.step = {}
+        self.is_swing = False
+        self.finished = False
+        self._extreme = 0.0
+        self._finish_top_row = None
+
+    def update(self, current_landmark: np.ndarray) -> list[str]:
+        """
+        다음 프레임 처리
+        Args:
+            current_landmark ``np.ndarray``: 현재 프레임 랜드마크 (joints, 4). 미검출 프레임은 이전 값.
+        Returns:
+            list[str]: 이번 프레임에서 검출된 단계 이름 (검출 시점의 상태명, 디버그 이미지 이름으로 사용)
+        """
+        self.frame += 1
+        frame = self.frame
+        window = self._push_window(current_landmark)
+        wrist_y = current_landmark[RIGHT_WRIST, Y]
+        events = []
+
+        match self.flow :
+            case "address":
+                if frame>=3 :
+                    if is_address(current_landmark, window):
+                        self._start_swing()
+                        events.append("address")
+
+            case "take_away" :
+                if is_take_away(current_landmark) :
+                    self.step["take_away"] = frame
+                    events.append(self.flow)
+                    self.flow = "half"
+
+            case "half" :
+                if is_half(current_landmark) :
+                    self.step["half"] = frame
+                    self._extreme = wrist_y
+                    events.append(self.flow)
+                    self.flow = "top"
+
+            case "top" :
+                # half 이후 손목이 가장 높은 (y 최소) 프레임
+                if wrist_y <= self._extreme :
+                    self.step["top"] = frame
+                    self._extreme = wrist_y
+                    events.append(self.flow)
+                else :
+                    self.flow = "donw_half"
+
+            case "donw_half" :
+                if is_down_half(current_landmark) :
+                    self.step["down_half"] = frame
+                    self._extreme = wrist_y
+                    events.append(self.flow)
+                    self.flow = "impact"
+
+            case "impact" :
+                # down_half 이후 손목이 가장 낮은 (y 최대) 프레임
+                if wrist_y >= self._extreme :
+                    self.step["impact"] = frame
+                    self._extreme = wrist_y
+                    events.append(self.flow)
+                else :
+                    self.flow = "follow_through"
+
+            case "follow_through" :
+                if is_follow_through(current_landmark) :
+                    self.step["follow_through"] = frame
+                    self._extreme = wrist_y
+                    events.append(self.flow)
+                    self.flow = "finish_top"
+
+            case "finish_top" :
+                if wrist_y <= self._extreme :
+                    self.step["finish_top"] = frame
+                    self._extreme = wrist_y
+                    self._finish_top_row = current_landmark.copy()
+                    events.append(self.flow)
+                else :
+                    self.flow = "finish"
+
+            case "finish" :
+                if "finish_top" not in self.step:
+                    # finish_top 없이 도달한 경우 (기존 상태 머신과 동일하게 실패 처리)
+                    raise KeyError("finish_top")
+                if is_finish(current_landmark, self._finish_top_row[np.newaxis], 0) :
+                    self.step["finish"] = frame
+                    self.finished = True
+                    events.append(self.flow)
+                    return events
+
+        if self.flow != "address":
+            if is_address(current_landmark, window):
+                self._start_swing()
+                events.append("address")
+
+        return events
+
+def phase_masks(
+    landmarks: np.ndarray,
+    spine_angle: tuple[float, float] = (10, 70),
+    wrist_tolerance: float = 0.01,
+    follow_through_divisor: float = 3,
+) -> dict[str, np.ndarray]:
+    """
+    프레임별 단계 조건을 배열 연산으로 한 번에 계산 (``utils/detect.py`` 의 조건과 동일).
+    Args:
+        landmarks ``np.ndarray``: (frames, joints, 4) 랜드마크.
+        spine_angle (tuple[float, float]): address 척추 각도 범위.
+        wrist_tolerance (float): address 손목 안정성 (이전 프레임 대비 상대 변화량 상한).
+        follow_through_divisor (float): follow_through 기준선 (엉덩이-어깨 거리 / divisor).
+    Returns:
+        dict[str, np.ndarray]: 조건별 (frames,) bool 마스크
+    """
+    current = landmarks
+    wrist = current[:, RIGHT_WRIST]
+    wrist_y = wrist[:, Y]
+
+    # address: 척추 각도 / 손목 위치 / 직전 프레임 대비 손목 안정성
+    delta_y = (1 - current[:, RIGHT_SHOULDER, Y]) - (1 - current[:, RIGHT_HIP, Y])
+    delta_x = current[:, RIGHT_SHOULDER, X] - current[:, RIGHT_HIP, X]
+    angle = np.degrees(np.arctan2(delta_y.astype(np.float64), delta_x.astype(np.float64)))
+    angle = np.where(angle < 0, angle + 360, angle)
+    prev_wrist = np.concatenate([wrist[:1], wrist[:-1]])
+    stable = np.ones(len(current), dtype=bool)
+    for channel in (X, Y):
+        scale = np.maximum(np.abs(wrist[:, channel]), 1e-6)
+        stable &= np.abs(wrist[:, channel] - prev_wrist[:, channel]) / scale <= wrist_tolerance
+    address = (
+        (spine_angle[0] <= angle) & (angle <= spine_angle[1])
+        & (current[:, RIGHT_HIP, Y] < wrist_y) & (wrist_y < current[:, RIGHT_KNEE, Y])
+        & stable
+    )
+
+    # half: 손목/팔꿈치 4개 중 2개 이상이 낮은 어깨보다 위
+    shoulder_low = np.maximum(current[:, LEFT_SHOULDER, Y], current[:, RIGHT_SHOULDER, Y])
+    arms = current[:, [RIGHT_WRIST, LEFT_WRIST, RIGHT_ELBOW, LEFT_ELBOW], Y]
+    half = np.count_nonzero(arms <= shoulder_low[:, np.newaxis], axis=1) >= 2
+
+    # follow_through: 손목이 엉덩이-어깨 3등분점보다 위
+    shoulder_y = (current[:, RIGHT_SHOULDER, Y] + current[:, LEFT_SHOULDER, Y]) / 2
+    hip_y = (current[:, RIGHT_HIP, Y] + current[:, LEFT_HIP, Y]) / 2
+    follow_through = hip_y - np.abs(shoulder_y - hip_y) / follow_through_divisor > wrist_y
+
+    return {
+        "address": address,
+        "take_away": ~((wrist_y > current[:, LEFT_HIP, Y]) | (wrist_y > current[:, RIGHT_HIP, Y])),
+        "half": half,
+        "down_half": wrist_y > current[:, RIGHT_SHOULDER, Y],
+        "follow_through": follow_through,
+    }
+
+def _first(mask: np.ndarray, start: int, stop: int) -> int | None:
+    """
+    mask[start:stop] 에서 처음 True 인 frame (없으면 None)
+    """
+    if start >= stop:
+        return None
+    hits = np.flatnonzero(mask[start:stop])
+    return start + int(hits[0]) if len(hits) else None
+
+def _extreme_run(values: np.ndarray, start: int, stop: int, accumulate) -> tuple[int | None, int]:
+    """
+    start 기준 누적 최저/최고점을 계속 갱신하는 구간 계산.
+    Returns:
+        tuple[int | None, int]: (마지막 갱신 frame, 구간이 끊긴 frame (끊기지 않으면 stop))
+    """
+    run = values[start:stop]
+    broken = np.flatnonzero(run != accumulate(run))
+    end = start + int(broken[0]) if len(broken) else stop
+    return (end - 1 if end - 1 > start else None), end
+
+def _segment_steps(landmarks: np.ndarray, masks: dict[str, np.ndarray], address: int, stop: int) -> tuple[dict[str, int], bool]:
+    """
+    address 이후 stop 전까지 한 스윙의 단계 검출.
+    Returns:
+        tuple[dict[str, int], bool]: (단계 frame, finish 도달 여부)
+    """
+    wrist_y = landmarks[:, RIGHT_WRIST, Y]
+    step = {"address": address}
+
+    take_away = _first(masks["take_away"], address + 1, stop)
+    if take_away is None:
+        return step, False
+    step["take_away"] = take_away
+
+    half = _first(masks["half"], take_away + 1, stop)
+    if half is None:
+        return step, False
+    step["half"] = half
+
+    top, end = _extreme_run(wrist_y, half, stop, np.minimum.accumulate)
+    if top is not None:
+        step["top"] = top
+
+    down_half = _first(masks["down_half"], end + 1, stop)
+    if down_half is None:
+        return step, False
+    step["down_half"] = down_half
+
+    impact, end = _extreme_run(wrist_y, down_half, stop, np.maximum.accumulate)
+    if impact is not None:
+        step["impact"] = impact
+
+    follow_through = _first(masks["follow_through"], end + 1, stop)
+    if follow_through is None:
+        return step, False
+    step["follow_through"] = follow_through
+
+    finish_top, end = _extreme_run(wrist_y, follow_through, stop, np.minimum.accumulate)
+    if finish_top is not None:
+        step["finish_top"] = finish_top
+    if end + 1 >= stop:
+        return step, False
+    if finish_top is None:
+        # finish_top 없이 finish 단계에 도달 (스트리밍 검출기와 동일하게 실패 처리)
+        raise KeyError("finish_top")
+
+    # finish: 손목이 finish_top 시점 왼어깨-왼손목 2:1 지점보다 아래
+    base_row = landmarks[finish_top]
+    base_y = ((base_row[LEFT_SHOULDER, Y] + base_row[LEFT_WRIST, Y]) / 2 + base_row[LEFT_WRIST, Y]) / 2
+    finish = _first(base_y < wrist_y, end + 1, stop)
+    if finish is None:
+        return step, False
+    step["finish"] = finish
+    return step, True
+
+def detect_phases(landmarks: np.ndarray, **thresholds) -> dict[str, int]:
+    """
+    저장된 전체 랜드마크 배열에서 스윙 단계를 배열 연산으로 검출 (추론 없이 오프라인 재분석).
+    ``PhaseDetector`` 와 같은 규칙(재-address 시 초기화, 첫 finish 에서 종료)을 따른다.
+    Args:
+        landmarks ``np.ndarray``: (frames, joints, 4) 랜드마크.
+        **thresholds: ``phase_masks`` 임계값 (spine_angle, wrist_tolerance, follow_through_divisor).
+    Returns:
+        dict[str, int]: 단계별 frame
+    """
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    frames = len(landmarks)
+    masks = phase_masks(landmarks, **thresholds)
+
+    # address 이후에는 address 조건이 참인 모든 frame 에서 스윙이 다시 시작된다
+    addresses = np.flatnonzero(masks["address"])
+    addresses = addresses[addresses >= 3]
+    if len(addresses) == 0:
+        return {}
+
+    for i, address in enumerate(addresses):
+        is_last = i == len(addresses) - 1
+        # 다음 address frame 에서도 재시작 전에 단계 검사가 먼저 수행된다
+        stop = frames if is_last else int(addresses[i + 1]) + 1
+        # address~finish 최소 8 frame 이 필요하므로 짧은 구간은 건너뜀 (마지막 구간 제외)
+        if not is_last and stop - address < 9:
+            continue
+        step, finished = _segment_steps(landmarks, masks, int(address), stop)
+        if finished or is_last:
+            return step
+    return {}
+
+def segment_info(step: dict[str, int], fps: float) -> dict:
+    """
+    완료된 스윙 한 개의 구간 정보
+    Args:
+        step (dict[str, int]): address ~ finish 단계 frame.
+        fps (float): 분석 frame 기준 fps (시각 계산용).
+    Returns:
+        dict: step, start/end (address/finish frame), start_sec/end_sec
+    """
+    start, end = step["address"], step["finish"]
+    return {
+        "step": dict(step),
+        "start": start,
+        "end": end,
+        "start_sec": round(start / fps, 3),
+        "end_sec": round(end / fps, 3),
+    }
+
+def detect_segments(landmarks: np.ndarray, fps: float) -> tuple[list[dict], dict[str, int]]:
+    """
+    저장된 랜드마크 배열에서 모든 address ~ finish 스윙 구간 검출 (세션 모드, ``PhaseDetector`` 규칙).
+    Args:
+        landmarks ``np.ndarray``: (frames, joints, 4) 영상 전체 랜드마크.
+        fps (float): 분석 frame 기준 fps.
+    Returns:
+        tuple[list[dict], dict[str, int]]: 완료된 스윙별 ``segment_info`` 목록, 마지막 미완료 스윙의 단계
+    """
+    detector = PhaseDetector()
+    segments = []
+    for current_landmark in landmarks:
+        detector.update(current_landmark)
+        if detector.finished:
+            segments.append(segment_info(detector.step, fps))
+            detector.restart()
+    return segments, detector.step
+
+def detect_phases_batch(items: dict[str, np.ndarray | str], **thresholds) -> dict[str, dict]:
+    """
+    여러 스윙의 단계 검출 (``AnalysisEngine`` 에서 실행)
+    Args:
+        items (dict[str, np.ndarray | str]): id -> (frames, joints, 4) 랜드마크 또는 키포인트 파일 경로
+            (``load_keypoints`` 로 메모리 매핑)
+        **thresholds: ``phase_masks`` 임계값
+    Returns:
+        dict[str, dict]: id -> ``{"status": "step_completed", "step": {...}}`` 또는 ``{"status": "error", "error": ...}``
+    """
+    results = {}
+    for item_id, landmarks in items.items():
+        try:
+            if isinstance(landmarks, str):
+                _, landmarks = load_keypoints(landmarks)
+            results[item_id] = {"status": "step_completed", "step": detect_phases(landmarks, **thresholds)}
+        except Exception as e:
+            results[item_id] = {"status": "error", "error": str(e)}
+    return results
@@ -0,0 +1,102 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable
+
+from utils.task_path import task_filename
+
+# 지원하는 프로파일러 (cprofile: 결정적, sample: 스택 샘플링)
+PROFILE_MODES = ("cprofile", "sample")
+
+def artifact_dir(root: str, task_id: str) -> str:
+    """
+    작업별 프로파일 결과 폴더 (``task_filename`` 으로 인코딩해 작업마다 다른 폴더)
+    """
+    return os.path.join(root, task_filename(task_id))
+
+class StackSampler:
+    """
+    대상 스레드의 파이썬 호출 스택을 주기적으로 샘플링하여 collapsed-stack 형식으로 집계.
+    결과 파일은 flamegraph.pl / speedscope 등에서 바로 열 수 있다.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        """
+        Args:
+            thread_id (int): 샘플링할 스레드 ID.
+            interval (float): 샘플링 간격(초).
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+def run_profiled(mode: str, output_dir: str, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+    """
+    fn 을 프로파일러 아래에서 실행하고 결과 파일을 output_dir 에 저장.
+    ``AnalysisEngine`` 자식 프로세스에서 분석 함수를 감싸 실행하는 용도이며, 요청한 작업에만 사용한다.
+    Args:
+        mode (str): cprofile (analysis.pstats + analysis.txt) 또는 sample (analysis.collapsed).
+        output_dir (str): 결과 파일 폴더.
+        fn (Callable): 실행할 함수 (dict 를 반환하면 ``profile`` 에 결과 파일 목록을 추가).
+    Returns:
+        Any: fn 의 반환값
+    Raises:
+        ValueError: 알 수 없는 mode 인 경우
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"알 수 없는 프로파일러입니다: {mode}")
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        result = profiler.runcall(fn, *args, **kwargs)
+        profiler.dump_stats(os.path.join(output_dir, "analysis.pstats"))
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(40)
+        with open(os.path.join(output_dir, "analysis.txt"), "w") as file:
+            file.write(summary.getvalue())
+        artifacts = ["analysis.pstats", "analysis.txt"]
+    else:
+        sampler = StackSampler(threading.get_ident())
+        sampler.start()
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            sampler.stop()
+        sampler.write(os.path.join(output_dir, "analysis.collapsed"))
+        artifacts = ["analysis.collapsed"]
+
+    if isinstance(result, dict):
+        result["profile"] = {"mode": mode, "sec": round(time.perf_counter() - start, 3), "artifacts": artifacts}
+    return result
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+# 자식 프로세스에서 사용하는 진행 이벤트 채널 (``AnalysisEngine`` initializer 에서 설정)
+_channel = None
+
+def init_progress(channel) -> None:
+    """
+    자식 프로세스의 진행 이벤트 채널 설정
+    Args:
+        channel ``multiprocessing.Queue``: 서버 프로세스의 ``ProgressHub`` 가 읽는 큐.
+    """
+    global _channel
+    _channel = channel
+
+def report(task_id: str | None, event: str, **data) -> None:
+    """
+    분석 진행 이벤트 전송 (자식 프로세스). task_id 가 없거나 채널이 없으면(프로세스 풀 밖 실행) 무시.
+    Args:
+        task_id (str | None): 작업 ID.
+        event (str): 이벤트 이름 (progress, phase).
+        **data: 이벤트 데이터 (frame, total, phase 등).
+    """
+    if task_id is None or _channel is None:
+        return
+    _channel.put((task_id, {"event": event, **data}))
+
+class ProgressHub:
+    """
+    작업별 진행 이벤트 구독/발행 (서버 프로세스, 워커별).
+    자식 프로세스가 채널에 넣은 이벤트를 읽기 스레드가 이벤트 루프로 넘겨 구독자 큐에 전달한다.
+    늦게 구독해도 현재까지의 진행 상황을 받을 수 있도록 작업별 최근 상태(검출된 단계, 프레임)를 보관하고,
+    result 이벤트에서 지운다.
+    """
+
+    def __init__(self, channel):
+        """
+        Args:
+            channel ``multiprocessing.Queue``: 자식 프로세스 진행 이벤트 큐.
+        """
+        self.channel = channel
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._state: dict[str, dict] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reader: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self.channel.put(None)
+            self._reader.join()
+            self._reader = None
+
+    def _read(self) -> None:
+        while True:
+            item = self.channel.get()
+            if item is None:
+                return
+            self._loop.call_soon_threadsafe(self.publish, *item)
+
+    def publish(self, task_id: str, event: dict) -> None:
+        """
+        이벤트 발행 (이벤트 루프 스레드에서 호출)
+        Args:
+            task_id (str): 작업 ID.
+            event (dict): ``{"event": 이름, ...}``. result 이벤트는 작업의 마지막 이벤트.
+        """
+        name = event["event"]
+        if name == "result":
+            self._state.pop(task_id, None)
+        elif name == "progress":
+            self._state[task_id] = {**event, "phases": dict(event["phases"])}
+        elif name == "phase":
+            state = self._state.setdefault(task_id, {"event": "progress", "phases": {}})
+            # 다시 address 가 검출되면 스윙을 처음부터 검출
+            if event["phase"] == "address":
+                state["phases"].clear()
+            state["phases"][event["phase"]] = event["frame"]
+        for queue in self._subscribers.get(task_id, ()):
+            queue.put_nowait(event)
+
+    def snapshot(self, task_id: str) -> dict | None:
+        """
+        진행 중인 작업의 현재까지 검출된 단계와 처리한 프레임. 진행 이벤트가 없으면 None.
+        """
+        state = self._state.get(task_id)
+        return None if state is None else {**state, "phases": dict(state["phases"])}
+
+    @contextmanager
+    def subscribe(self, task_id: str) -> Iterator[asyncio.Queue]:
+        """
+        작업 이벤트 구독 (with 블록을 벗어나면 해제)
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(task_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(task_id)
+            subscribers.discard(queue)
+            if not subscribers:
+                del self._subscribers[task_id]
@@ -0,0 +1,192 @@
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+class ResultStore(ABC):
+    """
+    작업 결과 저장소 인터페이스 (task_id -> 결과 dict).
+    TTL 이 지났거나 최대 개수를 넘은 오래된 결과는 제거된다.
+    라우터는 dict 처럼 ``store[task_id] = {...}`` / ``store.get(task_id)`` 로 사용한다.
+    """
+
+    def __init__(self, ttl_sec: float = 3600, max_items: int = 10000):
+        """
+        Args:
+            ttl_sec (float): 결과 보존 시간(초). 마지막 갱신 기준.
+            max_items (int): 최대 보존 개수. 초과 시 가장 오래 갱신되지 않은 결과부터 제거.
+        """
+        self.ttl_sec = ttl_sec
+        self.max_items = max_items
+
+    @abstractmethod
+    def get(self, task_id: str, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, task_id: str, value: dict) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, task_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def all(self) -> dict[str, dict]:
+        """
+        만료되지 않은 모든 결과 반환
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __getitem__(self, task_id: str) -> dict:
+        value = self.get(task_id)
+        if value is None:
+            raise KeyError(task_id)
+        return value
+
+    def __setitem__(self, task_id: str, value: dict) -> None:
+        self.set(task_id, value)
+
+    def __delitem__(self, task_id: str) -> None:
+        self.delete(task_id)
+
+    def __contains__(self, task_id: str) -> bool:
+        return self.get(task_id) is not None
+
+class MemoryResultStore(ResultStore):
+    """
+    프로세스 내부 저장소 (단일 워커 / 테스트용)
+    """
+
+    def __init__(self, ttl_sec: float = 3600, max_items: int = 10000):
+        super().__init__(ttl_sec, max_items)
+        self._data: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float) -> None:
+        # 갱신 순서로 정렬되어 있으므로 앞에서부터 제거
+        while self._data:
+            task_id, (updated_at, _) = next(iter(self._data.items()))
+            if len(self._data) <= self.max_items and now - updated_at <= self.ttl_sec:
+                break
+            self._data.popitem(last=False)
+
+    def get(self, task_id: str, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(task_id)
+            if item is None or time.time() - item[0] > self.ttl_sec:
+                return default
+            return item[1]
+
+    def set(self, task_id: str, value: dict) -> None:
+        with self._lock:
+            now = time.time()
+            self._data.pop(task_id, None)
+            self._data[task_id] = (now, value)
+            self._evict(now)
+
+    def delete(self, task_id: str) -> None:
+        with self._lock:
+            self._data.pop(task_id, None)
+
+    def all(self) -> dict[str, dict]:
+        with self._lock:
+            self._evict(time.time())
+            return {task_id: value for task_id, (_, value) in self._data.items()}
+
+class SQLiteResultStore(ResultStore):
+    """
+    SQLite(WAL) 기반 프로세스 간 공유 저장소.
+    같은 파일을 여는 모든 uvicorn 워커가 동일한 작업 상태를 읽는다.
+    """
+
+    def __init__(self, path: str = "task_results.db", ttl_sec: float = 3600, max_items: int = 10000):
+        """
+        Args:
+            path (str): SQLite 파일 경로.
+        """
+        super().__init__(ttl_sec, max_items)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS task_results ("
+            "task_id TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_task_results_updated ON task_results (updated_at)")
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM task_results WHERE updated_at < ?", (now - self.ttl_sec,))
+        self._conn.execute(
+            "DELETE FROM task_results WHERE task_id IN ("
+            "SELECT task_id FROM task_results ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_items,),
+        )
+
+    def get(self, task_id: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM task_results WHERE task_id = ? AND updated_at >= ?",
+                (task_id, time.time() - self.ttl_sec),
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set(self, task_id: str, value: dict) -> None:
+        with self._lock:
+            now = time.time()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO task_results (task_id, value, updated_at) VALUES (?, ?, ?)",
+                    (task_id, json.dumps(value), now),
+                )
+                self._evict(now)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, task_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM task_results WHERE task_id = ?", (task_id,))
+
+    def all(self) -> dict[str, dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task_id, value FROM task_results WHERE updated_at >= ? ORDER BY updated_at",
+                (time.time() - self.ttl_sec,),
+            ).fetchall()
+        return {task_id: json.loads(value) for task_id, value in rows}
+
+    def close(self) -> None:
+        self._conn.close()
+
+def create_result_store(config: dict | None) -> ResultStore:
+    """
+    설정에 따른 결과 저장소 생성
+    Args:
+        config (dict | None): RESULT_STORE 설정 (backend: memory | sqlite, path, ttl_sec, max_items)
+    Returns:
+        ResultStore: 생성된 저장소
+    Raises:
+        ValueError: 알 수 없는 backend 인 경우
+    """
+    config = config or {}
+    backend = config.get("backend", "memory")
+    options = {
+        "ttl_sec": float(config.get("ttl_sec", 3600)),
+        "max_items": int(config.get("max_items", 10000)),
+    }
+    if backend == "memory":
+        return MemoryResultStore(**options)
+    if backend == "sqlite":
+        return SQLiteResultStore(path=config.get("path", "task_results.db"), **options)
+    raise ValueError(f"알 수 없는 결과 저장소 backend 입니다: {backend}")
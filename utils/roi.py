@@ -0,0 +1,172 @@
+from typing import Iterator
+
+import numpy as np
+
+from utils.decode import iter_frames
+
+def landmark_bounds(results, box: tuple[int, int, int, int]) -> tuple[float, float, float, float]:
+    """
+    Mediapipe 결과(box 입력 기준 정규화 좌표)의 전체 랜드마크 bounding box 를 원본 프레임 픽셀 좌표로 변환
+    Args:
+        results: ``Pose.process`` 결과 (pose_landmarks 가 있어야 함)
+        box (tuple[int, int, int, int]): 추론 입력 영역 (x0, y0, x1, y1)
+    Returns:
+        tuple[float, float, float, float]: (left, top, right, bottom)
+    """
+    x0, y0, x1, y1 = box
+    points = np.array([(p.x, p.y) for p in results.pose_landmarks.landmark], dtype=np.float32)
+    left, top = points.min(axis=0) * (x1 - x0, y1 - y0) + (x0, y0)
+    right, bottom = points.max(axis=0) * (x1 - x0, y1 - y0) + (x0, y0)
+    return float(left), float(top), float(right), float(bottom)
+
+class PersonRoi:
+    """
+    사람 영역(ROI)만 디코딩/추론하는 단계.
+    영상 앞부분 몇 프레임을 저해상도로 추론해 랜드마크 bounding box 에 여유를 더한 영역을 정하고,
+    디코더(ffmpeg crop)에서 그 영역만 받아 RGB 변환/파이프 전송/추론 입력을 줄인다.
+    결과 좌표는 ``box`` 로 원본 프레임 픽셀 좌표에 되돌린다.
+    랜드마크가 영역 경계에 닿거나 연속으로 검출되지 않으면 그 프레임부터 전체 프레임으로 되돌린다.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        padding: float = 0.5,
+        probe_frames: int = 5,
+        probe_width: int = 640,
+        lost_frames: int = 3,
+        edge_margin: float = 0.02,
+        full_fraction: float = 0.8,
+    ):
+        """
+        Args:
+            width (int): 프레임 가로 크기.
+            height (int): 프레임 세로 크기.
+            padding (float): 랜드마크 bounding box 긴 변 대비 사방 여유 비율 (스윙 중 팔/손 이동 범위).
+            probe_frames (int): 영역을 정할 때 추론할 앞부분 프레임 수.
+            probe_width (int): 영역 탐색용 디코딩 가로 해상도 상한.
+            lost_frames (int): 연속 미검출 시 전체 프레임으로 되돌리는 기준.
+            edge_margin (float): 랜드마크가 영역 경계에서 이 비율 안쪽으로 들어오면 전체 프레임으로 되돌림.
+            full_fraction (float): 영역 넓이가 프레임 대비 이 비율 이상이면 자르지 않음.
+        """
+        self.width = width
+        self.height = height
+        self.padding = padding
+        self.probe_frames = probe_frames
+        self.probe_width = probe_width
+        self.lost_frames = lost_frames
+        self.edge_margin = edge_margin
+        self.full_fraction = full_fraction
+        self.box: tuple[int, int, int, int] | None = None  # (x0, y0, x1, y1), None 이면 전체 프레임
+        self.current = self.full  # 마지막으로 반환한 프레임의 영역
+        self.fallbacks = 0  # 전체 프레임으로 되돌린 횟수
+        self._misses = 0
+
+    @property
+    def full(self) -> tuple[int, int, int, int]:
+        return 0, 0, self.width, self.height
+
+    def expand(self, bounds: tuple[float, float, float, float]) -> tuple[int, int, int, int] | None:
+        """
+        bounding box 에 여유를 더해 프레임 안으로 자른 영역 (짝수 좌표). 프레임 대부분이면 None.
+        """
+        left, top, right, bottom = bounds
+        pad = self.padding * max(right - left, bottom - top)
+        x0 = max(0, int(left - pad)) // 2 * 2
+        y0 = max(0, int(top - pad)) // 2 * 2
+        x1 = min(self.width, int(np.ceil(right + pad)) + 1) // 2 * 2
+        y1 = min(self.height, int(np.ceil(bottom + pad)) + 1) // 2 * 2
+        if x1 <= x0 or y1 <= y0 or (x1 - x0) * (y1 - y0) >= self.full_fraction * self.width * self.height:
+            return None
+        return x0, y0, x1, y1
+
+    def locate(self, path: str, model, start_frame: int = 0, **decode) -> tuple[int, int, int, int] | None:
+        """
+        앞부분 프레임을 저해상도로 추론해 영역 결정. 모델 트래킹 상태가 바뀌므로 호출 후 ``model.reset()`` 필요.
+        Args:
+            path (str): 비디오 파일 경로.
+            model: Mediapipe Pose 인스턴스.
+            start_frame (int): 탐색 시작 프레임.
+            decode: ``iter_frames`` 인자 (fps, hflip, info).
+        Returns:
+            tuple[int, int, int, int] | None: 영역, 사람을 찾지 못했거나 프레임 대부분이면 None
+        """
+        union = None
+        frames = iter_frames(
+            path, max_width=min(self.width, self.probe_width), start_frame=start_frame,
+            end_frame=start_frame + self.probe_frames, **decode,
+        )
+        try:
+            for rgb in frames:
+                results = model.process(rgb)
+                if not results.pose_landmarks:
+                    continue
+                # 정규화 좌표이므로 원본 크기 기준으로 변환
+                left, top, right, bottom = landmark_bounds(results, self.full)
+                union = (left, top, right, bottom) if union is None else (
+                    min(union[0], left), min(union[1], top), max(union[2], right), max(union[3], bottom),
+                )
+        finally:
+            frames.close()
+        self.box = self.expand(union) if union is not None else None
+        return self.box
+
+    def frames(self, path: str, start_frame: int = 0, end_frame: int | None = None, **decode) -> Iterator[np.ndarray]:
+        """
+        현재 영역으로 디코딩한 프레임을 순차 반환 (원본 좌표 기준 영역은 ``current``).
+        ``update`` 로 전체 프레임 복귀가 결정되면 다음 프레임부터 디코더를 다시 연다.
+        Args:
+            path (str): 비디오 파일 경로.
+            start_frame (int): 시작 프레임.
+            end_frame (int | None): 끝 프레임 (미포함).
+            decode: ``iter_frames`` 인자 (fps, max_width, hflip, info).
+        Yields:
+            np.ndarray: 영역 이미지 (영역이 없으면 전체 프레임)
+        """
+        frame = start_frame
+        while True:
+            box = self.box
+            frames = iter_frames(path, start_frame=frame, end_frame=end_frame, crop=box, **decode)
+            try:
+                for rgb in frames:
+                    self.current = box or self.full
+                    yield rgb
+                    frame += 1
+                    if self.box != box:
+                        break
+                else:
+                    return
+            finally:
+                frames.close()
+
+    def update(self, results, box: tuple[int, int, int, int]) -> bool:
+        """
+        이번 프레임 결과로 영역 유지 여부 판단
+        Args:
+            results: ``Pose.process`` 결과 (box 입력 기준 정규화 좌표)
+            box (tuple[int, int, int, int]): 이번 프레임에 사용한 영역
+        Returns:
+            bool: 다음 프레임부터 전체 프레임으로 되돌리면 True (모델 트래킹 상태 리셋 필요)
+        """
+        if self.box is None:
+            return False
+
+        if not results.pose_landmarks:
+            self._misses += 1
+            lost = self._misses >= self.lost_frames
+        else:
+            self._misses = 0
+            left, top, right, bottom = landmark_bounds(results, box)
+            x0, y0, x1, y1 = box
+            margin = self.edge_margin * max(x1 - x0, y1 - y0)
+            # 프레임 경계와 맞닿은 쪽은 더 넓힐 수 없으므로 제외
+            lost = (
+                (x0 > 0 and left < x0 + margin) or (y0 > 0 and top < y0 + margin)
+                or (x1 < self.width and right > x1 - margin) or (y1 < self.height and bottom > y1 - margin)
+            )
+
+        if lost:
+            self.box = None
+            self.fallbacks += 1
+        return lost
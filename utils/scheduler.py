@@ -0,0 +1,183 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable
+
+# main 의 ``initialize_logger`` 가 핸들러를 설정하는 앱 로거
+logger = logging.getLogger("km-analysis")
+
+# 작업 함수가 최종 상태를 기록하지 못하고 실패했을 때 오류로 바꿀 상태
+PENDING_STATUSES = ("queued", "processing")
+
+class QueueFull(Exception):
+    """
+    대기열이 가득 차 작업을 받을 수 없음 (HTTP 429 로 응답).
+    """
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"대기열이 가득 찼습니다. {retry_after}초 후 다시 시도하세요.")
+        self.retry_after = retry_after
+
+class JobScheduler:
+    """
+    워커별 분석 작업 스케줄러.
+    대기열 크기(max_queue)와 동시 실행 수(concurrency)를 제한하여 버스트 요청에도
+    동시 분석/임시 파일/메모리 사용량이 늘어나지 않게 하고, 대기열이 가득 차면 즉시 거절한다.
+    같은 priority 끼리는 FIFO, priority 가 높은 작업이 먼저 실행된다.
+    """
+
+    def __init__(self, max_queue: int = 32, concurrency: int = 4, initial_duration_sec: float = 10.0, task_results=None):
+        """
+        Args:
+            max_queue (int): 실행 대기 작업 수 상한 (실행 중 작업 제외).
+            concurrency (int): 동시 실행 작업 수.
+            initial_duration_sec (float): 완료 기록이 없을 때 사용할 작업당 예상 시간(초).
+            task_results ``ResultStore | None``: 지정 시 작업 함수가 예외로 끝나면 아직 queued/processing 인
+                작업 상태를 ``{"status": "error"}`` 로 기록.
+        """
+        self.max_queue = max_queue
+        self.concurrency = concurrency
+        self.task_results = task_results
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self._heap: list[tuple[int, int, str, Callable[..., Awaitable[Any]], tuple]] = []
+        self._seq = itertools.count()
+        self._ready = asyncio.Condition()
+        self._workers: list[asyncio.Task] = []
+        self._duration = initial_duration_sec  # 작업당 소요 시간 EMA
+
+    async def start(self) -> None:
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def close(self) -> None:
+        """
+        실행 중/대기 중 작업 취소
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        self._heap.clear()
+
+    @property
+    def queued(self) -> int:
+        return len(self._heap)
+
+    def estimated_wait(self, position: int) -> float:
+        """
+        대기열 position(1부터) 작업이 실행되기까지의 예상 대기 시간(초)
+        """
+        # 빈 슬롯이 있으면 바로 실행, 아니면 앞선 작업들이 concurrency 개씩 끝날 때까지 대기
+        remaining = position - max(0, self.concurrency - self.running)
+        return math.ceil(max(0, remaining) / self.concurrency) * self._duration
+
+    def retry_after(self, slots: int = 1) -> int:
+        """
+        대기열에 slots 개 자리가 날 때까지의 예상 시간(초, 최소 1)
+        """
+        return max(1, math.ceil(slots * self._duration / self.concurrency))
+
+    async def submit(self, task_id: str, fn: Callable[..., Awaitable[Any]], *args: Any, priority: int = 0) -> int:
+        """
+        작업 등록
+        Args:
+            task_id (str): 작업 ID (상태 조회용).
+            fn (Callable): 실행할 코루틴 함수.
+            priority (int): 클수록 먼저 실행.
+        Returns:
+            int: 대기열 위치 (1부터)
+        Raises:
+            QueueFull: 대기열이 가득 찬 경우
+        """
+        if len(self._heap) >= self.max_queue:
+            self.rejected += 1
+            raise QueueFull(self.retry_after())
+        heapq.heappush(self._heap, (-priority, next(self._seq), task_id, fn, args))
+        position = self.position(task_id)
+        async with self._ready:
+            self._ready.notify()
+        return position
+
+    async def submit_many(self, jobs: list[tuple[str, Callable[..., Awaitable[Any]], tuple]], priority: int = 0) -> list[int]:
+        """
+        여러 작업을 한 번에 등록 (전부 들어갈 자리가 없으면 하나도 등록하지 않음)
+        Args:
+            jobs (list[tuple[str, Callable, tuple]]): (task_id, 코루틴 함수, 인자) 목록.
+            priority (int): 클수록 먼저 실행.
+        Returns:
+            list[int]: 작업별 대기열 위치 (1부터)
+        Raises:
+            QueueFull: 대기열 남은 자리가 작업 수보다 적은 경우
+        """
+        if len(self._heap) + len(jobs) > self.max_queue:
+            self.rejected += len(jobs)
+            raise QueueFull(self.retry_after(len(self._heap) + len(jobs) - self.max_queue))
+        for task_id, fn, args in jobs:
+            heapq.heappush(self._heap, (-priority, next(self._seq), task_id, fn, args))
+        positions = [self.position(task_id) for task_id, _, _ in jobs]
+        async with self._ready:
+            self._ready.notify(len(jobs))
+        return positions
+
+    def position(self, task_id: str) -> int | None:
+        """
+        대기 중인 작업의 대기열 위치 (1부터). 대기 중이 아니면 None.
+        """
+        key = next((entry[:2] for entry in self._heap if entry[2] == task_id), None)
+        if key is None:
+            return None
+        return 1 + sum(1 for entry in self._heap if entry[:2] < key)
+
+    def status(self, task_id: str) -> dict | None:
+        """
+        대기 중인 작업의 위치와 예상 대기 시간. 대기 중이 아니면 None.
+        """
+        position = self.position(task_id)
+        if position is None:
+            return None
+        return {"position": position, "estimated_wait_sec": round(self.estimated_wait(position), 1)}
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "max_queue": self.max_queue,
+            "concurrency": self.concurrency,
+            "avg_duration_sec": round(self._duration, 2),
+        }
+
+    def _record_error(self, task_id: str, error: Exception) -> None:
+        if self.task_results is None:
+            return
+        try:
+            current = self.task_results.get(task_id)
+            if current is None or current.get("status") in PENDING_STATUSES:
+                self.task_results[task_id] = {"status": "error", "error": str(error)}
+        except Exception:
+            logger.exception(f"작업 오류 상태 기록 실패 : {task_id}")
+
+    async def _worker(self) -> None:
+        while True:
+            async with self._ready:
+                await self._ready.wait_for(lambda: self._heap)
+                _, _, task_id, fn, args = heapq.heappop(self._heap)
+            self.running += 1
+            start = time.perf_counter()
+            try:
+                await fn(*args)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 작업 함수는 보통 자체적으로 오류 상태를 기록하지만, 그 전에 실패하면 상태가 대기/처리 중으로 남는다
+                logger.exception(f"작업 실패 : {task_id}")
+                self._record_error(task_id, e)
+            finally:
+                self.running -= 1
+                self.completed += 1
+                self._duration = 0.8 * self._duration + 0.2 * (time.perf_counter() - start)
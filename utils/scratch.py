@@ -0,0 +1,250 @@
+import asyncio
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+# 워커별 폴더 이름 접두사 (워커 pid 를 붙여 종료된 워커가 남긴 폴더를 찾는다)
+WORKER_PREFIX = "worker-"
+# memory_dir 안에서 사용하는 하위 폴더 (다른 프로그램의 tmpfs 파일과 섞이지 않도록)
+MEMORY_SUBDIR = "pose-scratch"
+# 모든 워커가 공유하는 용량 예약 장부 (root 아래 SQLite 파일)
+LEDGER_NAME = "quota.db"
+# 공간 대기 중 다른 워커의 반납을 다시 확인하는 간격(초)
+POLL_SEC = 0.2
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _worker_dir(root: str) -> str:
+    """
+    현재 워커의 폴더(worker-<pid>-<임의 문자열>)를 만들고, 비정상 종료된 워커가 남긴 폴더는 삭제
+    """
+    os.makedirs(root, exist_ok=True)
+    for entry in os.scandir(root):
+        pid = entry.name[len(WORKER_PREFIX):].split("-")[0]
+        if entry.name.startswith(WORKER_PREFIX) and pid.isdigit() and not _alive(int(pid)):
+            shutil.rmtree(entry.path, ignore_errors=True)
+    return tempfile.mkdtemp(prefix=f"{WORKER_PREFIX}{os.getpid()}-", dir=root)
+
+class _Ledger:
+    """
+    워커 간 공유 용량 예약 장부 (SQLite WAL). 예약마다 워커 pid 와 크기를 기록하고,
+    종료된 워커가 남긴 예약은 다음 예약 시 정리한다.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS reservations ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, pid INTEGER NOT NULL, memory INTEGER NOT NULL, bytes INTEGER NOT NULL)"
+        )
+        # 같은 pid 를 쓰던 이전 프로세스가 남긴 예약 삭제
+        self._conn.execute("DELETE FROM reservations WHERE pid = ?", (os.getpid(),))
+
+    def reserve(self, size: int, memory: bool, quota: int | None, oversize: bool = False) -> int | None:
+        """
+        모든 워커의 예약 합계가 quota 안에 들어오면 예약
+        Args:
+            size (int): 예약 크기(bytes).
+            memory (bool): memory_dir(tmpfs) 예약 여부 (디스크와 따로 합산).
+            quota (int | None): 상한(bytes). None 이면 제한 없음.
+            oversize (bool): 예약이 하나도 없으면 상한보다 커도 허용 (무한 대기 방지).
+        Returns:
+            int | None: 예약 ID, 공간이 없으면 None
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                pids = [pid for (pid,) in self._conn.execute("SELECT DISTINCT pid FROM reservations")]
+                self._conn.executemany("DELETE FROM reservations WHERE pid = ?", [(pid,) for pid in pids if not _alive(pid)])
+                used = self._used(memory)
+                if quota is not None and used + size > quota and not (oversize and used == 0):
+                    self._conn.execute("COMMIT")
+                    return None
+                reservation = self._conn.execute(
+                    "INSERT INTO reservations (pid, memory, bytes) VALUES (?, ?, ?)", (os.getpid(), int(memory), size),
+                ).lastrowid
+                self._conn.execute("COMMIT")
+                return reservation
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def release(self, reservation: int) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM reservations WHERE id = ?", (reservation,))
+
+    def _used(self, memory: bool) -> int:
+        return self._conn.execute(
+            "SELECT COALESCE(SUM(bytes), 0) FROM reservations WHERE memory = ?", (int(memory),),
+        ).fetchone()[0]
+
+    def used(self, memory: bool = False) -> int:
+        """
+        모든 워커의 예약 합계(bytes)
+        """
+        with self._lock:
+            return self._used(memory)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM reservations WHERE pid = ?", (os.getpid(),))
+            self._conn.close()
+
+class ScratchSpace:
+    """
+    다운로드한 영상의 임시 저장 공간 (uvicorn 워커마다 하나, 용량 상한은 같은 root 를 쓰는 모든 워커가 공유).
+    작업마다 고유 폴더를 만들어 같은 영상을 동시에 요청해도 파일이 겹치지 않고, 작업이 끝나거나 실패하면 폴더째 삭제한다.
+    모든 워커의 사용 크기 합계가 ``quota_bytes`` 를 넘으면 새 다운로드는 앞선 작업이 공간을 반납할 때까지 대기한다
+    (합계는 root 아래 SQLite 장부로 관리).
+    ``memory_dir`` (tmpfs, ex. /dev/shm) 를 지정하면 ``memory_max_bytes`` 이하의 작은 영상은 메모리에 저장한다.
+    """
+
+    def __init__(
+        self,
+        root: str = "scratch",
+        quota_bytes: int | None = None,
+        memory_dir: str | None = None,
+        memory_max_bytes: int = 32 * 1024 * 1024,
+        memory_quota_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Args:
+            root (str): 임시 폴더 (워커 간 공유, 워커별 하위 폴더와 공유 용량 장부 사용).
+            quota_bytes (int | None): 모든 워커의 디스크 임시 파일 총량 상한(bytes). None 이면 제한 없음.
+            memory_dir (str | None): 작은 영상을 저장할 tmpfs 폴더. None 이면 사용 안 함.
+            memory_max_bytes (int): memory_dir 에 저장할 영상 크기 상한(bytes).
+            memory_quota_bytes (int): 모든 워커의 memory_dir 사용량 상한(bytes), 넘으면 디스크에 저장 (대기하지 않음).
+        """
+        self.quota_bytes = quota_bytes
+        self.memory_max_bytes = memory_max_bytes
+        self.memory_quota_bytes = memory_quota_bytes
+        # 현재 워커의 사용량 (상한 판단은 공유 장부 기준)
+        self.used_bytes = 0
+        self.memory_used_bytes = 0
+        self.active = 0
+        self.waiting = 0
+        self.waited = 0
+        self._dir = _worker_dir(root)
+        self._memory_dir = _worker_dir(os.path.join(memory_dir, MEMORY_SUBDIR)) if memory_dir and os.path.isdir(memory_dir) else None
+        self._ledger = _Ledger(os.path.join(root, LEDGER_NAME))
+        self._changed = asyncio.Condition()
+
+    async def _reserve(self, size: int) -> tuple[int, bool]:
+        """
+        size 만큼 공간 확보. 메모리에 들어가면 바로, 아니면 모든 워커의 디스크 사용량이 상한 안에 들어올 때까지 대기
+        (이 워커의 반납은 바로, 다른 워커의 반납은 ``POLL_SEC`` 간격으로 확인).
+        Returns:
+            tuple[int, bool]: 예약 ID, 메모리(tmpfs) 사용 여부
+        """
+        if self._memory_dir is not None and size <= self.memory_max_bytes:
+            reservation = await asyncio.to_thread(self._ledger.reserve, size, True, self.memory_quota_bytes)
+            if reservation is not None:
+                self.memory_used_bytes += size
+                return reservation, True
+
+        # 상한보다 큰 파일 하나는 다른 파일이 모두 반납된 뒤 허용 (무한 대기 방지)
+        waited = False
+        try:
+            while (reservation := await asyncio.to_thread(self._ledger.reserve, size, False, self.quota_bytes, True)) is None:
+                if not waited:
+                    waited = True
+                    self.waiting += 1
+                    self.waited += 1
+                async with self._changed:
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), POLL_SEC)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            if waited:
+                self.waiting -= 1
+        self.used_bytes += size
+        return reservation, False
+
+    async def _release(self, reservation: int, size: int, memory: bool) -> None:
+        await asyncio.to_thread(self._ledger.release, reservation)
+        if memory:
+            self.memory_used_bytes -= size
+        else:
+            self.used_bytes -= size
+        async with self._changed:
+            self._changed.notify_all()
+
+    @asynccontextmanager
+    async def allocate(self, name: str, size: int) -> AsyncIterator[str]:
+        """
+        작업 하나의 임시 파일 경로. 블록을 벗어나면 (정상 종료/예외/취소) 폴더째 삭제하고 공간을 반납한다.
+        Args:
+            name (str): 파일 이름 (확장자 유지용, ex. 객체 키).
+            size (int): 예상 크기(bytes), 상한 계산에 사용.
+        Returns:
+            str: 고유 폴더 안의 파일 경로 (파일은 만들지 않음)
+        """
+        reservation, memory = await self._reserve(size)
+        self.active += 1
+        try:
+            directory = await asyncio.to_thread(tempfile.mkdtemp, dir=self._memory_dir if memory else self._dir)
+            try:
+                yield os.path.join(directory, os.path.basename(name) or "video")
+            finally:
+                await asyncio.to_thread(shutil.rmtree, directory, True)
+        finally:
+            self.active -= 1
+            await self._release(reservation, size, memory)
+
+    def stats(self) -> dict:
+        """
+        임시 공간 사용량 (모든 워커 합계와 현재 워커) 과 현재 워커의 공간 대기 상태
+        """
+        return {
+            "active": self.active,
+            "used_bytes": self._ledger.used(),
+            "worker_used_bytes": self.used_bytes,
+            "quota_bytes": self.quota_bytes,
+            "memory_used_bytes": self._ledger.used(memory=True),
+            "worker_memory_used_bytes": self.memory_used_bytes,
+            "memory": self._memory_dir is not None,
+            "waiting": self.waiting,
+            "waited_total": self.waited,
+        }
+
+    def close(self) -> None:
+        """
+        워커 폴더 삭제와 남은 예약 반납 (앱 종료 시)
+        """
+        for directory in (self._dir, self._memory_dir):
+            if directory is not None:
+                shutil.rmtree(directory, ignore_errors=True)
+        self._ledger.close()
+
+def create_scratch(config: dict | None) -> ScratchSpace:
+    """
+    설정에 따른 임시 저장 공간 생성
+    Args:
+        config (dict | None): SCRATCH 설정 (dir, quota_bytes, memory_dir, memory_max_bytes, memory_quota_bytes)
+    Returns:
+        ScratchSpace: 현재 워커의 임시 저장 공간
+    """
+    config = config or {}
+    quota_bytes = config.get("quota_bytes")
+    return ScratchSpace(
+        root=config.get("dir", "scratch"),
+        quota_bytes=int(quota_bytes) if quota_bytes is not None else None,
+        memory_dir=config.get("memory_dir"),
+        memory_max_bytes=int(config.get("memory_max_bytes", 32 * 1024 * 1024)),
+        memory_quota_bytes=int(config.get("memory_quota_bytes", 256 * 1024 * 1024)),
+    )
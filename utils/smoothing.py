@@ -0,0 +1,95 @@
+import numpy as np
+
+from utils.landmark import X, Y
+
+# 온라인(프레임 단위) 보정 방식: vectorized(관절/축 전체를 한 번에), scalar(기존 관절별 adaptive_ema 루프)
+ONLINE_METHODS = ("vectorized", "scalar")
+# 오프라인(전체 배열) 보정 방식: 순방향 + 역방향으로 적용해 지연(위상 지연)이 없음
+OFFLINE_METHODS = ("one_euro", "ema")
+
+def adaptive_ema_vector(prev: np.ndarray, current: np.ndarray, alpha_base: float = 0.2, speed_threshold: float = 10) -> np.ndarray:
+    """
+    ``adaptive_ema`` 의 배열 버전. 모든 관절/축을 한 번에 보정한다.
+    float64 로 계산하므로 스칼라(파이썬 float) 버전과 같은 값을 반환한다.
+    Args:
+        prev ``np.ndarray``: 이전 프레임 (보정된) 값 (joints, 2).
+        current ``np.ndarray``: 현재 프레임 값 (joints, 2).
+        alpha_base (float): 기본 alpha 값.
+        speed_threshold (float): 속도 임계값.
+    Returns:
+        np.ndarray: 보정된 값 (float64)
+    """
+    prev = prev.astype(np.float64)
+    current = current.astype(np.float64)
+    # 속도(이전 프레임과의 차이)가 빠르면 alpha 값을 증가
+    alpha = alpha_base + np.minimum(0.3, np.abs(current - prev) / speed_threshold)
+    return alpha * current + (1 - alpha) * prev
+
+def _smoothing_factor(cutoff: np.ndarray | float, fps: float) -> np.ndarray | float:
+    tau = 1.0 / (2 * np.pi * cutoff)
+    return 1.0 / (1.0 + tau * fps)
+
+def one_euro(values: np.ndarray, fps: float, min_cutoff: float = 1.5, beta: float = 0.01, d_cutoff: float = 1.0) -> np.ndarray:
+    """
+    One Euro 필터 (시간축 axis 0, 나머지 축은 한 번에 처리).
+    속도가 느리면 강하게(떨림 제거), 빠르면 약하게(지연 감소) 평활한다.
+    Args:
+        values ``np.ndarray``: (frames, ...) 값.
+        fps (float): 프레임 속도.
+        min_cutoff (float): 정지 시 차단 주파수(Hz).
+        beta (float): 속도(단위/초)에 따른 차단 주파수 증가량.
+        d_cutoff (float): 속도 추정용 차단 주파수(Hz).
+    Returns:
+        np.ndarray: 평활된 값 (float64)
+    """
+    values = values.astype(np.float64)
+    result = np.empty_like(values)
+    if len(values) == 0:
+        return result
+    result[0] = values[0]
+    derivative = np.zeros_like(values[0])
+    alpha_d = _smoothing_factor(d_cutoff, fps)
+    for t in range(1, len(values)):
+        derivative = alpha_d * (values[t] - result[t - 1]) * fps + (1 - alpha_d) * derivative
+        alpha = _smoothing_factor(min_cutoff + beta * np.abs(derivative), fps)
+        result[t] = alpha * values[t] + (1 - alpha) * result[t - 1]
+    return result
+
+def ema(values: np.ndarray, alpha: float = 0.5) -> np.ndarray:
+    """
+    고정 alpha 지수 이동 평균 (시간축 axis 0)
+    """
+    values = values.astype(np.float64)
+    result = np.empty_like(values)
+    if len(values) == 0:
+        return result
+    result[0] = values[0]
+    for t in range(1, len(values)):
+        result[t] = alpha * values[t] + (1 - alpha) * result[t - 1]
+    return result
+
+def smooth_offline(landmarks: np.ndarray, fps: float, method: str = "one_euro", **params) -> np.ndarray:
+    """
+    분석이 끝난 랜드마크 배열 전체를 순방향 후 역방향으로 평활 (지연 없는 후처리).
+    온라인 보정과 같이 픽셀 좌표(x, y)만 보정한다.
+    Args:
+        landmarks ``np.ndarray``: (frames, joints, 4) [x, y, z_norm, x_norm].
+        fps (float): 프레임 속도.
+        method (str): one_euro (min_cutoff, beta, d_cutoff) 또는 ema (alpha).
+    Returns:
+        np.ndarray: 평활된 (frames, joints, 4) float32 배열 (입력은 변경하지 않음)
+    Raises:
+        ValueError: 알 수 없는 method 인 경우
+    """
+    if method == "one_euro":
+        smooth = lambda values: one_euro(values, fps, **params)
+    elif method == "ema":
+        smooth = lambda values: ema(values, **params)
+    else:
+        raise ValueError(f"알 수 없는 오프라인 보정 방식입니다: {method}")
+
+    result = landmarks.copy()
+    xy = landmarks[:, :, [X, Y]]
+    forward = smooth(xy)
+    result[:, :, [X, Y]] = smooth(forward[::-1])[::-1]
+    return result
@@ -0,0 +1,237 @@
+import asyncio
+import hashlib
+import os
+from abc import ABC, abstractmethod
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator
+
+from utils.scratch import ScratchSpace
+
+class Storage(ABC):
+    """
+    비디오 원본 저장소 인터페이스.
+    앱 시작 시 ``start()`` 로 장기 클라이언트를 열고, 다운로드는 청크 단위로 스트리밍하며
+    동시 다운로드 수는 ``max_concurrency`` 로 제한한다.
+    """
+
+    def __init__(self, max_concurrency: int = 4, chunk_size: int = 1024 * 1024):
+        """
+        Args:
+            max_concurrency (int): 동시 다운로드 수 상한.
+            chunk_size (int): 스트리밍 청크 크기(bytes).
+        """
+        self.max_concurrency = max_concurrency
+        self.chunk_size = chunk_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    async def _download(self, key: str, filename: str) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fingerprint(self, key: str) -> str:
+        """
+        다운로드 없이 객체 내용 식별자 조회 (키포인트 캐시 키로 사용)
+        Args:
+            key (str): 객체 키
+        Returns:
+            str: 내용이 같으면 같은 값
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def size(self, key: str) -> int:
+        """
+        다운로드 없이 객체 크기(bytes) 조회 (임시 공간 확보용)
+        """
+        raise NotImplementedError
+
+    async def download(self, key: str, filename: str) -> int:
+        """
+        key 에 해당하는 객체를 filename 으로 다운로드.
+        임시 파일에 기록한 뒤 교체하므로 중간에 실패해도 불완전한 파일이 남지 않는다.
+        Args:
+            key (str): 객체 키 (ex. username/videoname.mp4)
+            filename (str): 저장할 로컬 파일 경로
+        Returns:
+            int: 다운로드한 바이트 수
+        """
+        partial = f"{filename}.part"
+        async with self._semaphore:
+            try:
+                size = await self._download(key, partial)
+                os.replace(partial, filename)
+                return size
+            finally:
+                if os.path.exists(partial):
+                    os.remove(partial)
+
+class S3Storage(Storage):
+    """
+    aioboto3 기반 S3 저장소. 세션/클라이언트(커넥션 풀)는 앱 수명 동안 재사용한다.
+    """
+
+    def __init__(self, s3_config: dict, max_concurrency: int = 4, chunk_size: int = 1024 * 1024):
+        """
+        Args:
+            s3_config (dict): config.yaml 의 S3 설정
+        """
+        super().__init__(max_concurrency, chunk_size)
+        self.bucket = s3_config.get("s3_bucket_name")
+        self._s3_config = s3_config
+        self._stack = AsyncExitStack()
+        self._client = None
+
+    async def start(self) -> None:
+        # import 비용(약 0.15초)이 커서 S3 backend 를 쓸 때만 import (local backend 는 불필요)
+        import aioboto3
+        from aiobotocore.config import AioConfig
+
+        session = aioboto3.Session()
+        self._client = await self._stack.enter_async_context(session.client(
+            "s3",
+            aws_access_key_id=self._s3_config.get("s3_accesskey"),
+            aws_secret_access_key=self._s3_config.get("s3_privatekey"),
+            region_name=self._s3_config.get("s3_region_name"),
+            config=AioConfig(max_pool_connections=self.max_concurrency),
+        ))
+
+    async def close(self) -> None:
+        await self._stack.aclose()
+        self._client = None
+
+    async def fingerprint(self, key: str) -> str:
+        # 단일 업로드는 ETag 가 내용의 MD5, 멀티파트는 파트 MD5 들의 MD5
+        response = await self._client.head_object(Bucket=self.bucket, Key=key)
+        etag = response["ETag"].strip('"')
+        return f"s3:{etag}:{response['ContentLength']}"
+
+    async def size(self, key: str) -> int:
+        response = await self._client.head_object(Bucket=self.bucket, Key=key)
+        return response["ContentLength"]
+
+    async def _download(self, key: str, filename: str) -> int:
+        response = await self._client.get_object(Bucket=self.bucket, Key=key)
+        size = 0
+        with open(filename, "wb") as file:
+            async with response["Body"] as body:
+                async for chunk in body.iter_chunks(self.chunk_size):
+                    # 디스크 쓰기가 이벤트 루프를 막지 않도록 스레드에서 기록
+                    await asyncio.to_thread(file.write, chunk)
+                    size += len(chunk)
+        return size
+
+class LocalStorage(Storage):
+    """
+    로컬 파일시스템 저장소 (오프라인 개발/벤치마크용 S3 대체).
+    latency_sec, bandwidth_mbps 로 원격 저장소의 지연/대역폭을 흉내낼 수 있다.
+    """
+
+    def __init__(
+        self,
+        root: str = ".",
+        max_concurrency: int = 4,
+        chunk_size: int = 1024 * 1024,
+        latency_sec: float = 0.0,
+        bandwidth_mbps: float | None = None,
+    ):
+        """
+        Args:
+            root (str): key 의 기준 폴더.
+            latency_sec (float): 요청당 첫 바이트 지연(초).
+            bandwidth_mbps (float | None): 다운로드 대역폭(MB/s). None 이면 제한 없음.
+        """
+        super().__init__(max_concurrency, chunk_size)
+        self.root = root
+        self.latency_sec = latency_sec
+        self.bandwidth_mbps = bandwidth_mbps
+
+    def _sha256(self, key: str) -> str:
+        digest = hashlib.sha256()
+        with open(os.path.join(self.root, key), "rb") as file:
+            while chunk := file.read(self.chunk_size):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    async def fingerprint(self, key: str) -> str:
+        await asyncio.sleep(self.latency_sec)
+        return f"sha256:{await asyncio.to_thread(self._sha256, key)}"
+
+    async def size(self, key: str) -> int:
+        await asyncio.sleep(self.latency_sec)
+        return os.path.getsize(os.path.join(self.root, key))
+
+    async def _download(self, key: str, filename: str) -> int:
+        await asyncio.sleep(self.latency_sec)
+        size = 0
+        with open(os.path.join(self.root, key), "rb") as src, open(filename, "wb") as dst:
+            while True:
+                chunk = await asyncio.to_thread(src.read, self.chunk_size)
+                if not chunk:
+                    break
+                await asyncio.to_thread(dst.write, chunk)
+                size += len(chunk)
+                if self.bandwidth_mbps:
+                    await asyncio.sleep(len(chunk) / (self.bandwidth_mbps * 1024 * 1024))
+        return size
+
+class Prefetcher:
+    """
+    다운로드 단계와 추론 단계를 겹쳐 실행하는 프리페치 단계.
+    앞선 작업이 추론 중일 때 대기 작업의 다운로드를 미리 진행하되,
+    (추론 슬롯 + depth) 개를 넘는 작업은 다운로드를 시작하지 않는다.
+    다운로드 파일은 ``ScratchSpace`` 의 작업별 폴더에 저장되어 블록이 끝나면 삭제되고,
+    임시 공간 상한을 넘는 다운로드는 공간이 날 때까지 대기한다.
+    """
+
+    def __init__(self, storage: Storage, inference_slots: int, depth: int = 2, scratch: ScratchSpace | None = None):
+        """
+        Args:
+            storage ``Storage``: 다운로드에 사용할 저장소.
+            inference_slots (int): 동시 추론 수 (엔진 슬롯 수).
+            depth (int): 추론 대기 중 미리 받아 둘 작업 수.
+            scratch ``ScratchSpace | None``: 다운로드 임시 공간 (기본: 상한 없는 scratch 폴더).
+        """
+        self.storage = storage
+        self.scratch = scratch or ScratchSpace()
+        self._slots = asyncio.Semaphore(inference_slots + depth)
+
+    @asynccontextmanager
+    async def fetch(self, key: str) -> AsyncIterator[str]:
+        """
+        작업별 임시 폴더에 다운로드 후 파일 경로를 반환.
+        블록(추론)이 끝나거나 실패하면 파일을 삭제하고 슬롯과 임시 공간을 반납한다.
+        """
+        async with self._slots:
+            size = await self.storage.size(key)
+            async with self.scratch.allocate(key, size) as filename:
+                await self.storage.download(key, filename)
+                yield filename
+
+def create_storage(config: dict) -> Storage:
+    """
+    설정에 따른 저장소 생성
+    Args:
+        config (dict): 전체 설정 (STORAGE, S3 섹션 사용)
+    Returns:
+        Storage: 생성된 저장소
+    Raises:
+        ValueError: 알 수 없는 backend 인 경우
+    """
+    storage_config = config.get("STORAGE") or {}
+    backend = storage_config.get("backend", "s3")
+    options = {
+        "max_concurrency": int(storage_config.get("max_concurrency", 4)),
+        "chunk_size": int(storage_config.get("chunk_size", 1024 * 1024)),
+    }
+    if backend == "s3":
+        return S3Storage(config.get("S3") or {}, **options)
+    if backend == "local":
+        return LocalStorage(root=storage_config.get("local_root", "."), **options)
+    raise ValueError(f"알 수 없는 저장소 backend 입니다: {backend}")
@@ -0,0 +1,24 @@
+import hashlib
+import urllib.parse
+
+# 파일 이름 길이 상한 (넘으면 task_id 해시 사용, 대부분 파일 시스템의 255 bytes 제한 안쪽)
+MAX_NAME = 200
+# 인코딩한 task_id 에는 나오지 않는 문자 (해시 이름 / 접미사 구분자로 사용)
+MARK = "@"
+
+def task_filename(task_id: str) -> str:
+    """
+    task_id 를 서로 겹치지 않는 파일/폴더 이름으로 변환.
+    "/" 를 포함한 영문/숫자/"_.-~" 외의 문자는 모두 퍼센트 인코딩하므로 ``a/b`` 와 ``a_b`` 처럼 다른 task_id 가
+    같은 이름이 되지 않는다. 너무 길거나 "." / ".." 이면 ``@`` + sha256.
+    """
+    name = urllib.parse.quote(task_id, safe="")
+    if len(name) > MAX_NAME or name in ("", ".", ".."):
+        return MARK + hashlib.sha256(task_id.encode()).hexdigest()
+    return name
+
+def task_id_of(name: str) -> str | None:
+    """
+    ``task_filename`` 의 역변환 (해시 이름이면 None)
+    """
+    return None if name.startswith(MARK) else urllib.parse.unquote(name)